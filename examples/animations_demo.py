@@ -5,12 +5,16 @@ This example demonstrates all the animation types available in PySide6 Shadcn Wi
 """
 
 import sys
+from functools import partial
+from typing import Dict, List
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QGroupBox
+    QGridLayout, QLabel, QGroupBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QCoreApplication
+from PySide6.QtGui import QFont
 
+from pyside6_shadcn_widgets import _global_qss
 from pyside6_shadcn_widgets.components import Button, Card
 from pyside6_shadcn_widgets.animations import (
     FadeIn, FadeOut, SlideInUp, SlideInDown, SlideInLeft, SlideInRight,
@@ -19,19 +23,57 @@ from pyside6_shadcn_widgets.animations import (
 from pyside6_shadcn_widgets.themes import LightTheme
 
 
+# Demo-specific label rules, registered with the component stylesheets
+DEMO_STYLESHEET = """
+    QLabel#demoTitle {
+        font-size: 32px;
+        font-weight: 700;
+        color: hsl(222.2, 84%, 4.9%);
+    }
+    QLabel#demoSubtitle {
+        font-size: 16px;
+        color: hsl(215.4, 16.3%, 46.9%);
+    }
+"""
+
+# Shared font for section headings; weight-only rules skip the CSS parser
+SECTION_HEAD_FONT = QFont()
+SECTION_HEAD_FONT.setWeight(QFont.Weight.DemiBold)
+
+
 class AnimationsDemo(QMainWindow):
     """Main demo window showcasing all animations."""
     
+    # (section, key, button label, animation class, extra kwargs)
+    _ANIM_SPECS = (
+        ("fade", "fade_in", "Fade In", FadeIn, {}),
+        ("fade", "fade_out", "Fade Out", FadeOut, {}),
+        ("slide_in", "slide_in_up", "From Bottom", SlideInUp, {"distance": 100}),
+        ("slide_in", "slide_in_down", "From Top", SlideInDown, {"distance": 100}),
+        ("slide_in", "slide_in_left", "From Right", SlideInLeft, {"distance": 100}),
+        ("slide_in", "slide_in_right", "From Left", SlideInRight, {"distance": 100}),
+        ("slide_out", "slide_out_up", "To Top", SlideOutUp, {"distance": 100}),
+        ("slide_out", "slide_out_down", "To Bottom", SlideOutDown, {"distance": 100}),
+        ("slide_out", "slide_out_left", "To Left", SlideOutLeft, {"distance": 100}),
+        ("slide_out", "slide_out_right", "To Right", SlideOutRight, {"distance": 100}),
+        ("scale", "scale_in", "Scale In", ScaleIn, {}),
+        ("scale", "scale_out", "Scale Out", ScaleOut, {}),
+    )
+    
     def __init__(self):
         super().__init__()
         
         self.setWindowTitle("PySide6 Shadcn Widgets - Animations Demo")
         self.setMinimumSize(900, 700)
         
-        # Apply theme
+        # Apply theme, installing the demo rules with the component rules
+        _global_qss.register("AnimationsDemo", DEMO_STYLESHEET)
         self.theme = LightTheme()
         self.theme.apply()
         
+        # Animations are built once and reused across clicks
+        self._anims: Dict[str, object] = {}
+        
         # Setup UI
         self._setup_ui()
     
@@ -46,28 +88,22 @@ class AnimationsDemo(QMainWindow):
         
         # Title
         title = QLabel("Animations Demo")
-        title.setStyleSheet("font-size: 32px; font-weight: 700; color: hsl(222.2, 84%, 4.9%);")
+        title.setObjectName("demoTitle")
         main_layout.addWidget(title)
         
         subtitle = QLabel("Click buttons to see different animation effects")
-        subtitle.setStyleSheet("font-size: 16px; color: hsl(215.4, 16.3%, 46.9%);")
+        subtitle.setObjectName("demoSubtitle")
         main_layout.addWidget(subtitle)
         
-        main_layout.addSpacing(16)
-        
         # Animation target
         self.animation_target = Card()
-        self.animation_target.set_header("Animation Target")
-        self.animation_target.set_content("Watch this card animate when you click the buttons below!")
+        self.animation_target.set_all(
+            header="Animation Target",
+            content="Watch this card animate when you click the buttons below!",
+        )
         self.animation_target.setFixedSize(400, 200)
         
-        target_container = QHBoxLayout()
-        target_container.addStretch()
-        target_container.addWidget(self.animation_target)
-        target_container.addStretch()
-        main_layout.addLayout(target_container)
-        
-        main_layout.addSpacing(24)
+        main_layout.addWidget(self.animation_target, alignment=Qt.AlignmentFlag.AlignHCenter)
         
         # Fade animations
         main_layout.addWidget(self._create_fade_section())
@@ -86,14 +122,8 @@ class AnimationsDemo(QMainWindow):
         layout = QHBoxLayout(group)
         layout.setSpacing(12)
         
-        fade_in_btn = Button("Fade In")
-        fade_in_btn.clicked.connect(self._play_fade_in)
-        layout.addWidget(fade_in_btn)
-        
-        fade_out_btn = Button("Fade Out")
-        fade_out_btn.clicked.connect(self._play_fade_out)
-        layout.addWidget(fade_out_btn)
-        
+        for button in self._create_animation_buttons("fade"):
+            layout.addWidget(button)
         layout.addStretch()
         
         return group
@@ -101,58 +131,22 @@ class AnimationsDemo(QMainWindow):
     def _create_slide_section(self) -> QGroupBox:
         """Create slide animation controls."""
         group = QGroupBox("Slide Animations")
-        layout = QVBoxLayout(group)
+        layout = QGridLayout(group)
         layout.setSpacing(12)
         
-        # Slide In
-        slide_in_layout = QHBoxLayout()
-        slide_in_label = QLabel("Slide In:")
-        slide_in_label.setStyleSheet("font-weight: 600;")
-        slide_in_layout.addWidget(slide_in_label)
-        
-        slide_in_up = Button("From Bottom", size=Button.SIZE_SM)
-        slide_in_up.clicked.connect(self._play_slide_in_up)
-        slide_in_layout.addWidget(slide_in_up)
+        # One row per direction: label in column 0, buttons after it
+        rows = (("Slide In:", "slide_in"), ("Slide Out:", "slide_out"))
+        for row, (title, section) in enumerate(rows):
+            label = QLabel(title)
+            label.setFont(SECTION_HEAD_FONT)
+            layout.addWidget(label, row, 0)
+            
+            buttons = self._create_animation_buttons(section, size=Button.SIZE_SM)
+            for column, button in enumerate(buttons, start=1):
+                layout.addWidget(button, row, column)
         
-        slide_in_down = Button("From Top", size=Button.SIZE_SM)
-        slide_in_down.clicked.connect(self._play_slide_in_down)
-        slide_in_layout.addWidget(slide_in_down)
-        
-        slide_in_left = Button("From Right", size=Button.SIZE_SM)
-        slide_in_left.clicked.connect(self._play_slide_in_left)
-        slide_in_layout.addWidget(slide_in_left)
-        
-        slide_in_right = Button("From Left", size=Button.SIZE_SM)
-        slide_in_right.clicked.connect(self._play_slide_in_right)
-        slide_in_layout.addWidget(slide_in_right)
-        
-        slide_in_layout.addStretch()
-        layout.addLayout(slide_in_layout)
-        
-        # Slide Out
-        slide_out_layout = QHBoxLayout()
-        slide_out_label = QLabel("Slide Out:")
-        slide_out_label.setStyleSheet("font-weight: 600;")
-        slide_out_layout.addWidget(slide_out_label)
-        
-        slide_out_up = Button("To Top", size=Button.SIZE_SM)
-        slide_out_up.clicked.connect(self._play_slide_out_up)
-        slide_out_layout.addWidget(slide_out_up)
-        
-        slide_out_down = Button("To Bottom", size=Button.SIZE_SM)
-        slide_out_down.clicked.connect(self._play_slide_out_down)
-        slide_out_layout.addWidget(slide_out_down)
-        
-        slide_out_left = Button("To Left", size=Button.SIZE_SM)
-        slide_out_left.clicked.connect(self._play_slide_out_left)
-        slide_out_layout.addWidget(slide_out_left)
-        
-        slide_out_right = Button("To Right", size=Button.SIZE_SM)
-        slide_out_right.clicked.connect(self._play_slide_out_right)
-        slide_out_layout.addWidget(slide_out_right)
-        
-        slide_out_layout.addStretch()
-        layout.addLayout(slide_out_layout)
+        # Trailing column absorbs spare width, like addStretch() in a row
+        layout.setColumnStretch(layout.columnCount(), 1)
         
         return group
     
@@ -162,82 +156,87 @@ class AnimationsDemo(QMainWindow):
         layout = QHBoxLayout(group)
         layout.setSpacing(12)
         
-        scale_in_btn = Button("Scale In")
-        scale_in_btn.clicked.connect(self._play_scale_in)
-        layout.addWidget(scale_in_btn)
-        
-        scale_out_btn = Button("Scale Out")
-        scale_out_btn.clicked.connect(self._play_scale_out)
-        layout.addWidget(scale_out_btn)
-        
+        for button in self._create_animation_buttons("scale"):
+            layout.addWidget(button)
         layout.addStretch()
         
         return group
     
-    # Animation methods
-    def _play_fade_in(self):
-        """Play fade in animation."""
-        animation = FadeIn(self.animation_target, duration=500)
-        animation.start()
-    
-    def _play_fade_out(self):
-        """Play fade out animation."""
-        animation = FadeOut(self.animation_target, duration=500)
-        animation.start()
-    
-    def _play_slide_in_up(self):
-        """Play slide in from bottom animation."""
-        animation = SlideInUp(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_in_down(self):
-        """Play slide in from top animation."""
-        animation = SlideInDown(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_in_left(self):
-        """Play slide in from right animation."""
-        animation = SlideInLeft(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_in_right(self):
-        """Play slide in from left animation."""
-        animation = SlideInRight(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_out_up(self):
-        """Play slide out to top animation."""
-        animation = SlideOutUp(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_out_down(self):
-        """Play slide out to bottom animation."""
-        animation = SlideOutDown(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_out_left(self):
-        """Play slide out to left animation."""
-        animation = SlideOutLeft(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_slide_out_right(self):
-        """Play slide out to right animation."""
-        animation = SlideOutRight(self.animation_target, duration=500, distance=100)
-        animation.start()
-    
-    def _play_scale_in(self):
-        """Play scale in animation."""
-        animation = ScaleIn(self.animation_target, duration=500)
-        animation.start()
-    
-    def _play_scale_out(self):
-        """Play scale out animation."""
-        animation = ScaleOut(self.animation_target, duration=500)
+    def _create_animation_buttons(self, section: str,
+                                  size: str = Button.SIZE_MD) -> List[Button]:
+        """
+        Create one play button per animation registered for a section.
+        
+        Args:
+            section: Section name from ``_ANIM_SPECS``
+            size: Button size
+        
+        Returns:
+            Buttons in spec order
+        """
+        buttons = []
+        for spec_section, key, label, _, _ in self._ANIM_SPECS:
+            if spec_section != section:
+                continue
+            button = Button(label, size=size)
+            button.clicked.connect(partial(self._play, key))
+            buttons.append(button)
+        return buttons
+    
+    # Animation playback
+    def _build_animations(self) -> None:
+        """
+        Build every animation once.
+        
+        Runs on first play rather than in ``_setup_ui`` because the slide and
+        scale animations capture the target's geometry, which is only valid
+        once the window has been laid out. resizeEvent drops the cache when
+        that geometry may have moved.
+        """
+        target = self.animation_target
+        
+        # Read the target's geometry once and hand it to every animation
+        geometry = target.geometry()
+        origins = {
+            "slide_in": {"origin": geometry.topLeft()},
+            "slide_out": {"origin": geometry.topLeft()},
+            "scale": {"origin_geometry": geometry},
+        }
+        self._anims = {
+            key: cls(target, duration=500, **origins.get(section, {}), **kwargs)
+            for section, key, _, cls, kwargs in self._ANIM_SPECS
+        }
+    
+    def resizeEvent(self, event) -> None:
+        """Drop the cached animations; the layout moves the target."""
+        super().resizeEvent(event)
+        
+        # Running slides and scales would drag the target back to its old
+        # place, so stop them before the layout repositions it
+        for animation in self._anims.values():
+            animation.stop()
+        self._anims.clear()
+    
+    def _play(self, key: str) -> None:
+        """
+        Restart the cached animation registered under the given key.
+        
+        Args:
+            key: Animation name, e.g. "fade_in"
+        """
+        if not self._anims:
+            self._build_animations()
+        
+        animation = self._anims[key]
+        animation.stop()
         animation.start()
 
 
 def main():
     """Run the demo application."""
+    # Coalesce bursts of move/resize and tablet events; must precede QApplication
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressTabletEvents)
     app = QApplication(sys.argv)
     
     window = AnimationsDemo()
@@ -5,18 +5,43 @@ This example showcases all the components from PySide6 Shadcn Widgets.
 """
 
 import sys
+from functools import partial
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QScrollArea, QGroupBox, QSpacerItem, QSizePolicy
+    QLabel, QScrollArea, QGroupBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QCoreApplication
+from PySide6.QtGui import QFont
 
+from pyside6_shadcn_widgets import _global_qss
 from pyside6_shadcn_widgets.components import (
     Button, Card, Input, Badge, CheckBox, Switch, Progress, Select, Dialog, Tabs
 )
 from pyside6_shadcn_widgets.themes import LightTheme
 
 
+# Demo-specific label rules, registered with the component stylesheets
+DEMO_STYLESHEET = """
+    QLabel#demoTitle {
+        font-size: 32px;
+        font-weight: 700;
+        color: hsl(222.2, 84%, 4.9%);
+    }
+    QLabel#demoSubtitle {
+        font-size: 16px;
+        color: hsl(215.4, 16.3%, 46.9%);
+    }
+"""
+
+# Logging handlers print to a possibly slow console; queue them so the
+# click/toggle that triggered them repaints first
+QUEUED = Qt.ConnectionType.QueuedConnection
+
+# Shared font for section headings; weight-only rules skip the CSS parser
+SECTION_HEAD_FONT = QFont()
+SECTION_HEAD_FONT.setWeight(QFont.Weight.DemiBold)
+
+
 class BasicComponentsDemo(QMainWindow):
     """Main demo window showcasing all components."""
     
@@ -26,7 +51,8 @@ class BasicComponentsDemo(QMainWindow):
         self.setWindowTitle("PySide6 Shadcn Widgets - Basic Components Demo")
         self.setMinimumSize(1000, 800)
         
-        # Apply theme
+        # Apply theme, installing the demo rules with the component rules
+        _global_qss.register("BasicComponentsDemo", DEMO_STYLESHEET)
         self.theme = LightTheme()
         self.theme.apply()
         
@@ -35,28 +61,31 @@ class BasicComponentsDemo(QMainWindow):
     
     def _setup_ui(self):
         """Setup the main UI."""
-        # Central widget with scroll area
+        # Central widget with scroll area. Sections stay live widgets rather
+        # than pre-rendered pixmaps: QScrollArea scrolls by blitting the
+        # viewport, so only the newly exposed strip is repainted.
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        # Main container
+        # Main container, built with updates suspended so sections are
+        # laid out and painted once instead of after every insertion.
+        # Sections added below inherit the disabled state when reparented.
         container = QWidget()
+        container.setUpdatesEnabled(False)
         main_layout = QVBoxLayout(container)
         main_layout.setSpacing(24)
         main_layout.setContentsMargins(32, 32, 32, 32)
         
         # Title
         title = QLabel("PySide6 Shadcn Widgets")
-        title.setStyleSheet("font-size: 32px; font-weight: 700; color: hsl(222.2, 84%, 4.9%);")
+        title.setObjectName("demoTitle")
         main_layout.addWidget(title)
         
         subtitle = QLabel("Modern UI components inspired by shadcn/ui")
-        subtitle.setStyleSheet("font-size: 16px; color: hsl(215.4, 16.3%, 46.9%);")
+        subtitle.setObjectName("demoSubtitle")
         main_layout.addWidget(subtitle)
         
-        main_layout.addSpacing(16)
-        
         # Add component sections
         main_layout.addWidget(self._create_button_section())
         main_layout.addWidget(self._create_input_section())
@@ -71,6 +100,28 @@ class BasicComponentsDemo(QMainWindow):
         
         scroll.setWidget(container)
         self.setCentralWidget(scroll)
+        container.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _row(widgets, spacing: int = 12, stretch: bool = True) -> QHBoxLayout:
+        """
+        Build a horizontal row of widgets.
+        
+        Args:
+            widgets: Widgets to add, left to right
+            spacing: Spacing between widgets in pixels
+            stretch: Whether to add a trailing stretch to left-align the row
+            
+        Returns:
+            The populated row layout
+        """
+        row = QHBoxLayout()
+        row.setSpacing(spacing)
+        for widget in widgets:
+            row.addWidget(widget)
+        if stretch:
+            row.addStretch()
+        return row
     
     def _create_button_section(self) -> QGroupBox:
         """Create button showcase section."""
@@ -80,42 +131,43 @@ class BasicComponentsDemo(QMainWindow):
         
         # Button variants
         variants_label = QLabel("Variants:")
-        variants_label.setStyleSheet("font-weight: 600;")
+        variants_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(variants_label)
         
-        variants_layout = QHBoxLayout()
-        variants_layout.setSpacing(12)
+        variant_buttons = [
+            Button(text, variant=variant)
+            for text, variant in (
+                ("Default", Button.VARIANT_DEFAULT),
+                ("Destructive", Button.VARIANT_DESTRUCTIVE),
+                ("Outline", Button.VARIANT_OUTLINE),
+                ("Ghost", Button.VARIANT_GHOST),
+                ("Link", Button.VARIANT_LINK),
+            )
+        ]
         
-        btn_default = Button("Default", variant=Button.VARIANT_DEFAULT)
-        btn_destructive = Button("Destructive", variant=Button.VARIANT_DESTRUCTIVE)
-        btn_outline = Button("Outline", variant=Button.VARIANT_OUTLINE)
-        btn_ghost = Button("Ghost", variant=Button.VARIANT_GHOST)
-        btn_link = Button("Link", variant=Button.VARIANT_LINK)
+        for btn in variant_buttons:
+            btn.clicked.connect(partial(self._on_button_clicked, btn), QUEUED)
         
-        for btn in [btn_default, btn_destructive, btn_outline, btn_ghost, btn_link]:
-            btn.clicked.connect(lambda checked, b=btn: print(f"Clicked: {b.text()}"))
-            variants_layout.addWidget(btn)
-        
-        variants_layout.addStretch()
-        layout.addLayout(variants_layout)
+        layout.addLayout(self._row(variant_buttons))
         
         # Button sizes
         sizes_label = QLabel("Sizes:")
-        sizes_label.setStyleSheet("font-weight: 600;")
+        sizes_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(sizes_label)
         
-        sizes_layout = QHBoxLayout()
-        sizes_layout.setSpacing(12)
-        
-        btn_sm = Button("Small", size=Button.SIZE_SM)
-        btn_md = Button("Medium", size=Button.SIZE_MD)
-        btn_lg = Button("Large", size=Button.SIZE_LG)
+        size_buttons = [
+            Button(text, size=size)
+            for text, size in (
+                ("Small", Button.SIZE_SM),
+                ("Medium", Button.SIZE_MD),
+                ("Large", Button.SIZE_LG),
+            )
+        ]
         
-        for btn in [btn_sm, btn_md, btn_lg]:
-            sizes_layout.addWidget(btn)
+        layout.addLayout(self._row(size_buttons))
         
-        sizes_layout.addStretch()
-        layout.addLayout(sizes_layout)
+        # Polish the whole section in one walk once every button is in place
+        group.ensurePolished()
         
         return group
     
@@ -149,15 +201,19 @@ class BasicComponentsDemo(QMainWindow):
         
         # Card 1
         card1 = Card()
-        card1.set_header("Card Title")
-        card1.set_content("This is a card component with header, content, and footer. Hover over it to see the elevation effect.")
-        card1.set_footer("Card footer")
+        card1.set_all(
+            header="Card Title",
+            content="This is a card component with header, content, and footer. Hover over it to see the elevation effect.",
+            footer="Card footer",
+        )
         layout.addWidget(card1)
         
         # Card 2
         card2 = Card()
-        card2.set_header("Another Card")
-        card2.set_content("Cards can contain any widget as content, not just text.")
+        card2.set_all(
+            header="Another Card",
+            content="Cards can contain any widget as content, not just text.",
+        )
         layout.addWidget(card2)
         
         layout.addStretch()
@@ -172,40 +228,39 @@ class BasicComponentsDemo(QMainWindow):
         
         # Badge variants
         variants_label = QLabel("Variants:")
-        variants_label.setStyleSheet("font-weight: 600;")
+        variants_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(variants_label)
         
-        variants_layout = QHBoxLayout()
-        variants_layout.setSpacing(8)
+        variant_badges = [
+            Badge(text, variant=variant)
+            for text, variant in (
+                ("Default", Badge.VARIANT_DEFAULT),
+                ("Secondary", Badge.VARIANT_SECONDARY),
+                ("Destructive", Badge.VARIANT_DESTRUCTIVE),
+                ("Outline", Badge.VARIANT_OUTLINE),
+            )
+        ]
         
-        badge1 = Badge("Default", variant=Badge.VARIANT_DEFAULT)
-        badge2 = Badge("Secondary", variant=Badge.VARIANT_SECONDARY)
-        badge3 = Badge("Destructive", variant=Badge.VARIANT_DESTRUCTIVE)
-        badge4 = Badge("Outline", variant=Badge.VARIANT_OUTLINE)
-        
-        for badge in [badge1, badge2, badge3, badge4]:
-            variants_layout.addWidget(badge)
-        
-        variants_layout.addStretch()
-        layout.addLayout(variants_layout)
+        layout.addLayout(self._row(variant_badges, spacing=8))
         
         # Badge sizes
         sizes_label = QLabel("Sizes:")
-        sizes_label.setStyleSheet("font-weight: 600;")
+        sizes_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(sizes_label)
         
-        sizes_layout = QHBoxLayout()
-        sizes_layout.setSpacing(8)
-        
-        badge_sm = Badge("Small", size=Badge.SIZE_SM)
-        badge_md = Badge("Medium", size=Badge.SIZE_MD)
-        badge_lg = Badge("Large", size=Badge.SIZE_LG)
+        size_badges = [
+            Badge(text, size=size)
+            for text, size in (
+                ("Small", Badge.SIZE_SM),
+                ("Medium", Badge.SIZE_MD),
+                ("Large", Badge.SIZE_LG),
+            )
+        ]
         
-        for badge in [badge_sm, badge_md, badge_lg]:
-            sizes_layout.addWidget(badge)
+        layout.addLayout(self._row(size_badges, spacing=8))
         
-        sizes_layout.addStretch()
-        layout.addLayout(sizes_layout)
+        # Polish the whole section in one walk once every badge is in place
+        group.ensurePolished()
         
         return group
     
@@ -217,7 +272,7 @@ class BasicComponentsDemo(QMainWindow):
         
         # Checkboxes
         checkbox_label = QLabel("Checkboxes:")
-        checkbox_label.setStyleSheet("font-weight: 600;")
+        checkbox_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(checkbox_label)
         
         checkbox1 = CheckBox("Accept terms and conditions")
@@ -227,31 +282,22 @@ class BasicComponentsDemo(QMainWindow):
         layout.addWidget(checkbox1)
         layout.addWidget(checkbox2)
         
-        layout.addSpacing(8)
-        
         # Switches
         switch_label = QLabel("Switches:")
-        switch_label.setStyleSheet("font-weight: 600;")
+        switch_label.setFont(SECTION_HEAD_FONT)
         layout.addWidget(switch_label)
         
-        switch_layout = QHBoxLayout()
-        switch_layout.setSpacing(16)
-        
         switch1 = Switch()
-        switch1.toggled.connect(lambda checked: print(f"Switch 1: {checked}"))
+        switch1.toggled.connect(partial(self._on_switch_toggled, "Switch 1"), QUEUED)
         
         switch2 = Switch()
         switch2.setChecked(True)
-        switch2.toggled.connect(lambda checked: print(f"Switch 2: {checked}"))
+        switch2.toggled.connect(partial(self._on_switch_toggled, "Switch 2"), QUEUED)
         
-        switch_layout.addWidget(QLabel("Enable notifications:"))
-        switch_layout.addWidget(switch1)
-        switch_layout.addSpacing(32)
-        switch_layout.addWidget(QLabel("Dark mode:"))
-        switch_layout.addWidget(switch2)
-        switch_layout.addStretch()
-        
-        layout.addLayout(switch_layout)
+        layout.addLayout(self._row(
+            [QLabel("Enable notifications:"), switch1, QLabel("Dark mode:"), switch2],
+            spacing=16,
+        ))
         
         return group
     
@@ -300,7 +346,7 @@ class BasicComponentsDemo(QMainWindow):
             "Option 4",
             "Option 5",
         ])
-        select.currentTextChanged.connect(lambda text: print(f"Selected: {text}"))
+        select.currentTextChanged.connect(self._on_selection_changed, QUEUED)
         
         layout.addWidget(select)
         
@@ -347,6 +393,18 @@ class BasicComponentsDemo(QMainWindow):
         
         return group
     
+    def _on_button_clicked(self, button: Button) -> None:
+        """Log a showcase button click."""
+        print(f"Clicked: {button.text()}")
+    
+    def _on_switch_toggled(self, name: str, checked: bool) -> None:
+        """Log a switch state change."""
+        print(f"{name}: {checked}")
+    
+    def _on_selection_changed(self, text: str) -> None:
+        """Log the selected option."""
+        print(f"Selected: {text}")
+    
     def _show_dialog(self):
         """Show a dialog example."""
         dialog = Dialog(self)
@@ -362,6 +420,9 @@ class BasicComponentsDemo(QMainWindow):
 
 def main():
     """Run the demo application."""
+    # Coalesce bursts of move/resize and tablet events; must precede QApplication
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressTabletEvents)
     app = QApplication(sys.argv)
     
     window = BasicComponentsDemo()
@@ -5,15 +5,32 @@ This example demonstrates switching between light and dark themes.
 """
 
 import sys
+from typing import Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QGroupBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QCoreApplication
 
+from pyside6_shadcn_widgets import _global_qss
 from pyside6_shadcn_widgets.components import Button, Card, Input, Badge, CheckBox, Switch
 from pyside6_shadcn_widgets.themes import LightTheme, DarkTheme
 
+# Demo-specific label rules, registered with the component stylesheets
+DEMO_STYLESHEET = """
+    QLabel#demoTitle {
+        font-size: 32px;
+        font-weight: 700;
+    }
+    QLabel#demoSubtitle {
+        font-size: 16px;
+    }
+    QLabel#themeLabel {
+        font-size: 16px;
+        font-weight: 600;
+    }
+"""
+
 
 class ThemeSwitcherDemo(QMainWindow):
     """Main demo window for theme switching."""
@@ -24,10 +41,13 @@ class ThemeSwitcherDemo(QMainWindow):
         self.setWindowTitle("PySide6 Shadcn Widgets - Theme Switcher")
         self.setMinimumSize(800, 600)
         
-        # Initialize with light theme
+        # The demo rules are installed along with each theme's stylesheet
+        _global_qss.register("ThemeSwitcherDemo", DEMO_STYLESHEET)
+        
+        # Initialize with light theme; the dark theme is built on first toggle
         self.current_theme = "light"
         self.light_theme = LightTheme()
-        self.dark_theme = DarkTheme()
+        self.dark_theme: Optional[DarkTheme] = None
         
         # Setup UI
         self._setup_ui()
@@ -46,34 +66,49 @@ class ThemeSwitcherDemo(QMainWindow):
         
         # Title
         title = QLabel("Theme Switcher Demo")
-        title.setStyleSheet("font-size: 32px; font-weight: 700;")
+        title.setObjectName("demoTitle")
         main_layout.addWidget(title)
         
         subtitle = QLabel("Toggle between light and dark themes")
-        subtitle.setStyleSheet("font-size: 16px;")
+        subtitle.setObjectName("demoSubtitle")
         main_layout.addWidget(subtitle)
         
-        main_layout.addSpacing(16)
-        
         # Theme switcher
-        theme_layout = QHBoxLayout()
         theme_label = QLabel("Dark Mode:")
-        theme_label.setStyleSheet("font-size: 16px; font-weight: 600;")
-        theme_layout.addWidget(theme_label)
+        theme_label.setObjectName("themeLabel")
         
         self.theme_switch = Switch()
-        self.theme_switch.toggled.connect(self._toggle_theme)
-        theme_layout.addWidget(self.theme_switch)
-        
-        theme_layout.addStretch()
-        main_layout.addLayout(theme_layout)
-        
-        main_layout.addSpacing(16)
+        main_layout.addLayout(self._row([theme_label, self.theme_switch]))
         
         # Sample components
         main_layout.addWidget(self._create_sample_components())
         
         main_layout.addStretch()
+        
+        # Connect once the window is fully built so construction never
+        # triggers a theme re-apply
+        self.theme_switch.toggled.connect(self._toggle_theme)
+    
+    @staticmethod
+    def _row(widgets, spacing: int = 12, stretch: bool = True) -> QHBoxLayout:
+        """
+        Build a horizontal row of widgets.
+        
+        Args:
+            widgets: Widgets to add, left to right
+            spacing: Spacing between widgets in pixels
+            stretch: Whether to add a trailing stretch to left-align the row
+            
+        Returns:
+            The populated row layout
+        """
+        row = QHBoxLayout()
+        row.setSpacing(spacing)
+        for widget in widgets:
+            row.addWidget(widget)
+        if stretch:
+            row.addStretch()
+        return row
     
     def _create_sample_components(self) -> QGroupBox:
         """Create sample components to show theme."""
@@ -82,19 +117,11 @@ class ThemeSwitcherDemo(QMainWindow):
         layout.setSpacing(16)
         
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(12)
-        
         btn1 = Button("Default Button")
         btn2 = Button("Outline Button", variant=Button.VARIANT_OUTLINE)
         btn3 = Button("Ghost Button", variant=Button.VARIANT_GHOST)
         
-        btn_layout.addWidget(btn1)
-        btn_layout.addWidget(btn2)
-        btn_layout.addWidget(btn3)
-        btn_layout.addStretch()
-        
-        layout.addLayout(btn_layout)
+        layout.addLayout(self._row([btn1, btn2, btn3]))
         
         # Input
         input_field = Input(placeholder="Type something...")
@@ -102,24 +129,18 @@ class ThemeSwitcherDemo(QMainWindow):
         
         # Card
         card = Card()
-        card.set_header("Sample Card")
-        card.set_content("This card will change appearance based on the selected theme.")
+        card.set_all(
+            header="Sample Card",
+            content="This card will change appearance based on the selected theme.",
+        )
         layout.addWidget(card)
         
         # Badges
-        badge_layout = QHBoxLayout()
-        badge_layout.setSpacing(8)
-        
         badge1 = Badge("Default")
         badge2 = Badge("Secondary", variant=Badge.VARIANT_SECONDARY)
         badge3 = Badge("Outline", variant=Badge.VARIANT_OUTLINE)
         
-        badge_layout.addWidget(badge1)
-        badge_layout.addWidget(badge2)
-        badge_layout.addWidget(badge3)
-        badge_layout.addStretch()
-        
-        layout.addLayout(badge_layout)
+        layout.addLayout(self._row([badge1, badge2, badge3], spacing=8))
         
         # Checkbox
         checkbox = CheckBox("Sample checkbox")
@@ -135,6 +156,8 @@ class ThemeSwitcherDemo(QMainWindow):
             dark_mode: True for dark theme, False for light theme
         """
         if dark_mode:
+            if self.dark_theme is None:
+                self.dark_theme = DarkTheme()
             self.dark_theme.apply()
             self.current_theme = "dark"
             print("Switched to dark theme")
@@ -146,6 +169,9 @@ class ThemeSwitcherDemo(QMainWindow):
 
 def main():
     """Run the demo application."""
+    # Coalesce bursts of move/resize and tablet events; must precede QApplication
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressTabletEvents)
     app = QApplication(sys.argv)
     
     window = ThemeSwitcherDemo()
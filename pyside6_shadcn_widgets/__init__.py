@@ -4,21 +4,175 @@ PySide6 Shadcn Widgets
 
 A modern UI library for PySide6 inspired by shadcn/ui components and animations.
 
+Public names are resolved lazily (PEP 562), so a subpackage is only imported
+the first time one of its names is accessed.
+
 :copyright: (c) 2026
 :license: MIT, see LICENSE for more details.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "PySide6-Shadcn-Widgets Contributors"
 
-from pyside6_shadcn_widgets.components import *
-from pyside6_shadcn_widgets.animations import *
-from pyside6_shadcn_widgets.themes import *
-from pyside6_shadcn_widgets.utils import *
+_SUBPACKAGES = ("components", "animations", "themes", "utils")
+
+# Public name -> subpackage or module that defines it
+_LAZY = {
+    # Components
+    "Button": "components",
+    "Card": "components",
+    "CardContainer": "components",
+    "Input": "components",
+    "Select": "components",
+    "Dialog": "components",
+    "Tabs": "components",
+    "Badge": "components",
+    "CheckBox": "components",
+    "Switch": "components",
+    "Progress": "components",
+    # Animations
+    "FadeIn": "animations",
+    "FadeOut": "animations",
+    "fade_scale_in": "animations",
+    "fade_scale_out": "animations",
+    "SlideInUp": "animations",
+    "SlideInDown": "animations",
+    "SlideInLeft": "animations",
+    "SlideInRight": "animations",
+    "SlideOutUp": "animations",
+    "SlideOutDown": "animations",
+    "SlideOutLeft": "animations",
+    "SlideOutRight": "animations",
+    "ScaleIn": "animations",
+    "ScaleOut": "animations",
+    # Themes
+    "Theme": "themes",
+    "LightTheme": "themes",
+    "DarkTheme": "themes",
+    # Utils
+    "hsl_to_rgb": "utils",
+    "rgb_to_hex": "utils",
+    "hex_to_rgb": "utils",
+    "adjust_lightness": "utils",
+    "adjust_alpha": "utils",
+    "adjust_alpha_rgb": "utils",
+    "hsl_to_hex": "utils",
+    # Component stylesheets
+    "install_component_styles": "_global_qss",
+}
 
 __all__ = [
+    # Subpackages
     "components",
     "animations",
     "themes",
     "utils",
+    # Components
+    "Button",
+    "Card",
+    "CardContainer",
+    "Input",
+    "Select",
+    "Dialog",
+    "Tabs",
+    "Badge",
+    "CheckBox",
+    "Switch",
+    "Progress",
+    # Animations
+    "FadeIn",
+    "FadeOut",
+    "fade_scale_in",
+    "fade_scale_out",
+    "SlideInUp",
+    "SlideInDown",
+    "SlideInLeft",
+    "SlideInRight",
+    "SlideOutUp",
+    "SlideOutDown",
+    "SlideOutLeft",
+    "SlideOutRight",
+    "ScaleIn",
+    "ScaleOut",
+    # Themes
+    "Theme",
+    "LightTheme",
+    "DarkTheme",
+    # Utils
+    "hsl_to_rgb",
+    "rgb_to_hex",
+    "hex_to_rgb",
+    "adjust_lightness",
+    "adjust_alpha",
+    "adjust_alpha_rgb",
+    "hsl_to_hex",
+    # Component stylesheets
+    "install_component_styles",
 ]
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and IDEs; resolved lazily at runtime
+    from pyside6_shadcn_widgets import animations, components, themes, utils
+    from pyside6_shadcn_widgets._global_qss import install_component_styles
+    from pyside6_shadcn_widgets.animations import (
+        FadeIn,
+        FadeOut,
+        ScaleIn,
+        ScaleOut,
+        SlideInDown,
+        SlideInLeft,
+        SlideInRight,
+        SlideInUp,
+        SlideOutDown,
+        SlideOutLeft,
+        SlideOutRight,
+        SlideOutUp,
+        fade_scale_in,
+        fade_scale_out,
+    )
+    from pyside6_shadcn_widgets.components import (
+        Badge,
+        Button,
+        Card,
+        CardContainer,
+        CheckBox,
+        Dialog,
+        Input,
+        Progress,
+        Select,
+        Switch,
+        Tabs,
+    )
+    from pyside6_shadcn_widgets.themes import DarkTheme, LightTheme, Theme
+    from pyside6_shadcn_widgets.utils import (
+        adjust_alpha,
+        adjust_alpha_rgb,
+        adjust_lightness,
+        hex_to_rgb,
+        hsl_to_hex,
+        hsl_to_rgb,
+        rgb_to_hex,
+    )
+
+
+def __getattr__(name: str):
+    """Import the subpackage providing ``name`` on first access."""
+    if name in _SUBPACKAGES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY:
+        module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily resolved names in ``dir()``."""
+    return sorted(set(globals()) | set(_SUBPACKAGES) | set(_LAZY))
@@ -0,0 +1,84 @@
+"""
+Application-wide component stylesheets for PySide6 Shadcn Widgets.
+
+Components styled through dynamic properties register their QSS here instead
+of calling setStyleSheet on every instance. The registered rules are appended
+to the QApplication stylesheet, so Qt parses them once for all instances, and
+are appended again whenever a theme replaces the application stylesheet.
+"""
+
+from typing import Dict, Optional
+from PySide6.QtWidgets import QApplication
+
+# Registered component stylesheets keyed by component name
+_REGISTRY: Dict[str, str] = {}
+
+# Application stylesheet as it was after the last install()
+_installed_sheet: Optional[str] = None
+
+
+def register(name: str, qss: str) -> None:
+    """
+    Register a component stylesheet for the application stylesheet.
+    
+    Args:
+        name: Component name, registering it again replaces its rules
+        qss: QSS rules for the component
+    """
+    global _installed_sheet
+    _REGISTRY[name] = qss
+    _installed_sheet = None
+
+
+def install(app: Optional[QApplication] = None, sheet: Optional[str] = None) -> None:
+    """
+    Append any registered stylesheet missing from the application stylesheet.
+    
+    The application stylesheet is set at most once, and only if it changes.
+    
+    Args:
+        app: QApplication instance. If None, uses QApplication.instance()
+        sheet: Stylesheet to set, such as a new theme's, instead of keeping
+            the current application stylesheet
+    """
+    global _installed_sheet
+    if app is None:
+        app = QApplication.instance()
+    if app is None:
+        return
+    
+    current = app.styleSheet()
+    if sheet is None:
+        sheet = current
+    
+    missing = [qss for qss in _REGISTRY.values() if qss not in sheet]
+    if missing:
+        sheet += "".join(missing)
+    if sheet != current:
+        app.setStyleSheet(sheet)
+    _installed_sheet = sheet
+
+
+def install_component_styles(app: Optional[QApplication] = None) -> None:
+    """
+    Add the component rules back after replacing the application stylesheet.
+    
+    Components are styled by rules in the application stylesheet, so
+    app.setStyleSheet() removes their styling from existing widgets until
+    this is called. Theme.apply() keeps them installed by itself.
+    
+    Args:
+        app: QApplication instance. If None, uses QApplication.instance()
+    
+    Example:
+        >>> app.setStyleSheet(app.styleSheet() + "QToolTip { border: none; }")
+        >>> install_component_styles(app)
+    """
+    install(app)
+
+
+def ensure_installed() -> None:
+    """Install the registered stylesheets if the application stylesheet changed since the last install."""
+    app = QApplication.instance()
+    if app is not None and app.styleSheet() != _installed_sheet:
+        install(app)
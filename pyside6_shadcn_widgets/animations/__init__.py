@@ -3,24 +3,37 @@ Animations Module
 ~~~~~~~~~~~~~~~~~
 
 Smooth animations for PySide6 widgets.
+
+Animation classes are resolved lazily (PEP 562), so using ``FadeIn`` does not
+import the slide and scale modules.
 """
 
-from pyside6_shadcn_widgets.animations.fade import FadeIn, FadeOut
-from pyside6_shadcn_widgets.animations.slide import (
-    SlideInUp,
-    SlideInDown,
-    SlideInLeft,
-    SlideInRight,
-    SlideOutUp,
-    SlideOutDown,
-    SlideOutLeft,
-    SlideOutRight,
-)
-from pyside6_shadcn_widgets.animations.scale import ScaleIn, ScaleOut
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> module that defines it
+_LAZY = {
+    "FadeIn": "fade",
+    "FadeOut": "fade",
+    "fade_scale_in": "fade",
+    "fade_scale_out": "fade",
+    "SlideInUp": "slide",
+    "SlideInDown": "slide",
+    "SlideInLeft": "slide",
+    "SlideInRight": "slide",
+    "SlideOutUp": "slide",
+    "SlideOutDown": "slide",
+    "SlideOutLeft": "slide",
+    "SlideOutRight": "slide",
+    "ScaleIn": "scale",
+    "ScaleOut": "scale",
+}
 
 __all__ = [
     "FadeIn",
     "FadeOut",
+    "fade_scale_in",
+    "fade_scale_out",
     "SlideInUp",
     "SlideInDown",
     "SlideInLeft",
@@ -32,3 +45,41 @@ __all__ = [
     "ScaleIn",
     "ScaleOut",
 ]
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and IDEs; resolved lazily at runtime
+    from pyside6_shadcn_widgets.animations.fade import (
+        FadeIn,
+        FadeOut,
+        fade_scale_in,
+        fade_scale_out,
+    )
+    from pyside6_shadcn_widgets.animations.slide import (
+        SlideInUp,
+        SlideInDown,
+        SlideInLeft,
+        SlideInRight,
+        SlideOutUp,
+        SlideOutDown,
+        SlideOutLeft,
+        SlideOutRight,
+    )
+    from pyside6_shadcn_widgets.animations.scale import ScaleIn, ScaleOut
+
+
+def __getattr__(name: str):
+    """Import the module providing ``name`` on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+    value = getattr(module, name)
+    
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily resolved names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,32 @@
+"""
+Shared easing curves for the animation classes.
+"""
+
+from typing import Dict
+from PySide6.QtCore import QEasingCurve
+
+# One QEasingCurve per type, shared by every animation using that type
+_EASING_CACHE: Dict[QEasingCurve.Type, QEasingCurve] = {}
+
+
+def easing_curve(easing: QEasingCurve.Type) -> QEasingCurve:
+    """
+    Get the shared QEasingCurve for an easing type.
+    
+    Passing a bare type to setEasingCurve builds a new QEasingCurve on every
+    call; animations copy the curve they are given, so one instance per type
+    can be reused safely.
+    
+    Args:
+        easing: Easing curve type; a QEasingCurve is returned unchanged
+        
+    Returns:
+        The cached QEasingCurve for the type
+    """
+    if isinstance(easing, QEasingCurve):
+        return easing
+    
+    curve = _EASING_CACHE.get(easing)
+    if curve is None:
+        curve = _EASING_CACHE[easing] = QEasingCurve(easing)
+    return curve
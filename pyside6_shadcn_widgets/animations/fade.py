@@ -2,8 +2,30 @@
 Fade animations for PySide6 widgets.
 """
 
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QObject
+from typing import Optional
+from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QRect
 from PySide6.QtWidgets import QGraphicsOpacityEffect, QWidget
+from pyside6_shadcn_widgets.animations._easing import easing_curve
+
+
+def _opacity_effect(widget: QWidget) -> QGraphicsOpacityEffect:
+    """
+    Get the widget's opacity effect, installing one if it has none.
+    
+    Reusing the installed effect keeps its offscreen surface instead of
+    reallocating it on every fade.
+    
+    Args:
+        widget: The widget being animated
+        
+    Returns:
+        The QGraphicsOpacityEffect installed on the widget
+    """
+    effect = widget.graphicsEffect()
+    if not isinstance(effect, QGraphicsOpacityEffect):
+        effect = QGraphicsOpacityEffect(widget)
+        widget.setGraphicsEffect(effect)
+    return effect
 
 
 class FadeIn:
@@ -16,6 +38,8 @@ class FadeIn:
         >>> animation.start()
     """
     
+    __slots__ = ("widget", "duration", "easing", "opacity_effect", "animation")
+    
     def __init__(self, widget: QWidget, duration: int = 300, easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
         """
         Initialize fade in animation.
@@ -29,16 +53,20 @@ class FadeIn:
         self.duration = duration
         self.easing = easing
         
-        # Create opacity effect
-        self.opacity_effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(self.opacity_effect)
+        # Create or get existing opacity effect
+        self.opacity_effect = _opacity_effect(widget)
         
-        # Create animation
+        # Each fade owns its animation; callers may hand it to a group or
+        # start it with DeleteWhenStopped
         self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.animation.setDuration(duration)
+        self._configure()
+    
+    def _configure(self) -> None:
+        """Apply this fade's settings to its animation."""
+        self.animation.setDuration(self.duration)
         self.animation.setStartValue(0.0)
         self.animation.setEndValue(1.0)
-        self.animation.setEasingCurve(easing)
+        self.animation.setEasingCurve(easing_curve(self.easing))
     
     def start(self) -> None:
         """Start the fade in animation."""
@@ -68,6 +96,8 @@ class FadeOut:
         >>> animation.start()
     """
     
+    __slots__ = ("widget", "duration", "easing", "opacity_effect", "animation")
+    
     def __init__(self, widget: QWidget, duration: int = 300, easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
         """
         Initialize fade out animation.
@@ -82,19 +112,19 @@ class FadeOut:
         self.easing = easing
         
         # Create or get existing opacity effect
-        opacity_effect = widget.graphicsEffect()
-        if opacity_effect is None or not isinstance(opacity_effect, QGraphicsOpacityEffect):
-            opacity_effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(opacity_effect)
-        
-        self.opacity_effect = opacity_effect
+        self.opacity_effect = _opacity_effect(widget)
         
-        # Create animation
+        # Each fade owns its animation; callers may hand it to a group or
+        # start it with DeleteWhenStopped
         self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.animation.setDuration(duration)
+        self._configure()
+    
+    def _configure(self) -> None:
+        """Apply this fade's settings to its animation."""
+        self.animation.setDuration(self.duration)
         self.animation.setStartValue(1.0)
         self.animation.setEndValue(0.0)
-        self.animation.setEasingCurve(easing)
+        self.animation.setEasingCurve(easing_curve(self.easing))
     
     def start(self) -> None:
         """Start the fade out animation."""
@@ -112,3 +142,87 @@ class FadeOut:
             The QPropertyAnimation instance
         """
         return self.animation
+
+
+def _fade_scale_group(widget: QWidget, duration: int, start_opacity: float,
+                      end_opacity: float, scale_cls: type, easing: QEasingCurve.Type,
+                      origin_geometry: Optional[QRect]) -> QParallelAnimationGroup:
+    """
+    Build a parallel group that fades and scales a widget together.
+    
+    The group takes ownership of both animations, so they are deleted with
+    it.
+    
+    Args:
+        widget: The widget to animate
+        duration: Animation duration in milliseconds
+        start_opacity: Opacity at the start of the animation
+        end_opacity: Opacity at the end of the animation
+        scale_cls: ScaleIn or ScaleOut
+        easing: Easing curve type for both animations
+        origin_geometry: Geometry at scale 1.0, or None for the current one
+        
+    Returns:
+        The QParallelAnimationGroup, owned by the widget
+    """
+    fade = QPropertyAnimation(_opacity_effect(widget), b"opacity")
+    fade.setDuration(duration)
+    fade.setStartValue(start_opacity)
+    fade.setEndValue(end_opacity)
+    fade.setEasingCurve(easing_curve(easing))
+    
+    group = QParallelAnimationGroup(widget)
+    group.addAnimation(fade)
+    group.addAnimation(scale_cls(widget, duration, easing=easing,
+                                  origin_geometry=origin_geometry).animation)
+    return group
+
+
+def fade_scale_in(widget: QWidget, duration: int = 300,
+                  easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic,
+                  origin_geometry: Optional[QRect] = None) -> QParallelAnimationGroup:
+    """
+    Fade a widget in while scaling it from 95% to 100%, as for a modal.
+    
+    Both animations run in one QParallelAnimationGroup, so they share a
+    single timeline and stay in sync.
+    
+    Args:
+        widget: The widget to animate
+        duration: Animation duration in milliseconds
+        easing: Easing curve type for the animation
+        origin_geometry: Geometry at scale 1.0, defaults to the widget's
+            current geometry
+        
+    Returns:
+        The QParallelAnimationGroup, owned by the widget
+        
+    Example:
+        >>> group = fade_scale_in(dialog_content, duration=200)
+        >>> group.start()
+    """
+    from pyside6_shadcn_widgets.animations.scale import ScaleIn
+    return _fade_scale_group(widget, duration, 0.0, 1.0, ScaleIn, easing, origin_geometry)
+
+
+def fade_scale_out(widget: QWidget, duration: int = 300,
+                   easing: QEasingCurve.Type = QEasingCurve.Type.InCubic,
+                   origin_geometry: Optional[QRect] = None) -> QParallelAnimationGroup:
+    """
+    Fade a widget out while scaling it from 100% to 95%, as for a modal.
+    
+    Both animations run in one QParallelAnimationGroup, so they share a
+    single timeline and stay in sync.
+    
+    Args:
+        widget: The widget to animate
+        duration: Animation duration in milliseconds
+        easing: Easing curve type for the animation
+        origin_geometry: Geometry at scale 1.0, defaults to the widget's
+            current geometry
+        
+    Returns:
+        The QParallelAnimationGroup, owned by the widget
+    """
+    from pyside6_shadcn_widgets.animations.scale import ScaleOut
+    return _fade_scale_group(widget, duration, 1.0, 0.0, ScaleOut, easing, origin_geometry)
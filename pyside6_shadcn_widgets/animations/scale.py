@@ -2,24 +2,49 @@
 Scale animations for PySide6 widgets.
 """
 
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QRect, Property, QObject
+from functools import partial
+from typing import Optional
+from PySide6.QtCore import QVariantAnimation, QEasingCurve, QRect
 from PySide6.QtWidgets import QWidget
+from pyside6_shadcn_widgets.animations._easing import easing_curve
 
 
-class ScaleAnimationHelper(QObject):
-    """Helper class to enable scale animations on QWidget."""
+class ScaleAnimationHelper:
+    """
+    Helper class to enable scale animations on QWidget.
+    
+    Holds the widget's original geometry and applies scale factors to it.
+    Animations drive it by connecting their valueChanged signal to
+    set_scale directly, without going through a Qt property.
+    """
     
-    def __init__(self, widget: QWidget):
+    __slots__ = ("widget", "_scale", "_original_geometry",
+                 "_width", "_height", "_center_x", "_center_y", "_last_size")
+    
+    def __init__(self, widget: QWidget, origin_geometry: Optional[QRect] = None):
         """
         Initialize scale animation helper.
         
         Args:
             widget: The widget to animate
+            origin_geometry: Geometry at scale 1.0, defaults to the widget's
+                current geometry
         """
-        super().__init__(widget)
         self.widget = widget
         self._scale = 1.0
-        self._original_geometry = widget.geometry()
+        if origin_geometry is None:
+            origin_geometry = widget.geometry()
+        self._original_geometry = geometry = origin_geometry
+        
+        # The original size and center are fixed for the whole animation, so
+        # read them out of the QRect once instead of on every tick
+        self._width = geometry.width()
+        self._height = geometry.height()
+        self._center_x = geometry.x() + self._width / 2
+        self._center_y = geometry.y() + self._height / 2
+        
+        # Size last applied by set_scale
+        self._last_size = None
     
     def get_scale(self) -> float:
         """Get the current scale value."""
@@ -35,21 +60,23 @@ class ScaleAnimationHelper(QObject):
         self._scale = scale
         
         # Calculate new geometry based on scale
-        original_width = self._original_geometry.width()
-        original_height = self._original_geometry.height()
-        original_x = self._original_geometry.x()
-        original_y = self._original_geometry.y()
+        new_width = int(self._width * scale)
+        new_height = int(self._height * scale)
         
-        new_width = int(original_width * scale)
-        new_height = int(original_height * scale)
+        # Small scale ranges map many ticks to the same whole-pixel size, and
+        # with a fixed center the position is then unchanged as well
+        size = (new_width, new_height)
+        if size == self._last_size:
+            return
+        self._last_size = size
         
         # Center the scaled widget
-        new_x = original_x + (original_width - new_width) // 2
-        new_y = original_y + (original_height - new_height) // 2
+        new_x = int(self._center_x - new_width * 0.5)
+        new_y = int(self._center_y - new_height * 0.5)
         
         self.widget.setGeometry(new_x, new_y, new_width, new_height)
     
-    scale = Property(float, get_scale, set_scale)
+    scale = property(get_scale, set_scale)
 
 
 class ScaleIn:
@@ -63,9 +90,13 @@ class ScaleIn:
         >>> animation.start()
     """
     
+    __slots__ = ("widget", "duration", "start_scale", "end_scale", "easing",
+                 "scale_helper", "animation")
+    
     def __init__(self, widget: QWidget, duration: int = 300, 
                  start_scale: float = 0.95, end_scale: float = 1.0,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
+                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic,
+                 origin_geometry: Optional[QRect] = None):
         """
         Initialize scale in animation.
         
@@ -75,6 +106,8 @@ class ScaleIn:
             start_scale: Starting scale factor (default 0.95 = 95%)
             end_scale: Ending scale factor (default 1.0 = 100%)
             easing: Easing curve type for the animation
+            origin_geometry: Geometry at scale 1.0, defaults to the widget's
+                current geometry
         """
         self.widget = widget
         self.duration = duration
@@ -83,14 +116,19 @@ class ScaleIn:
         self.easing = easing
         
         # Create scale helper
-        self.scale_helper = ScaleAnimationHelper(widget)
+        self.scale_helper = ScaleAnimationHelper(widget, origin_geometry)
         
         # Create animation
-        self.animation = QPropertyAnimation(self.scale_helper, b"scale")
+        self.animation = QVariantAnimation()
         self.animation.setDuration(duration)
         self.animation.setStartValue(start_scale)
         self.animation.setEndValue(end_scale)
-        self.animation.setEasingCurve(easing)
+        self.animation.setEasingCurve(easing_curve(easing))
+        
+        # A bound method is only weakly held by the connection; the partial
+        # keeps the helper alive for as long as the animation, even when
+        # this wrapper is dropped and only the animation is kept
+        self.animation.valueChanged.connect(partial(ScaleAnimationHelper.set_scale, self.scale_helper))
     
     def start(self) -> None:
         """Start the scale in animation."""
@@ -100,12 +138,12 @@ class ScaleIn:
         """Stop the scale in animation."""
         self.animation.stop()
     
-    def get_animation(self) -> QPropertyAnimation:
+    def get_animation(self) -> QVariantAnimation:
         """
-        Get the underlying QPropertyAnimation object.
+        Get the underlying QVariantAnimation object.
         
         Returns:
-            The QPropertyAnimation instance
+            The QVariantAnimation instance
         """
         return self.animation
 
@@ -121,9 +159,13 @@ class ScaleOut:
         >>> animation.start()
     """
     
+    __slots__ = ("widget", "duration", "start_scale", "end_scale", "easing",
+                 "scale_helper", "animation")
+    
     def __init__(self, widget: QWidget, duration: int = 300,
                  start_scale: float = 1.0, end_scale: float = 0.95,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
+                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic,
+                 origin_geometry: Optional[QRect] = None):
         """
         Initialize scale out animation.
         
@@ -133,6 +175,8 @@ class ScaleOut:
             start_scale: Starting scale factor (default 1.0 = 100%)
             end_scale: Ending scale factor (default 0.95 = 95%)
             easing: Easing curve type for the animation
+            origin_geometry: Geometry at scale 1.0, defaults to the widget's
+                current geometry
         """
         self.widget = widget
         self.duration = duration
@@ -141,14 +185,19 @@ class ScaleOut:
         self.easing = easing
         
         # Create scale helper
-        self.scale_helper = ScaleAnimationHelper(widget)
+        self.scale_helper = ScaleAnimationHelper(widget, origin_geometry)
         
         # Create animation
-        self.animation = QPropertyAnimation(self.scale_helper, b"scale")
+        self.animation = QVariantAnimation()
         self.animation.setDuration(duration)
         self.animation.setStartValue(start_scale)
         self.animation.setEndValue(end_scale)
-        self.animation.setEasingCurve(easing)
+        self.animation.setEasingCurve(easing_curve(easing))
+        
+        # A bound method is only weakly held by the connection; the partial
+        # keeps the helper alive for as long as the animation, even when
+        # this wrapper is dropped and only the animation is kept
+        self.animation.valueChanged.connect(partial(ScaleAnimationHelper.set_scale, self.scale_helper))
     
     def start(self) -> None:
         """Start the scale out animation."""
@@ -158,11 +207,11 @@ class ScaleOut:
         """Stop the scale out animation."""
         self.animation.stop()
     
-    def get_animation(self) -> QPropertyAnimation:
+    def get_animation(self) -> QVariantAnimation:
         """
-        Get the underlying QPropertyAnimation object.
+        Get the underlying QVariantAnimation object.
         
         Returns:
-            The QPropertyAnimation instance
+            The QVariantAnimation instance
         """
         return self.animation
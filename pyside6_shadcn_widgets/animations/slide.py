@@ -2,83 +2,82 @@
 Slide animations for PySide6 widgets.
 """
 
+from typing import Optional
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QPoint
 from PySide6.QtWidgets import QWidget
+from pyside6_shadcn_widgets.animations._easing import easing_curve
 
+# Slide distance used when none is given
+DEFAULT_DISTANCE = 50
 
-class SlideInUp:
-    """Slide in from bottom animation."""
+
+class _SlideAnimation:
+    """
+    Shared implementation of the slide animations.
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50, 
-                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
-        """
-        Initialize slide in up animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(QPoint(self.original_pos.x(), self.original_pos.y() + distance))
-        self.animation.setEndValue(self.original_pos)
-        self.animation.setEasingCurve(easing)
+    Subclasses only describe the direction: ``_DX``/``_DY`` give the sign of
+    the offset on each axis, ``_IS_IN`` whether the widget slides from the
+    offset to its position (in) or from its position to the offset (out),
+    and ``_EASING`` the default easing curve. ``_OFFSET`` is derived from the
+    direction for the default distance.
+    """
     
-    def start(self) -> None:
-        """Start the slide in up animation."""
-        self.animation.start()
+    __slots__ = ("widget", "duration", "distance", "easing", "original_pos", "animation")
     
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
+    _DX = 0
+    _DY = 0
+    _IS_IN = True
+    _EASING = QEasingCurve.Type.OutCubic
+    _OFFSET = QPoint()
     
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
-
-
-class SlideInDown:
-    """Slide in from top animation."""
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the offset for the default distance."""
+        super().__init_subclass__(**kwargs)
+        cls._OFFSET = QPoint(cls._DX * DEFAULT_DISTANCE, cls._DY * DEFAULT_DISTANCE)
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
+    def __init__(self, widget: QWidget, duration: int = 300, distance: int = DEFAULT_DISTANCE,
+                 easing: Optional[QEasingCurve.Type] = None, origin: Optional[QPoint] = None):
         """
-        Initialize slide in down animation.
+        Initialize slide animation.
         
         Args:
             widget: The widget to animate
             duration: Animation duration in milliseconds
             distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
+            easing: Easing curve type for the animation, defaults to
+                OutCubic for slide in and InCubic for slide out
+            origin: Position to slide from or back to, defaults to the
+                widget's current position
         """
+        if easing is None:
+            easing = self._EASING
+        
         self.widget = widget
         self.duration = duration
         self.distance = distance
         self.easing = easing
         
         # Store original position
-        self.original_pos = widget.pos()
+        self.original_pos = origin if origin is not None else widget.pos()
+        if distance == DEFAULT_DISTANCE:
+            offset = self._OFFSET
+        else:
+            offset = QPoint(self._DX * distance, self._DY * distance)
+        offset_pos = self.original_pos + offset
         
         # Create animation
         self.animation = QPropertyAnimation(widget, b"pos")
         self.animation.setDuration(duration)
-        self.animation.setStartValue(QPoint(self.original_pos.x(), self.original_pos.y() - distance))
-        self.animation.setEndValue(self.original_pos)
-        self.animation.setEasingCurve(easing)
+        if self._IS_IN:
+            self.animation.setStartValue(offset_pos)
+            self.animation.setEndValue(self.original_pos)
+        else:
+            self.animation.setStartValue(self.original_pos)
+            self.animation.setEndValue(offset_pos)
+        self.animation.setEasingCurve(easing_curve(easing))
     
     def start(self) -> None:
-        """Start the slide in down animation."""
+        """Start the slide animation."""
         self.animation.start()
     
     def stop(self) -> None:
@@ -90,253 +89,73 @@ class SlideInDown:
         return self.animation
 
 
-class SlideInLeft:
-    """Slide in from right animation."""
+class SlideInUp(_SlideAnimation):
+    """Slide in from bottom animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
-        """
-        Initialize slide in left animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(QPoint(self.original_pos.x() + distance, self.original_pos.y()))
-        self.animation.setEndValue(self.original_pos)
-        self.animation.setEasingCurve(easing)
+    __slots__ = ()
     
-    def start(self) -> None:
-        """Start the slide in left animation."""
-        self.animation.start()
+    _DY = 1
+
+
+class SlideInDown(_SlideAnimation):
+    """Slide in from top animation."""
     
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
+    __slots__ = ()
     
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DY = -1
 
 
-class SlideInRight:
-    """Slide in from left animation."""
+class SlideInLeft(_SlideAnimation):
+    """Slide in from right animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
-        """
-        Initialize slide in right animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(QPoint(self.original_pos.x() - distance, self.original_pos.y()))
-        self.animation.setEndValue(self.original_pos)
-        self.animation.setEasingCurve(easing)
+    __slots__ = ()
     
-    def start(self) -> None:
-        """Start the slide in right animation."""
-        self.animation.start()
+    _DX = 1
+
+
+class SlideInRight(_SlideAnimation):
+    """Slide in from left animation."""
     
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
+    __slots__ = ()
     
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DX = -1
 
 
-class SlideOutUp:
+class SlideOutUp(_SlideAnimation):
     """Slide out to top animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
-        """
-        Initialize slide out up animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(self.original_pos)
-        self.animation.setEndValue(QPoint(self.original_pos.x(), self.original_pos.y() - distance))
-        self.animation.setEasingCurve(easing)
-    
-    def start(self) -> None:
-        """Start the slide out up animation."""
-        self.animation.start()
+    __slots__ = ()
     
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
-    
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DY = -1
+    _IS_IN = False
+    _EASING = QEasingCurve.Type.InCubic
 
 
-class SlideOutDown:
+class SlideOutDown(_SlideAnimation):
     """Slide out to bottom animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
-        """
-        Initialize slide out down animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(self.original_pos)
-        self.animation.setEndValue(QPoint(self.original_pos.x(), self.original_pos.y() + distance))
-        self.animation.setEasingCurve(easing)
-    
-    def start(self) -> None:
-        """Start the slide out down animation."""
-        self.animation.start()
+    __slots__ = ()
     
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
-    
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DY = 1
+    _IS_IN = False
+    _EASING = QEasingCurve.Type.InCubic
 
 
-class SlideOutLeft:
+class SlideOutLeft(_SlideAnimation):
     """Slide out to left animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
-        """
-        Initialize slide out left animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(self.original_pos)
-        self.animation.setEndValue(QPoint(self.original_pos.x() - distance, self.original_pos.y()))
-        self.animation.setEasingCurve(easing)
+    __slots__ = ()
     
-    def start(self) -> None:
-        """Start the slide out left animation."""
-        self.animation.start()
-    
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
-    
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DX = -1
+    _IS_IN = False
+    _EASING = QEasingCurve.Type.InCubic
 
 
-class SlideOutRight:
+class SlideOutRight(_SlideAnimation):
     """Slide out to right animation."""
     
-    def __init__(self, widget: QWidget, duration: int = 300, distance: int = 50,
-                 easing: QEasingCurve.Type = QEasingCurve.Type.InCubic):
-        """
-        Initialize slide out right animation.
-        
-        Args:
-            widget: The widget to animate
-            duration: Animation duration in milliseconds
-            distance: Distance to slide in pixels
-            easing: Easing curve type for the animation
-        """
-        self.widget = widget
-        self.duration = duration
-        self.distance = distance
-        self.easing = easing
-        
-        # Store original position
-        self.original_pos = widget.pos()
-        
-        # Create animation
-        self.animation = QPropertyAnimation(widget, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(self.original_pos)
-        self.animation.setEndValue(QPoint(self.original_pos.x() + distance, self.original_pos.y()))
-        self.animation.setEasingCurve(easing)
-    
-    def start(self) -> None:
-        """Start the slide out right animation."""
-        self.animation.start()
-    
-    def stop(self) -> None:
-        """Stop the animation."""
-        self.animation.stop()
+    __slots__ = ()
     
-    def get_animation(self) -> QPropertyAnimation:
-        """Get the underlying QPropertyAnimation object."""
-        return self.animation
+    _DX = 1
+    _IS_IN = False
+    _EASING = QEasingCurve.Type.InCubic
@@ -3,22 +3,37 @@ Components Module
 ~~~~~~~~~~~~~~~~~
 
 Shadcn-inspired UI components for PySide6.
+
+Components are styled by rules added once to the application stylesheet;
+instances only set the dynamic properties those rules match on. Switch is
+painted and has no rules.
+
+Components are resolved lazily (PEP 562), so using ``Button`` does not import
+the other component modules.
 """
 
-from pyside6_shadcn_widgets.components.button import Button
-from pyside6_shadcn_widgets.components.card import Card
-from pyside6_shadcn_widgets.components.input import Input
-from pyside6_shadcn_widgets.components.select import Select
-from pyside6_shadcn_widgets.components.dialog import Dialog
-from pyside6_shadcn_widgets.components.tabs import Tabs
-from pyside6_shadcn_widgets.components.badge import Badge
-from pyside6_shadcn_widgets.components.checkbox import CheckBox
-from pyside6_shadcn_widgets.components.switch import Switch
-from pyside6_shadcn_widgets.components.progress import Progress
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> module that defines it
+_LAZY = {
+    "Button": "button",
+    "Card": "card",
+    "CardContainer": "card",
+    "Input": "input",
+    "Select": "select",
+    "Dialog": "dialog",
+    "Tabs": "tabs",
+    "Badge": "badge",
+    "CheckBox": "checkbox",
+    "Switch": "switch",
+    "Progress": "progress",
+}
 
 __all__ = [
     "Button",
     "Card",
+    "CardContainer",
     "Input",
     "Select",
     "Dialog",
@@ -28,3 +43,34 @@ __all__ = [
     "Switch",
     "Progress",
 ]
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and IDEs; resolved lazily at runtime
+    from pyside6_shadcn_widgets.components.button import Button
+    from pyside6_shadcn_widgets.components.card import Card, CardContainer
+    from pyside6_shadcn_widgets.components.input import Input
+    from pyside6_shadcn_widgets.components.select import Select
+    from pyside6_shadcn_widgets.components.dialog import Dialog
+    from pyside6_shadcn_widgets.components.tabs import Tabs
+    from pyside6_shadcn_widgets.components.badge import Badge
+    from pyside6_shadcn_widgets.components.checkbox import CheckBox
+    from pyside6_shadcn_widgets.components.switch import Switch
+    from pyside6_shadcn_widgets.components.progress import Progress
+
+
+def __getattr__(name: str):
+    """Import the module providing ``name`` on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+    value = getattr(module, name)
+    
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily resolved names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,69 @@
+"""
+Batched property updates for components styled through dynamic properties.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+from PySide6.QtCore import Qt
+
+# Looked up on every _repolish call
+_WA_POLISHED = Qt.WidgetAttribute.WA_WState_Polished
+
+
+class BatchUpdatable:
+    """
+    Mixin letting several property changes share one re-polish and repaint.
+    
+    Components call _repolish after changing a dynamic property their
+    stylesheet matches on. Inside a batch_update block the re-polish is
+    deferred and repaints are held back, so any number of changes cost one
+    style recompute and one repaint when the outermost block exits.
+    
+    Example:
+        >>> with input_field.batch_update():
+        ...     input_field.setPlaceholderText("Email")
+        ...     input_field.set_error(True)
+        ...     input_field.setToolTip("Enter a valid address")
+    """
+    
+    _batch_depth = 0
+    _repolish_pending = False
+    _updates_were_enabled = True
+    
+    @contextmanager
+    def batch_update(self) -> Iterator["BatchUpdatable"]:
+        """
+        Defer re-polishing and repainting until the block exits.
+        
+        Blocks may be nested; only the outermost one applies the changes.
+        
+        Yields:
+            The component itself
+        """
+        if self._batch_depth == 0:
+            self._updates_were_enabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._repolish_pending:
+                    self._repolish_pending = False
+                    self._repolish()
+                
+                # Re-enabling updates repaints the whole widget once
+                self.setUpdatesEnabled(self._updates_were_enabled)
+    
+    def _repolish(self) -> None:
+        """Re-evaluate property selectors now, or when the batch ends."""
+        if self._batch_depth:
+            self._repolish_pending = True
+            return
+        
+        # Property selectors are only re-evaluated on polish
+        if self.testAttribute(_WA_POLISHED):
+            style = self.style()
+            style.unpolish(self)
+            style.polish(self)
@@ -0,0 +1,36 @@
+"""
+Shared colors for the painted parts of the components.
+
+Stylesheet colors stay hsl() strings: they live in the application
+stylesheet, which Qt parses once. Code that paints with QPainter uses the
+QColor constants here instead of building new colors on every paint. The
+constants are shared, so treat them as read-only.
+"""
+
+from typing import List
+from PySide6.QtGui import QColor
+
+# Filled accents, such as the active tab indicator
+PRIMARY = QColor(2, 12, 27)
+
+# Borders and unchecked tracks
+BORDER = QColor(214, 227, 235)
+
+# Thumbs and surfaces
+WHITE = QColor(255, 255, 255)
+
+# Black at every alpha, indexed by alpha (0-255)
+_SHADOW_COLORS: List[QColor] = [QColor(0, 0, 0, alpha) for alpha in range(256)]
+
+
+def shadow_color(alpha: int) -> QColor:
+    """
+    Get the shared black shadow color for an alpha.
+    
+    Args:
+        alpha: Alpha (0-255); values outside the range are clamped
+    
+    Returns:
+        Shared QColor
+    """
+    return _SHADOW_COLORS[max(0, min(alpha, 255))]
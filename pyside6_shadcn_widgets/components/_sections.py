@@ -0,0 +1,65 @@
+"""
+Header, content and footer section helpers shared by Card and Dialog.
+"""
+
+from typing import Tuple, Type
+from PySide6.QtWidgets import QBoxLayout, QLabel, QLayout, QWidget
+
+# Dynamic property marking labels created from a string by replace_only_child
+_TEXT_LABEL = "shadcnTextLabel"
+
+
+def replace_only_child(layout: QLayout, widget_or_text, word_wrap: bool = False) -> None:
+    """
+    Make a widget, or a label for a string, the only item of a section layout.
+    
+    Nothing is rebuilt when the layout already holds that widget, or a label
+    created here for the same text. Replaced widgets are deleted with
+    deleteLater, so a widget may replace itself from one of its own signals.
+    
+    Args:
+        layout: Section layout
+        widget_or_text: QWidget or string for the section
+        word_wrap: Whether a label created for a string wraps its text
+    """
+    current = layout.itemAt(0).widget() if layout.count() == 1 else None
+    
+    if isinstance(widget_or_text, str):
+        if (current is not None and current.property(_TEXT_LABEL)
+                and current.text() == widget_or_text):
+            return
+        widget = QLabel(widget_or_text)
+        widget.setWordWrap(word_wrap)
+        widget.setProperty(_TEXT_LABEL, True)
+    else:
+        if current is widget_or_text:
+            return
+        widget = widget_or_text
+    
+    for item in [layout.takeAt(0) for _ in range(layout.count())]:
+        old = item.widget()
+        if old is not None and old is not widget:
+            old.deleteLater()
+    
+    layout.addWidget(widget)
+
+
+def create_section(layout_type: Type[QBoxLayout], property_name: str,
+                   section: str) -> Tuple[QWidget, QBoxLayout]:
+    """
+    Create an empty section widget with a margin-free layout.
+    
+    Args:
+        layout_type: Box layout class for the section, such as QVBoxLayout
+        property_name: Dynamic property the component's stylesheet matches
+            sections on
+        section: Section name stored in that property
+    
+    Returns:
+        Tuple of (section widget, section layout)
+    """
+    widget = QWidget()
+    widget.setProperty(property_name, section)
+    layout = layout_type(widget)
+    layout.setContentsMargins(0, 0, 0, 0)
+    return widget, layout
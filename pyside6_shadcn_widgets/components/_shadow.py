@@ -0,0 +1,304 @@
+"""
+Painted drop shadows for the components.
+
+A shadow is rendered once into a small nine-slice stamp, cut into corners and
+one-pixel edge strips that are shared by every widget with the same shadow.
+Drawing it costs four corner blits and four tiled strips instead of the
+offscreen render and blur a QGraphicsDropShadowEffect repeats on every
+repaint.
+"""
+
+from typing import Dict, Optional, Tuple
+from PySide6.QtWidgets import QSplitter, QWidget
+from PySide6.QtCore import Qt, QPointF, QRect, QRectF
+from PySide6.QtGui import QPainter, QPixmap
+from pyside6_shadcn_widgets.components._palette import shadow_color
+
+def _render_stamp(radius: int, spread: int, offset_y: int, alpha: int,
+                  dpr: float) -> QPixmap:
+    """
+    Render the nine-slice stamp for a shadow.
+    
+    The stamp holds the shadow of the smallest rounded rectangle that still
+    has a straight row and column, which are stretched to fit larger
+    rectangles. The blur is approximated with stacked translucent rounded
+    rectangles, and the area under the body is cleared so the shadow only
+    shows around it.
+    
+    Args:
+        radius: Corner radius of the shadowed rectangle
+        spread: How far the shadow extends past the rectangle
+        offset_y: Vertical shadow offset
+        alpha: Peak shadow alpha (0-255)
+        dpr: Device pixel ratio of the target screen
+    
+    Returns:
+        Stamp pixmap
+    """
+    margin = spread + offset_y
+    body = QRectF(margin, margin, 2 * radius + 1, 2 * radius + 1 + offset_y)
+    width = int(body.width()) + 2 * margin
+    height = int(body.height()) + 2 * margin
+    
+    pixmap = QPixmap(int(width * dpr), int(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    
+    # Each layer is larger and shares the alpha budget, so overlapping
+    # layers fade out linearly from the body edge
+    layers = max(spread, 1)
+    painter.setBrush(shadow_color(max(alpha // layers, 1)))
+    shadow_rect = body.translated(0, offset_y)
+    for i in range(1, layers + 1):
+        painter.drawRoundedRect(shadow_rect.adjusted(-i, -i, i, i),
+                                radius + i, radius + i)
+    
+    # Clear under the body; it is painted opaque on top anyway
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+    painter.setBrush(Qt.GlobalColor.black)
+    painter.drawRoundedRect(body, radius, radius)
+    painter.end()
+    
+    return pixmap
+
+
+class _Slices:
+    """Stamp corners plus its stretchable middle row and column as strips."""
+    
+    __slots__ = ("stamp", "top", "bottom", "left", "right")
+    
+    def __init__(self, stamp: QPixmap, left: int, top: int, dpr: float):
+        """
+        Cut the edge strips out of a stamp.
+        
+        Args:
+            stamp: Stamp pixmap
+            left: Logical x of the stamp's middle column
+            top: Logical y of the stamp's middle row
+            dpr: Device pixel ratio the stamp was rendered at
+        """
+        self.stamp = stamp
+        
+        width = stamp.width()
+        height = stamp.height()
+        column = round(left * dpr)
+        row = round(top * dpr)
+        step = max(round(dpr), 1)
+        
+        # One logical pixel of the middle column above and below the body,
+        # and of the middle row left and right of it
+        self.top = stamp.copy(QRect(column, 0, step, row))
+        self.bottom = stamp.copy(QRect(column, row + step, step, height - row - step))
+        self.left = stamp.copy(QRect(0, row, column, step))
+        self.right = stamp.copy(QRect(column + step, row, width - column - step, step))
+        for strip in (self.top, self.bottom, self.left, self.right):
+            strip.setDevicePixelRatio(dpr)
+
+
+# Sliced stamps keyed by (radius, spread, offset_y, alpha, dpr); the inputs
+# are small integers, so only a handful of entries ever exist
+_SLICE_CACHE: Dict[Tuple[int, int, int, int, float], _Slices] = {}
+
+
+def _slices(radius: int, spread: int, offset_y: int, alpha: int,
+            dpr: float) -> _Slices:
+    """
+    Get the shared sliced stamp for a shadow, rendering it on first use.
+    
+    Args:
+        radius: Corner radius of the shadowed rectangle
+        spread: How far the shadow extends past the rectangle
+        offset_y: Vertical shadow offset
+        alpha: Peak shadow alpha (0-255)
+        dpr: Device pixel ratio of the target screen
+    
+    Returns:
+        Sliced stamp
+    """
+    key = (radius, spread, offset_y, alpha, dpr)
+    slices = _SLICE_CACHE.get(key)
+    if slices is None:
+        margin = spread + offset_y
+        stamp = _render_stamp(radius, spread, offset_y, alpha, dpr)
+        slices = _SLICE_CACHE[key] = _Slices(stamp, margin + radius,
+                                             margin + radius + offset_y, dpr)
+    return slices
+
+
+def draw_shadow(painter: QPainter, rect: QRectF, radius: int, spread: int,
+                offset_y: int, alpha: int, dpr: float) -> None:
+    """
+    Draw a drop shadow around a rounded rectangle.
+    
+    The corners are copied from the stamp unscaled and the edges are tiled
+    from one-pixel strips; the flat center under the rectangle is never
+    drawn. Nothing is drawn for rectangles too small to hold the corners.
+    
+    Args:
+        painter: Active painter
+        rect: Rectangle casting the shadow, in painter coordinates
+        radius: Corner radius of the rectangle
+        spread: How far the shadow extends past the rectangle
+        offset_y: Vertical shadow offset
+        alpha: Peak shadow alpha (0-255)
+        dpr: Device pixel ratio of the target screen
+    """
+    margin = spread + offset_y
+    
+    # Corner sizes, in logical pixels, either side of the middle row and
+    # column of the stamp
+    left = right = margin + radius
+    top = margin + radius + offset_y
+    bottom = margin + radius
+    
+    target = rect.adjusted(-margin, -margin, margin, margin)
+    middle_w = target.width() - left - right
+    middle_h = target.height() - top - bottom
+    if middle_w < 0 or middle_h < 0:
+        return
+    
+    slices = _slices(radius, spread, offset_y, alpha, dpr)
+    stamp = slices.stamp
+    
+    x, y = target.x(), target.y()
+    x_right = x + left + middle_w
+    y_bottom = y + top + middle_h
+    
+    # Corners, unscaled
+    stamp_right = (left + 1) * dpr
+    stamp_bottom = (top + 1) * dpr
+    painter.drawPixmap(QPointF(x, y), stamp, QRectF(0, 0, left * dpr, top * dpr))
+    painter.drawPixmap(QPointF(x_right, y), stamp,
+                       QRectF(stamp_right, 0, right * dpr, top * dpr))
+    painter.drawPixmap(QPointF(x, y_bottom), stamp,
+                       QRectF(0, stamp_bottom, left * dpr, bottom * dpr))
+    painter.drawPixmap(QPointF(x_right, y_bottom), stamp,
+                       QRectF(stamp_right, stamp_bottom, right * dpr, bottom * dpr))
+    
+    # Edges, tiled from their strips
+    painter.drawTiledPixmap(QRectF(x + left, y, middle_w, top), slices.top)
+    painter.drawTiledPixmap(QRectF(x + left, y_bottom, middle_w, bottom), slices.bottom)
+    painter.drawTiledPixmap(QRectF(x, y + top, left, middle_h), slices.left)
+    painter.drawTiledPixmap(QRectF(x_right, y + top, right, middle_h), slices.right)
+
+
+def _host(target: QWidget) -> Optional[QWidget]:
+    """
+    Get the widget a target's shadow is placed in, beside the target.
+    
+    Args:
+        target: Widget casting the shadow
+    
+    Returns:
+        The target's parent, or None when the shadow cannot be placed there:
+        a parentless target would make the shadow a window of its own, and a
+        QSplitter adopts every child widget as a pane
+    """
+    parent = target.parentWidget()
+    if parent is None or isinstance(parent, QSplitter):
+        return None
+    return parent
+
+
+class DropShadow(QWidget):
+    """
+    Sibling widget painting a drop shadow under another widget.
+    
+    The shadow sits in the target's parent, stacked just below the target,
+    and is kept in place by sync(), which the target calls from its own
+    move, resize, show, hide and parent change handlers.
+    This keeps the target's own size and layout unchanged while still
+    letting the shadow extend past it.
+    
+    Where no shadow can be placed beside the target (see _host), it is kept
+    hidden as a child of the target until the target moves to another
+    parent.
+    
+    Example:
+        >>> shadow = DropShadow(button, radius=8, spread=4, offset_y=2, alpha=30)
+    """
+    
+    def __init__(self, target: QWidget, radius: int, spread: int,
+                 offset_y: int, alpha: int):
+        """
+        Initialize drop shadow.
+        
+        Args:
+            target: Widget casting the shadow
+            radius: Corner radius of the target
+            spread: How far the shadow extends past the target
+            offset_y: Vertical shadow offset
+            alpha: Peak shadow alpha (0-255)
+        """
+        super().__init__(_host(target) or target)
+        
+        self._target = target
+        self._params: Tuple[int, int, int, int] = (radius, spread, offset_y, alpha)
+        self._opacity = 1.0
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        
+        # Deleted with the target, whose parent may outlive it
+        target.destroyed.connect(self.deleteLater)
+        
+        self.sync()
+    
+    def set_params(self, radius: int, spread: int, offset_y: int,
+                   alpha: int) -> None:
+        """
+        Change the shadow shape.
+        
+        Args:
+            radius: Corner radius of the target
+            spread: How far the shadow extends past the target
+            offset_y: Vertical shadow offset
+            alpha: Peak shadow alpha (0-255)
+        """
+        self._params = (radius, spread, offset_y, alpha)
+        self.sync()
+        self.update()
+    
+    def set_opacity(self, opacity: float) -> None:
+        """
+        Fade the shadow, e.g. along with an opacity effect on the target.
+        
+        Args:
+            opacity: Opacity (0.0 to 1.0)
+        """
+        self._opacity = opacity
+        self.update()
+    
+    def sync(self) -> None:
+        """Match the target's parent, geometry, stacking and visibility."""
+        target = self._target
+        parent = _host(target)
+        if parent is None:
+            if self.parentWidget() is not target:
+                self.setParent(target)
+            self.hide()
+            return
+        if self.parentWidget() is not parent:
+            self.setParent(parent)
+        
+        _, spread, offset_y, _ = self._params
+        margin = spread + offset_y
+        self.setGeometry(target.geometry().adjusted(-margin, -margin, margin, margin))
+        self.stackUnder(target)
+        self.setVisible(target.isVisibleTo(parent))
+    
+    def paintEvent(self, event) -> None:
+        """Paint the shadow around the target's rectangle."""
+        if self._opacity <= 0:
+            return
+        
+        radius, spread, offset_y, alpha = self._params
+        margin = spread + offset_y
+        
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        draw_shadow(painter, QRectF(self.rect()).adjusted(margin, margin, -margin, -margin),
+                    radius, spread, offset_y, alpha, self.devicePixelRatioF())
+        painter.end()
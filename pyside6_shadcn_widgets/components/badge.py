@@ -2,16 +2,88 @@
 Badge component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QLabel, QWidget
+from typing import Dict, Optional, Tuple
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
 from PySide6.QtCore import Qt
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._batch import BatchUpdatable
 
+# Variant colors, keyed by the fields of _VARIANT_RULE
+_VARIANT_STYLES: Dict[str, Dict[str, str]] = {
+    "default": {"bg": "hsl(222.2, 47.4%, 11.2%)", "fg": "hsl(210, 40%, 98%)", "border": "none"},
+    "secondary": {"bg": "hsl(210, 40%, 96.1%)", "fg": "hsl(222.2, 47.4%, 11.2%)", "border": "none"},
+    "destructive": {"bg": "hsl(0, 84.2%, 60.2%)", "fg": "hsl(210, 40%, 98%)", "border": "none"},
+    "outline": {"bg": "transparent", "fg": "hsl(222.2, 84%, 4.9%)",
+                "border": "1px solid hsl(214.3, 31.8%, 91.4%)"},
+}
 
-class Badge(QLabel):
+# Size metrics, keyed by the fields of _SIZE_RULE
+_SIZE_STYLES: Dict[str, Dict[str, str]] = {
+    "sm": {"pv": "2px", "ph": "8px", "fs": "11px", "h": "18px"},
+    "md": {"pv": "4px", "ph": "10px", "fs": "12px", "h": "22px"},
+    "lg": {"pv": "6px", "ph": "12px", "fs": "14px", "h": "26px"},
+}
+
+# Shape rules; matched on a property so they outrank container rules
+# such as "Card QFrame" sharing the application stylesheet
+_BASE_RULES = """
+            Badge[pill="false"] {
+                border-radius: 6px;
+                font-weight: 500;
+            }
+            Badge[pill="true"] {
+                border-radius: 12px;
+                font-weight: 500;
+            }
+        """
+
+# Per-value rule templates, filled with str.format_map
+_VARIANT_RULE = """
+            Badge[variant="{name}"] {{
+                background-color: {bg};
+                color: {fg};
+                border: {border};
+            }}
+        """
+_SIZE_RULE = """
+            Badge[badgeSize="{name}"] {{
+                padding: {pv} {ph};
+                font-size: {fs};
+                min-height: {h};
+            }}
+        """
+
+
+def _build_badge_qss() -> str:
+    """
+    Build the application-level badge stylesheet.
+    
+    Variant, size and shape are matched through the badge's dynamic
+    properties, so one rule per value covers every combination.
+    
+    Returns:
+        QSS stylesheet string
+    """
+    rules = [_BASE_RULES]
+    rules.extend(_VARIANT_RULE.format_map({"name": name, **style})
+                 for name, style in _VARIANT_STYLES.items())
+    rules.extend(_SIZE_RULE.format_map({"name": name, **style})
+                 for name, style in _SIZE_STYLES.items())
+    return "".join(rules)
+
+
+BADGE_QSS = _build_badge_qss()
+_global_qss.register("Badge", BADGE_QSS)
+
+
+class Badge(BatchUpdatable, QLabel):
     """
     Badge component with shadcn/ui styling.
     
-    Supports multiple variants and sizes.
+    Supports multiple variants and sizes. Badges are styled by BADGE_QSS,
+    which is added to the application stylesheet when the first badge is
+    created; each badge only carries variant, size and shape as dynamic
+    properties.
     
     Example:
         >>> badge = Badge("New", variant="default", size="md")
@@ -40,70 +112,71 @@ class Badge(QLabel):
             size: Badge size (sm, md, lg)
             pill: Whether to use pill shape (fully rounded)
             parent: Parent widget
+        
+        Raises:
+            ValueError: If variant or size is not one of the supported values
         """
+        # Checked once here; styling is a property lookup in BADGE_QSS
+        if variant not in _VARIANT_STYLES:
+            raise ValueError(f"Unknown badge variant: {variant!r}")
+        if size not in _SIZE_STYLES:
+            raise ValueError(f"Unknown badge size: {size!r}")
+        
         super().__init__(text, parent)
         
         self.variant = variant
         self.size = size
         self.pill = pill
+        self._style_key: Optional[Tuple[str, str, bool]] = None
         
         # Setup badge
         self._setup_ui()
         self._apply_styles()
     
+    def set_variant(self, variant: str) -> None:
+        """
+        Change the badge variant.
+        
+        Args:
+            variant: Badge variant (default, secondary, destructive, outline)
+        
+        Raises:
+            ValueError: If variant is not one of the supported values
+        """
+        if variant not in _VARIANT_STYLES:
+            raise ValueError(f"Unknown badge variant: {variant!r}")
+        self.variant = variant
+        self._apply_styles()
+    
+    @staticmethod
+    def install_stylesheet(app: Optional[QApplication] = None) -> None:
+        """
+        Add BADGE_QSS to the application stylesheet if it is missing.
+        
+        Badges do this on their own when created; call it after replacing
+        the application stylesheet outside of Theme.apply().
+        
+        Args:
+            app: QApplication instance. If None, uses QApplication.instance()
+        """
+        _global_qss.install(app)
+    
     def _setup_ui(self) -> None:
         """Setup badge UI."""
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
     
     def _apply_styles(self) -> None:
-        """Apply QSS styles based on variant and size."""
-        # Determine padding and font size based on size
-        if self.size == self.SIZE_SM:
-            padding_v, padding_h = 2, 8
-            font_size = "11px"
-            height = "18px"
-        elif self.size == self.SIZE_MD:
-            padding_v, padding_h = 4, 10
-            font_size = "12px"
-            height = "22px"
-        elif self.size == self.SIZE_LG:
-            padding_v, padding_h = 6, 12
-            font_size = "14px"
-            height = "26px"
-        
-        # Border radius
-        border_radius = "12px" if self.pill else "6px"
-        
-        # Variant-specific styles
-        if self.variant == self.VARIANT_DEFAULT:
-            bg_color = "hsl(222.2, 47.4%, 11.2%)"
-            text_color = "hsl(210, 40%, 98%)"
-            border = "none"
+        """Expose variant, size and shape as the properties BADGE_QSS matches on."""
+        # Re-polishing is costly, skip it when nothing changed
+        key = (self.variant, self.size, self.pill)
+        if key == self._style_key:
+            return
+        self._style_key = key
         
-        elif self.variant == self.VARIANT_SECONDARY:
-            bg_color = "hsl(210, 40%, 96.1%)"
-            text_color = "hsl(222.2, 47.4%, 11.2%)"
-            border = "none"
+        _global_qss.ensure_installed()
         
-        elif self.variant == self.VARIANT_DESTRUCTIVE:
-            bg_color = "hsl(0, 84.2%, 60.2%)"
-            text_color = "hsl(210, 40%, 98%)"
-            border = "none"
-        
-        elif self.variant == self.VARIANT_OUTLINE:
-            bg_color = "transparent"
-            text_color = "hsl(222.2, 84%, 4.9%)"
-            border = "1px solid hsl(214.3, 31.8%, 91.4%)"
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: {border};
-                border-radius: {border_radius};
-                padding: {padding_v}px {padding_h}px;
-                font-size: {font_size};
-                font-weight: 500;
-                min-height: {height};
-            }}
-        """)
+        # "size" is taken by QWidget's own size property
+        self.setProperty("variant", self.variant)
+        self.setProperty("badgeSize", self.size)
+        self.setProperty("pill", self.pill)
+        self._repolish()
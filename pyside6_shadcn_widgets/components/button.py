@@ -2,18 +2,148 @@
 Button component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QPushButton, QGraphicsDropShadowEffect, QWidget
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property, QSize, Signal
-from PySide6.QtGui import QColor, QCursor
-from PySide6.QtCore import Qt
+from typing import Dict, Optional, Tuple
+from PySide6.QtWidgets import QPushButton, QWidget
+from PySide6.QtGui import QCursor
+from PySide6.QtCore import Qt, QEvent
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._shadow import DropShadow
+
+# Rules per variant, including interaction states
+_VARIANT_RULES = """
+            Button[variant="default"] {
+                background-color: hsl(222.2, 47.4%, 11.2%);
+                color: hsl(210, 40%, 98%);
+                border: none;
+                border-radius: 8px;
+                font-weight: 500;
+            }
+            Button[variant="default"]:hover {
+                background-color: hsl(222.2, 47.4%, 15%);
+            }
+            Button[variant="default"]:pressed {
+                background-color: hsl(222.2, 47.4%, 9%);
+            }
+            Button[variant="default"]:disabled {
+                background-color: hsl(210, 40%, 96.1%);
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            
+            Button[variant="destructive"] {
+                background-color: hsl(0, 84.2%, 60.2%);
+                color: hsl(210, 40%, 98%);
+                border: none;
+                border-radius: 8px;
+                font-weight: 500;
+            }
+            Button[variant="destructive"]:hover {
+                background-color: hsl(0, 84.2%, 55%);
+            }
+            Button[variant="destructive"]:pressed {
+                background-color: hsl(0, 84.2%, 50%);
+            }
+            Button[variant="destructive"]:disabled {
+                background-color: hsl(210, 40%, 96.1%);
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            
+            Button[variant="outline"] {
+                background-color: transparent;
+                color: hsl(222.2, 84%, 4.9%);
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 8px;
+                font-weight: 500;
+            }
+            Button[variant="outline"]:hover {
+                background-color: hsl(210, 40%, 96.1%);
+            }
+            Button[variant="outline"]:pressed {
+                background-color: hsl(210, 40%, 90%);
+            }
+            Button[variant="outline"]:disabled {
+                color: hsl(215.4, 16.3%, 46.9%);
+                border-color: hsl(214.3, 31.8%, 95%);
+            }
+            
+            Button[variant="ghost"] {
+                background-color: transparent;
+                color: hsl(222.2, 84%, 4.9%);
+                border: none;
+                border-radius: 8px;
+                font-weight: 500;
+            }
+            Button[variant="ghost"]:hover {
+                background-color: hsl(210, 40%, 96.1%);
+            }
+            Button[variant="ghost"]:pressed {
+                background-color: hsl(210, 40%, 90%);
+            }
+            Button[variant="ghost"]:disabled {
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            
+            Button[variant="link"] {
+                background-color: transparent;
+                color: hsl(222.2, 47.4%, 11.2%);
+                border: none;
+                font-weight: 500;
+                text-decoration: underline;
+            }
+            Button[variant="link"]:hover {
+                color: hsl(222.2, 47.4%, 20%);
+            }
+            Button[variant="link"]:pressed {
+                color: hsl(222.2, 47.4%, 8%);
+            }
+            Button[variant="link"]:disabled {
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+        """
+
+# Size metrics, keyed by the fields of _SIZE_RULE
+_SIZE_STYLES: Dict[str, Dict[str, str]] = {
+    "sm": {"padding": "6px 12px", "fs": "13px"},
+    "md": {"padding": "8px 16px", "fs": "14px"},
+    "lg": {"padding": "12px 24px", "fs": "16px"},
+}
+
+# Per-size rule template, filled with str.format_map
+_SIZE_RULE = """
+            Button[buttonSize="{name}"] {{
+                padding: {padding};
+                font-size: {fs};
+            }}
+        """
+
+
+def _build_button_qss() -> str:
+    """
+    Build the application-level button stylesheet.
+    
+    Variant and size are matched independently through the button's
+    dynamic properties, so every combination is covered without a rule
+    per pair.
+    
+    Returns:
+        QSS stylesheet string
+    """
+    rules = [_VARIANT_RULES]
+    rules.extend(_SIZE_RULE.format_map({"name": name, **style})
+                 for name, style in _SIZE_STYLES.items())
+    return "".join(rules)
+
+
+BUTTON_QSS = _build_button_qss()
+_global_qss.register("Button", BUTTON_QSS)
 
 
 class Button(QPushButton):
     """
     Modern button component with shadcn/ui styling.
     
-    Supports multiple variants and sizes with smooth hover and click animations.
+    Supports multiple variants and sizes with hover, pressed and disabled
+    states. Buttons are styled by BUTTON_QSS in the application stylesheet;
+    each button only carries its variant and size as dynamic properties.
     
     Example:
         >>> button = Button("Click me", variant="default", size="md")
@@ -32,6 +162,15 @@ class Button(QPushButton):
     SIZE_MD = "md"
     SIZE_LG = "lg"
     
+    # Minimum height per size; padding and font size live in _SIZE_STYLES
+    _HEIGHTS: Dict[str, int] = {SIZE_SM: 32, SIZE_MD: 40, SIZE_LG: 48}
+    
+    # Default shadow of non-ghost/link variants: spread, offset_y, alpha
+    DEFAULT_SHADOW: Tuple[int, int, int] = (4, 2, 20)
+    
+    # Corner radius the shadow follows, matching the QSS border-radius
+    SHADOW_RADIUS = 8
+    
     def __init__(self, text: str = "", variant: str = VARIANT_DEFAULT, 
                  size: str = SIZE_MD, parent: Optional[QWidget] = None):
         """
@@ -48,237 +187,90 @@ class Button(QPushButton):
         self.variant = variant
         self.size = size
         self._loading = False
-        self._scale = 1.0
+        
+        # Created on first show, from _shadow_params
+        self.shadow: Optional[DropShadow] = None
+        self._shadow_params: Optional[Tuple[int, int, int]] = None
         
         # Setup button
         self._setup_ui()
-        self._setup_animations()
         self._apply_styles()
     
     def _setup_ui(self) -> None:
         """Setup button UI elements."""
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         
-        # Set size based on size property
-        if self.size == self.SIZE_SM:
-            self.setMinimumHeight(32)
-            self.setFont(self.font())
-        elif self.size == self.SIZE_MD:
-            self.setMinimumHeight(40)
-        elif self.size == self.SIZE_LG:
-            self.setMinimumHeight(48)
+        # Set size based on size property; unknown sizes keep Qt's default
+        height = self._HEIGHTS.get(self.size)
+        if height is not None:
+            self.setMinimumHeight(height)
         
-        # Add subtle shadow for non-ghost/link variants
+        # Subtle painted shadow for non-ghost/link variants
         if self.variant not in [self.VARIANT_GHOST, self.VARIANT_LINK]:
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(8)
-            shadow.setColor(QColor(0, 0, 0, 30))
-            shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
-    
-    def _setup_animations(self) -> None:
-        """Setup hover and click animations."""
-        # Scale animation for click effect
-        self.scale_animation = QPropertyAnimation(self, b"scale")
-        self.scale_animation.setDuration(150)
-        self.scale_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self._shadow_params = self.DEFAULT_SHADOW
     
-    def _apply_styles(self) -> None:
-        """Apply QSS styles based on variant and size."""
-        # Base styles
-        padding_sm = "6px 12px"
-        padding_md = "8px 16px"
-        padding_lg = "12px 24px"
-        
-        padding = padding_md
-        if self.size == self.SIZE_SM:
-            padding = padding_sm
-            font_size = "13px"
-        elif self.size == self.SIZE_MD:
-            padding = padding_md
-            font_size = "14px"
-        elif self.size == self.SIZE_LG:
-            padding = padding_lg
-            font_size = "16px"
-        
-        # Variant-specific styles
-        if self.variant == self.VARIANT_DEFAULT:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: hsl(222.2, 47.4%, 11.2%);
-                    color: hsl(210, 40%, 98%);
-                    border: none;
-                    border-radius: 8px;
-                    padding: {padding};
-                    font-size: {font_size};
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: hsl(222.2, 47.4%, 15%);
-                }}
-                QPushButton:pressed {{
-                    background-color: hsl(222.2, 47.4%, 9%);
-                }}
-                QPushButton:disabled {{
-                    background-color: hsl(210, 40%, 96.1%);
-                    color: hsl(215.4, 16.3%, 46.9%);
-                }}
-            """)
-        
-        elif self.variant == self.VARIANT_DESTRUCTIVE:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: hsl(0, 84.2%, 60.2%);
-                    color: hsl(210, 40%, 98%);
-                    border: none;
-                    border-radius: 8px;
-                    padding: {padding};
-                    font-size: {font_size};
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: hsl(0, 84.2%, 55%);
-                }}
-                QPushButton:pressed {{
-                    background-color: hsl(0, 84.2%, 50%);
-                }}
-                QPushButton:disabled {{
-                    background-color: hsl(210, 40%, 96.1%);
-                    color: hsl(215.4, 16.3%, 46.9%);
-                }}
-            """)
+    def set_shadow(self, spread: int = 4, offset_y: int = 2, alpha: int = 20) -> None:
+        """
+        Change the button's painted shadow.
         
-        elif self.variant == self.VARIANT_OUTLINE:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: hsl(222.2, 84%, 4.9%);
-                    border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                    border-radius: 8px;
-                    padding: {padding};
-                    font-size: {font_size};
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: hsl(210, 40%, 96.1%);
-                }}
-                QPushButton:pressed {{
-                    background-color: hsl(210, 40%, 90%);
-                }}
-                QPushButton:disabled {{
-                    color: hsl(215.4, 16.3%, 46.9%);
-                    border-color: hsl(214.3, 31.8%, 95%);
-                }}
-            """)
+        Also adds a shadow to ghost and link buttons, which have none by
+        default.
         
-        elif self.variant == self.VARIANT_GHOST:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: hsl(222.2, 84%, 4.9%);
-                    border: none;
-                    border-radius: 8px;
-                    padding: {padding};
-                    font-size: {font_size};
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: hsl(210, 40%, 96.1%);
-                }}
-                QPushButton:pressed {{
-                    background-color: hsl(210, 40%, 90%);
-                }}
-                QPushButton:disabled {{
-                    color: hsl(215.4, 16.3%, 46.9%);
-                }}
-            """)
+        Args:
+            spread: How far the shadow extends past the button
+            offset_y: Vertical shadow offset
+            alpha: Peak shadow alpha (0-255), 0 removes the shadow
+        """
+        self._shadow_params = (spread, offset_y, alpha) if alpha > 0 else None
         
-        elif self.variant == self.VARIANT_LINK:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: hsl(222.2, 47.4%, 11.2%);
-                    border: none;
-                    padding: {padding};
-                    font-size: {font_size};
-                    font-weight: 500;
-                    text-decoration: underline;
-                }}
-                QPushButton:hover {{
-                    color: hsl(222.2, 47.4%, 20%);
-                }}
-                QPushButton:pressed {{
-                    color: hsl(222.2, 47.4%, 8%);
-                }}
-                QPushButton:disabled {{
-                    color: hsl(215.4, 16.3%, 46.9%);
-                }}
-            """)
+        if self._shadow_params is None:
+            if self.shadow is not None:
+                self.shadow.deleteLater()
+                self.shadow = None
+        elif self.shadow is not None:
+            self.shadow.set_params(self.SHADOW_RADIUS, *self._shadow_params)
+        elif self.isVisible():
+            self.shadow = DropShadow(self, self.SHADOW_RADIUS, *self._shadow_params)
     
-    def enterEvent(self, event) -> None:
-        """Handle mouse enter event for hover effect."""
-        super().enterEvent(event)
-        if not self.isEnabled():
-            return
-        
-        # Subtle scale up on hover
-        self.scale_animation.stop()
-        self.scale_animation.setStartValue(self._scale)
-        self.scale_animation.setEndValue(1.02)
-        self.scale_animation.start()
+    def showEvent(self, event) -> None:
+        """Create the shadow the first time the button is shown."""
+        super().showEvent(event)
+        if self.shadow is None and self._shadow_params is not None:
+            self.shadow = DropShadow(self, self.SHADOW_RADIUS, *self._shadow_params)
+        elif self.shadow is not None:
+            self.shadow.sync()
     
-    def leaveEvent(self, event) -> None:
-        """Handle mouse leave event."""
-        super().leaveEvent(event)
-        
-        # Scale back to normal
-        self.scale_animation.stop()
-        self.scale_animation.setStartValue(self._scale)
-        self.scale_animation.setEndValue(1.0)
-        self.scale_animation.start()
+    def hideEvent(self, event) -> None:
+        """Hide the shadow along with the button."""
+        super().hideEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
     
-    def mousePressEvent(self, event) -> None:
-        """Handle mouse press event for click animation."""
-        super().mousePressEvent(event)
-        if not self.isEnabled():
-            return
-        
-        # Scale down on press
-        self.scale_animation.stop()
-        self.scale_animation.setStartValue(self._scale)
-        self.scale_animation.setEndValue(0.98)
-        self.scale_animation.setDuration(100)
-        self.scale_animation.start()
+    def moveEvent(self, event) -> None:
+        """Move the shadow along with the button."""
+        super().moveEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
     
-    def mouseReleaseEvent(self, event) -> None:
-        """Handle mouse release event."""
-        super().mouseReleaseEvent(event)
-        if not self.isEnabled():
-            return
-        
-        # Scale back to hover state
-        self.scale_animation.stop()
-        self.scale_animation.setStartValue(self._scale)
-        self.scale_animation.setEndValue(1.02)
-        self.scale_animation.setDuration(150)
-        self.scale_animation.start()
+    def resizeEvent(self, event) -> None:
+        """Resize the shadow along with the button."""
+        super().resizeEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
     
-    def get_scale(self) -> float:
-        """Get current scale value."""
-        return self._scale
+    def changeEvent(self, event) -> None:
+        """Move the shadow to the button's new parent."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.ParentChange and self.shadow is not None:
+            self.shadow.sync()
     
-    def set_scale(self, scale: float) -> None:
-        """
-        Set scale value and trigger visual update.
+    def _apply_styles(self) -> None:
+        """Expose variant and size as the properties BUTTON_QSS matches on."""
+        _global_qss.ensure_installed()
         
-        Note: Visual scale effect is achieved through the animation's
-        smooth property changes triggering repaints, creating a subtle
-        visual feedback effect.
-        """
-        self._scale = scale
-        self.update()
-    
-    scale = Property(float, get_scale, set_scale)
+        # "size" is taken by QWidget's own size property
+        self.setProperty("variant", self.variant)
+        self.setProperty("buttonSize", self.size)
     
     def set_loading(self, loading: bool) -> None:
         """
@@ -286,7 +278,7 @@ class Button(QPushButton):
         
         Args:
             loading: Whether button is in loading state
-            
+        
         Note: Currently shows "Loading..." text. Spinner animation can be
         added as a future enhancement using QMovie or custom painting.
         """
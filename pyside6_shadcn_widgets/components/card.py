@@ -2,23 +2,84 @@
 Card component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QGraphicsDropShadowEffect
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QColor
+from typing import Optional, Tuple
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLayout
+from PySide6.QtCore import Qt, QEvent, QPropertyAnimation, QEasingCurve, Property, QRectF
+from PySide6.QtGui import QPainter
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._sections import create_section, replace_only_child
+from pyside6_shadcn_widgets.components._shadow import DropShadow, draw_shadow
+
+# Corner radius of the card body, matching the QSS border-radius
+CARD_RADIUS = 12
+
+# Frames inside a card keep the card border, sections are transparent and
+# labels are matched with ".QLabel" so Badge and other subclasses keep
+# their own rules
+CARD_QSS = f"""
+            Card {{
+                background-color: hsl(0, 0%, 100%);
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: {CARD_RADIUS}px;
+            }}
+            Card QWidget {{
+                background-color: transparent;
+            }}
+            Card QFrame {{
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: {CARD_RADIUS}px;
+            }}
+            Card QWidget[cardSection="header"] .QLabel {{
+                color: hsl(222.2, 84%, 4.9%);
+                font-size: 18px;
+                font-weight: 600;
+            }}
+            Card QWidget[cardSection="content"] .QLabel {{
+                color: hsl(222.2, 84%, 4.9%);
+                font-size: 14px;
+            }}
+            Card QWidget[cardSection="footer"] .QLabel {{
+                color: hsl(215.4, 16.3%, 46.9%);
+                font-size: 13px;
+            }}
+        """
+_global_qss.register("Card", CARD_QSS)
+
+
+def _shadow_params(elevation: float) -> Tuple[int, int, int]:
+    """
+    Map an elevation to the card's shadow spread, offset and alpha.
+    
+    Same mapping the previous drop shadow effect used. The elevation is
+    rounded to whole steps first, which keeps an animated card from
+    repainting its shadow on every frame.
+    
+    Args:
+        elevation: Card elevation
+    
+    Returns:
+        Tuple of (spread, offset_y, alpha)
+    """
+    elevation = round(elevation)
+    offset_y = round(1 + elevation / 4)
+    return round((8 + elevation) / 2), offset_y, 15 + elevation * 2
 
 
 class Card(QFrame):
     """
     Card component with header, content, and footer sections.
     
-    Features hover elevation effect and shadcn/ui styling.
+    Features hover elevation effect and shadcn/ui styling. The shadow is
+    painted from a shared stamp by a DropShadow beside the card, so it
+    extends past the card without changing its size; the card and its
+    sections are styled by CARD_QSS in the application stylesheet.
     
     Example:
         >>> card = Card()
         >>> card.set_header("Card Title")
         >>> card.set_content(QLabel("Card content goes here"))
         >>> card.set_footer(QLabel("Card footer"))
+        >>> card.set_all(header="Title", content="Body", footer="Footer")
     """
     
     def __init__(self, parent: Optional[QWidget] = None):
@@ -31,10 +92,17 @@ class Card(QFrame):
         super().__init__(parent)
         
         self._elevation = 2
+        self._shadow_params = _shadow_params(self._elevation)
+        
+        # Created on first show, unless a CardContainer paints the shadow
+        self.shadow: Optional[DropShadow] = None
+        self._shadow_in_container = False
+        
+        # Created on first hover, cards in long lists may never be hovered
+        self.elevation_animation: Optional[QPropertyAnimation] = None
         
         # Setup UI
         self._setup_ui()
-        self._setup_animations()
         self._apply_styles()
     
     def _setup_ui(self) -> None:
@@ -44,34 +112,16 @@ class Card(QFrame):
         self.main_layout.setContentsMargins(16, 16, 16, 16)
         self.main_layout.setSpacing(12)
         
-        # Header section
-        self.header_widget = QWidget()
-        self.header_layout = QVBoxLayout(self.header_widget)
-        self.header_layout.setContentsMargins(0, 0, 0, 0)
-        self.header_widget.hide()
+        # Header and footer sections are created by their first set_* call
+        self.header_widget: Optional[QWidget] = None
+        self.header_layout: Optional[QVBoxLayout] = None
+        self.footer_widget: Optional[QWidget] = None
+        self.footer_layout: Optional[QVBoxLayout] = None
         
         # Content section
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Footer section
-        self.footer_widget = QWidget()
-        self.footer_layout = QVBoxLayout(self.footer_widget)
-        self.footer_layout.setContentsMargins(0, 0, 0, 0)
-        self.footer_widget.hide()
-        
-        # Add sections to main layout
-        self.main_layout.addWidget(self.header_widget)
+        self.content_widget, self.content_layout = create_section(
+            QVBoxLayout, "cardSection", "content")
         self.main_layout.addWidget(self.content_widget)
-        self.main_layout.addWidget(self.footer_widget)
-        
-        # Add shadow effect
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(12)
-        self.shadow.setColor(QColor(0, 0, 0, 20))
-        self.shadow.setOffset(0, 2)
-        self.setGraphicsEffect(self.shadow)
     
     def _setup_animations(self) -> None:
         """Setup hover animation for elevation effect."""
@@ -80,48 +130,9 @@ class Card(QFrame):
         self.elevation_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
     
     def _apply_styles(self) -> None:
-        """Apply QSS styles to card."""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: hsl(0, 0%, 100%);
-                border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 12px;
-            }
-        """)
-        
-        # Style for header
-        self.header_widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-            }
-            QLabel {
-                color: hsl(222.2, 84%, 4.9%);
-                font-size: 18px;
-                font-weight: 600;
-            }
-        """)
-        
-        # Style for content
-        self.content_widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-            }
-            QLabel {
-                color: hsl(222.2, 84%, 4.9%);
-                font-size: 14px;
-            }
-        """)
-        
-        # Style for footer
-        self.footer_widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-            }
-            QLabel {
-                color: hsl(215.4, 16.3%, 46.9%);
-                font-size: 13px;
-            }
-        """)
+        """Make sure CARD_QSS is part of the application stylesheet."""
+        # Sections carry the cardSection property CARD_QSS matches on
+        _global_qss.ensure_installed()
     
     def set_header(self, widget_or_text) -> None:
         """
@@ -130,20 +141,12 @@ class Card(QFrame):
         Args:
             widget_or_text: QWidget or string for header
         """
-        # Clear existing header
-        while self.header_layout.count():
-            item = self.header_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if self.header_widget is None:
+            self.header_widget, self.header_layout = create_section(
+                QVBoxLayout, "cardSection", "header")
+            self.main_layout.insertWidget(0, self.header_widget)
         
-        # Add new header
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            self.header_layout.addWidget(label)
-        else:
-            self.header_layout.addWidget(widget_or_text)
-        
-        self.header_widget.show()
+        replace_only_child(self.header_layout, widget_or_text)
     
     def set_content(self, widget_or_text) -> None:
         """
@@ -152,19 +155,7 @@ class Card(QFrame):
         Args:
             widget_or_text: QWidget or string for content
         """
-        # Clear existing content
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add new content
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            label.setWordWrap(True)
-            self.content_layout.addWidget(label)
-        else:
-            self.content_layout.addWidget(widget_or_text)
+        replace_only_child(self.content_layout, widget_or_text, word_wrap=True)
     
     def set_footer(self, widget_or_text) -> None:
         """
@@ -173,40 +164,115 @@ class Card(QFrame):
         Args:
             widget_or_text: QWidget or string for footer
         """
-        # Clear existing footer
-        while self.footer_layout.count():
-            item = self.footer_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if self.footer_widget is None:
+            self.footer_widget, self.footer_layout = create_section(
+                QVBoxLayout, "cardSection", "footer")
+            self.main_layout.addWidget(self.footer_widget)
+        
+        replace_only_child(self.footer_layout, widget_or_text)
+    
+    def set_all(self, header=None, content=None, footer=None) -> None:
+        """
+        Set header, content, and footer in a single pass.
+        
+        Updates are suspended while the sections are replaced so the card
+        is repainted once. Sections passed as None are left unchanged.
+        
+        Args:
+            header: QWidget or string for header
+            content: QWidget or string for content
+            footer: QWidget or string for footer
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            if header is not None:
+                self.set_header(header)
+            if content is not None:
+                self.set_content(content)
+            if footer is not None:
+                self.set_footer(footer)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _animate_elevation(self, elevation: float) -> None:
+        """
+        Animate elevation from its current value, creating the animation on first use.
         
-        # Add new footer
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            self.footer_layout.addWidget(label)
-        else:
-            self.footer_layout.addWidget(widget_or_text)
+        Args:
+            elevation: Target elevation
+        """
+        if self.elevation_animation is None:
+            self._setup_animations()
         
-        self.footer_widget.show()
+        self.elevation_animation.stop()
+        self.elevation_animation.setStartValue(self._elevation)
+        self.elevation_animation.setEndValue(elevation)
+        self.elevation_animation.start()
     
     def enterEvent(self, event) -> None:
         """Handle mouse enter for hover elevation effect."""
         super().enterEvent(event)
         
         # Increase elevation on hover
-        self.elevation_animation.stop()
-        self.elevation_animation.setStartValue(self._elevation)
-        self.elevation_animation.setEndValue(8)
-        self.elevation_animation.start()
+        self._animate_elevation(8)
     
     def leaveEvent(self, event) -> None:
         """Handle mouse leave."""
         super().leaveEvent(event)
         
         # Decrease elevation
-        self.elevation_animation.stop()
-        self.elevation_animation.setStartValue(self._elevation)
-        self.elevation_animation.setEndValue(2)
-        self.elevation_animation.start()
+        self._animate_elevation(2)
+    
+    def showEvent(self, event) -> None:
+        """Create the shadow the first time the card is shown."""
+        super().showEvent(event)
+        if self.shadow is None and not self._shadow_in_container:
+            self.shadow = DropShadow(self, CARD_RADIUS, *self._shadow_params)
+        elif self.shadow is not None:
+            self.shadow.sync()
+    
+    def hideEvent(self, event) -> None:
+        """Hide the shadow along with the card."""
+        super().hideEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
+    
+    def moveEvent(self, event) -> None:
+        """Move the shadow along with the card."""
+        super().moveEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
+    
+    def resizeEvent(self, event) -> None:
+        """Resize the shadow along with the card."""
+        super().resizeEvent(event)
+        if self.shadow is not None:
+            self.shadow.sync()
+    
+    def changeEvent(self, event) -> None:
+        """Move the shadow to the card's new parent."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.ParentChange and self.shadow is not None:
+            self.shadow.sync()
+    
+    def _paint_shadow(self, painter: QPainter, rect: QRectF) -> None:
+        """
+        Paint the drop shadow for the current elevation.
+        
+        Args:
+            painter: Active painter
+            rect: Card rectangle in painter coordinates
+        """
+        spread, offset_y, alpha = self._shadow_params
+        draw_shadow(painter, rect, CARD_RADIUS, spread, offset_y, alpha,
+                    self.devicePixelRatioF())
+    
+    def _disable_shadow(self) -> None:
+        """Leave the shadow to the CardContainer holding this card."""
+        self._shadow_in_container = True
+        if self.shadow is not None:
+            self.shadow.deleteLater()
+            self.shadow = None
     
     def get_elevation(self) -> float:
         """Get current elevation value."""
@@ -221,13 +287,85 @@ class Card(QFrame):
         """
         self._elevation = elevation
         
-        # Update shadow based on elevation
-        blur_radius = 8 + elevation
-        offset_y = 1 + elevation / 4
-        opacity = 15 + elevation * 2
+        # Only whole elevation steps change the shadow, so most animation
+        # frames need no repaint
+        params = _shadow_params(elevation)
+        if params == self._shadow_params:
+            return
+        old_spread, old_offset_y, _ = self._shadow_params
+        self._shadow_params = params
         
-        self.shadow.setBlurRadius(blur_radius)
-        self.shadow.setOffset(0, offset_y)
-        self.shadow.setColor(QColor(0, 0, 0, int(opacity)))
+        # Shadow is painted by the card's DropShadow, or in the container's
+        # paintEvent for cards added to a CardContainer
+        container = self.parentWidget()
+        if self._shadow_in_container and container is not None:
+            margin = max(old_spread + old_offset_y, params[0] + params[1])
+            container.update(self.geometry().adjusted(-margin, -margin, margin, margin))
+        elif self.shadow is not None:
+            self.shadow.set_params(CARD_RADIUS, *params)
     
     elevation = Property(float, get_elevation, set_elevation)
+
+
+class CardContainer(QWidget):
+    """
+    Container painting the shadows of all its cards in one pass.
+    
+    Cards added with add_card() skip their own shadow; the container draws
+    every card's shadow from its own paintEvent with a single painter,
+    underneath the cards. Shadows extend past the cards, so leave layout
+    spacing and margins for them.
+    
+    Example:
+        >>> container = CardContainer()
+        >>> for title in ("One", "Two", "Three"):
+        ...     card = Card()
+        ...     card.set_header(title)
+        ...     container.add_card(card)
+    """
+    
+    def __init__(self, parent: Optional[QWidget] = None,
+                 layout: Optional[QLayout] = None):
+        """
+        Initialize card container.
+        
+        Args:
+            parent: Parent widget
+            layout: Layout arranging the cards. If None, cards are stacked
+                in a QVBoxLayout with room for their shadows
+        """
+        super().__init__(parent)
+        
+        if layout is None:
+            # Room for the shadow of a hovered card between and around cards
+            layout = QVBoxLayout()
+            layout.setContentsMargins(12, 12, 12, 12)
+            layout.setSpacing(12)
+        
+        self.cards_layout = layout
+        self.setLayout(self.cards_layout)
+    
+    def add_card(self, card: Card, *args) -> None:
+        """
+        Add a card to the container's layout.
+        
+        Args:
+            card: Card to add
+            *args: Extra arguments for the layout's addWidget, such as
+                row and column for a QGridLayout
+        """
+        card._disable_shadow()
+        self.cards_layout.addWidget(card, *args)
+    
+    def paintEvent(self, event) -> None:
+        """Paint the shadows of the cards intersecting the update region."""
+        region = event.rect()
+        painter = QPainter(self)
+        for card in self.findChildren(Card, options=Qt.FindChildOption.FindDirectChildrenOnly):
+            geometry = card.geometry()
+            spread, offset_y, _ = card._shadow_params
+            margin = spread + offset_y
+            outer = geometry.adjusted(-margin, -margin, margin, margin)
+            if card._shadow_in_container and card.isVisible() and outer.intersects(region):
+                card._paint_shadow(painter, QRectF(geometry))
+        painter.end()
@@ -4,9 +4,40 @@ CheckBox component for PySide6 Shadcn Widgets.
 
 from typing import Optional
 from PySide6.QtWidgets import QCheckBox, QWidget
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QPainter, QColor, QPen, QPainterPath
-from PySide6.QtCore import QRect, QPoint
+from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property
+from pyside6_shadcn_widgets import _global_qss
+
+# Matched on the class name, so plain QCheckBoxes keep the theme's rules
+CHECKBOX_QSS = """
+            CheckBox {
+                color: hsl(222.2, 84%, 4.9%);
+                spacing: 8px;
+                font-size: 14px;
+            }
+            CheckBox::indicator {
+                width: 20px;
+                height: 20px;
+                border: 2px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 4px;
+                background-color: hsl(0, 0%, 100%);
+            }
+            CheckBox::indicator:hover {
+                border-color: hsl(222.2, 84%, 4.9%);
+            }
+            CheckBox::indicator:checked {
+                background-color: hsl(222.2, 47.4%, 11.2%);
+                border-color: hsl(222.2, 47.4%, 11.2%);
+            }
+            CheckBox::indicator:indeterminate {
+                background-color: hsl(222.2, 47.4%, 11.2%);
+                border-color: hsl(222.2, 47.4%, 11.2%);
+            }
+            CheckBox::indicator:disabled {
+                background-color: hsl(210, 40%, 96.1%);
+                border-color: hsl(214.3, 31.8%, 95%);
+            }
+        """
+_global_qss.register("CheckBox", CHECKBOX_QSS)
 
 
 class CheckBox(QCheckBox):
@@ -14,6 +45,7 @@ class CheckBox(QCheckBox):
     Custom checkbox with modern styling and check animation.
     
     Features smooth check mark animation and indeterminate state support.
+    Checkboxes are styled by CHECKBOX_QSS in the application stylesheet.
     
     Example:
         >>> checkbox = CheckBox("Accept terms")
@@ -32,8 +64,10 @@ class CheckBox(QCheckBox):
         
         self._check_progress = 0.0
         
+        # Created on the first user toggle
+        self.check_animation: Optional[QPropertyAnimation] = None
+        
         # Setup checkbox
-        self._setup_animations()
         self._apply_styles()
     
     def _setup_animations(self) -> None:
@@ -43,41 +77,16 @@ class CheckBox(QCheckBox):
         self.check_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
     
     def _apply_styles(self) -> None:
-        """Apply QSS styles to checkbox."""
-        self.setStyleSheet("""
-            QCheckBox {
-                color: hsl(222.2, 84%, 4.9%);
-                spacing: 8px;
-                font-size: 14px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 4px;
-                background-color: hsl(0, 0%, 100%);
-            }
-            QCheckBox::indicator:hover {
-                border-color: hsl(222.2, 84%, 4.9%);
-            }
-            QCheckBox::indicator:checked {
-                background-color: hsl(222.2, 47.4%, 11.2%);
-                border-color: hsl(222.2, 47.4%, 11.2%);
-            }
-            QCheckBox::indicator:indeterminate {
-                background-color: hsl(222.2, 47.4%, 11.2%);
-                border-color: hsl(222.2, 47.4%, 11.2%);
-            }
-            QCheckBox::indicator:disabled {
-                background-color: hsl(210, 40%, 96.1%);
-                border-color: hsl(214.3, 31.8%, 95%);
-            }
-        """)
+        """Make sure CHECKBOX_QSS is part of the application stylesheet."""
+        _global_qss.ensure_installed()
     
     def nextCheckState(self) -> None:
         """Handle check state change with animation."""
         super().nextCheckState()
         
+        if self.check_animation is None:
+            self._setup_animations()
+        
         if self.isChecked():
             # Animate check in
             self.check_animation.stop()
@@ -3,18 +3,90 @@ Dialog/Modal component for PySide6 Shadcn Widgets.
 """
 
 from typing import Optional
-from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, Signal
-from PySide6.QtWidgets import QGraphicsOpacityEffect, QGraphicsDropShadowEffect
-from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QHBoxLayout, QFrame
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, Signal, Property
+from PySide6.QtWidgets import QGraphicsOpacityEffect
+from PySide6.QtGui import QPainter
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._palette import shadow_color
+from pyside6_shadcn_widgets.components._sections import create_section, replace_only_child
+from pyside6_shadcn_widgets.components._shadow import DropShadow
+
+# Frames inside the content container share its background, section labels
+# are matched with ".QLabel" so Badge and other subclasses keep their rules
+DIALOG_QSS = """
+            Dialog QFrame {
+                background-color: hsl(0, 0%, 100%);
+                border-radius: 12px;
+            }
+            Dialog QWidget[dialogSection="header"] .QLabel {
+                color: hsl(222.2, 84%, 4.9%);
+                font-size: 18px;
+                font-weight: 600;
+            }
+            Dialog QWidget[dialogSection="content"] .QLabel {
+                color: hsl(222.2, 84%, 4.9%);
+                font-size: 14px;
+            }
+        """
+_global_qss.register("Dialog", DIALOG_QSS)
+
+# Backdrop alpha once faded in, the former rgba(0, 0, 0, 0.5)
+BACKDROP_ALPHA = 127
+
+
+class _Backdrop(QWidget):
+    """
+    Dimming layer behind the dialog content, closing the dialog on click.
+    
+    Fills itself with black at an animatable alpha, so fading it in costs
+    one fill per frame instead of an offscreen opacity effect over the
+    whole backdrop.
+    """
+    
+    def __init__(self, parent: QWidget):
+        """
+        Initialize backdrop.
+        
+        Args:
+            parent: Dialog owning the backdrop
+        """
+        super().__init__(parent)
+        self._alpha = BACKDROP_ALPHA
+    
+    def paintEvent(self, event) -> None:
+        """Fill the backdrop with its current alpha."""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), shadow_color(self._alpha))
+        painter.end()
+    
+    def mousePressEvent(self, event) -> None:
+        """Close the dialog when the backdrop is clicked."""
+        self.parentWidget().close()
+    
+    def get_alpha(self) -> int:
+        """Get current backdrop alpha."""
+        return self._alpha
+    
+    def set_alpha(self, alpha: int) -> None:
+        """
+        Set backdrop alpha.
+        
+        Args:
+            alpha: Alpha value (0-255)
+        """
+        self._alpha = alpha
+        self.update()
+    
+    alpha = Property(int, get_alpha, set_alpha)
 
 
 class Dialog(QDialog):
     """
     Modern dialog/modal with backdrop and smooth animations.
     
-    Features fade and scale entrance animations, backdrop click to close,
-    and header, content, footer sections.
+    Features a fade-in entrance animation, backdrop click to close, and
+    header, content, footer sections.
     
     Example:
         >>> dialog = Dialog()
@@ -41,100 +113,59 @@ class Dialog(QDialog):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         self._setup_ui()
-        self._setup_animations()
+        
+        # Effects and animations are created on first show
+        self.entrance_group: Optional[QParallelAnimationGroup] = None
     
     def _setup_ui(self) -> None:
-        """Setup dialog UI structure."""
+        """Setup dialog UI structure, styled by DIALOG_QSS."""
+        _global_qss.ensure_installed()
+        
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Backdrop
-        self.backdrop = QFrame(self)
-        self.backdrop.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 0, 0, 0.5);
-            }
-        """)
-        self.backdrop.mousePressEvent = lambda e: self.close()
+        self.backdrop = _Backdrop(self)
         
         # Content container
         self.content_container = QFrame(self)
-        self.content_container.setStyleSheet("""
-            QFrame {
-                background-color: hsl(0, 0%, 100%);
-                border-radius: 12px;
-            }
-        """)
         self.content_container.setMinimumWidth(400)
         self.content_container.setMaximumWidth(600)
         
-        # Add shadow to content container
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(24)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 8)
-        self.content_container.setGraphicsEffect(shadow)
-        
-        # Content layout
-        content_layout = QVBoxLayout(self.content_container)
-        content_layout.setContentsMargins(24, 24, 24, 24)
-        content_layout.setSpacing(16)
-        
-        # Header section
-        self.header_widget = QWidget()
-        self.header_layout = QVBoxLayout(self.header_widget)
-        self.header_layout.setContentsMargins(0, 0, 0, 0)
-        self.header_widget.setStyleSheet("""
-            QLabel {
-                color: hsl(222.2, 84%, 4.9%);
-                font-size: 18px;
-                font-weight: 600;
-            }
-        """)
-        self.header_widget.hide()
-        
-        # Content section
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_widget.setStyleSheet("""
-            QLabel {
-                color: hsl(222.2, 84%, 4.9%);
-                font-size: 14px;
-            }
-        """)
+        # Add painted shadow to content container, drawn beside it so the
+        # entrance opacity effect does not replace it; the entrance fades it
+        # with the content
+        self.content_shadow = DropShadow(self.content_container, radius=12,
+                                         spread=12, offset_y=8, alpha=48)
         
-        # Footer section
-        self.footer_widget = QWidget()
-        self.footer_layout = QHBoxLayout(self.footer_widget)
-        self.footer_layout.setContentsMargins(0, 0, 0, 0)
-        self.footer_widget.hide()
+        # Content layout, the sections are added to it
+        self._sections_layout = QVBoxLayout(self.content_container)
+        self._sections_layout.setContentsMargins(24, 24, 24, 24)
+        self._sections_layout.setSpacing(16)
         
-        # Add sections
-        content_layout.addWidget(self.header_widget)
-        content_layout.addWidget(self.content_widget)
-        content_layout.addWidget(self.footer_widget)
+        # Header and footer sections are created by their first set_* call
+        self.header_widget: Optional[QWidget] = None
+        self.header_layout: Optional[QVBoxLayout] = None
+        self.footer_widget: Optional[QWidget] = None
+        self.footer_layout: Optional[QHBoxLayout] = None
         
-        # Layout for centering content container
-        center_layout = QVBoxLayout()
-        center_layout.addStretch()
-        center_layout.addWidget(self.content_container, alignment=Qt.AlignmentFlag.AlignCenter)
-        center_layout.addStretch()
+        # Content section
+        self.content_widget, self.content_layout = create_section(
+            QVBoxLayout, "dialogSection", "content")
+        self._sections_layout.addWidget(self.content_widget)
         
-        main_layout.addLayout(center_layout)
+        # Center content container; the alignment centers it both ways
+        main_layout.addWidget(self.content_container, 0, Qt.AlignmentFlag.AlignCenter)
     
     def _setup_animations(self) -> None:
         """Setup entrance and exit animations."""
-        # Backdrop fade animation
-        self.backdrop_effect = QGraphicsOpacityEffect(self.backdrop)
-        self.backdrop.setGraphicsEffect(self.backdrop_effect)
-        
-        self.backdrop_animation = QPropertyAnimation(self.backdrop_effect, b"opacity")
+        # Backdrop fade animation, painted by the backdrop itself
+        self.backdrop_animation = QPropertyAnimation(self.backdrop, b"alpha")
         self.backdrop_animation.setDuration(300)
         self.backdrop_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
-        # Content scale animation
+        # Content fade animation; the effect is only enabled while it runs
         self.content_effect = QGraphicsOpacityEffect(self.content_container)
         self.content_container.setGraphicsEffect(self.content_effect)
         
@@ -142,10 +173,15 @@ class Dialog(QDialog):
         self.content_fade.setDuration(300)
         self.content_fade.setEasingCurve(QEasingCurve.Type.OutCubic)
         
+        # The shadow is drawn beside the content, outside the effect, so it
+        # follows the fade separately
+        self.content_fade.valueChanged.connect(self.content_shadow.set_opacity)
+        
         # Combined animation group
         self.entrance_group = QParallelAnimationGroup()
         self.entrance_group.addAnimation(self.backdrop_animation)
         self.entrance_group.addAnimation(self.content_fade)
+        self.entrance_group.finished.connect(self._finish_entrance)
     
     def showEvent(self, event) -> None:
         """Handle show event with entrance animation."""
@@ -155,15 +191,27 @@ class Dialog(QDialog):
         if self.parent():
             self.backdrop.setGeometry(self.rect())
         
+        if self.entrance_group is None:
+            self._setup_animations()
+        
         # Animate entrance
-        self.backdrop_animation.setStartValue(0.0)
-        self.backdrop_animation.setEndValue(1.0)
+        self.backdrop_animation.setStartValue(0)
+        self.backdrop_animation.setEndValue(BACKDROP_ALPHA)
         
         self.content_fade.setStartValue(0.0)
         self.content_fade.setEndValue(1.0)
         
+        self.content_effect.setEnabled(True)
+        self.content_shadow.set_opacity(0.0)
+        self.content_shadow.sync()
         self.entrance_group.start()
     
+    def _finish_entrance(self) -> None:
+        """Disable the content opacity effect once the content is opaque."""
+        # A disabled effect is bypassed, so later repaints of the content
+        # are no longer rendered offscreen first
+        self.content_effect.setEnabled(False)
+    
     def closeEvent(self, event) -> None:
         """Handle close event."""
         self.closed.emit()
@@ -176,20 +224,12 @@ class Dialog(QDialog):
         Args:
             widget_or_text: QWidget or string for header
         """
-        # Clear existing header
-        while self.header_layout.count():
-            item = self.header_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if self.header_widget is None:
+            self.header_widget, self.header_layout = create_section(
+                QVBoxLayout, "dialogSection", "header")
+            self._sections_layout.insertWidget(0, self.header_widget)
         
-        # Add new header
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            self.header_layout.addWidget(label)
-        else:
-            self.header_layout.addWidget(widget_or_text)
-        
-        self.header_widget.show()
+        replace_only_child(self.header_layout, widget_or_text)
     
     def set_content(self, widget_or_text) -> None:
         """
@@ -198,19 +238,7 @@ class Dialog(QDialog):
         Args:
             widget_or_text: QWidget or string for content
         """
-        # Clear existing content
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add new content
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            label.setWordWrap(True)
-            self.content_layout.addWidget(label)
-        else:
-            self.content_layout.addWidget(widget_or_text)
+        replace_only_child(self.content_layout, widget_or_text, word_wrap=True)
     
     def set_footer(self, widget_or_text) -> None:
         """
@@ -219,22 +247,17 @@ class Dialog(QDialog):
         Args:
             widget_or_text: QWidget or string for footer
         """
-        # Clear existing footer
-        while self.footer_layout.count():
-            item = self.footer_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add new footer
-        if isinstance(widget_or_text, str):
-            label = QLabel(widget_or_text)
-            self.footer_layout.addWidget(label)
-        else:
-            self.footer_layout.addWidget(widget_or_text)
+        if self.footer_widget is None:
+            self.footer_widget, self.footer_layout = create_section(
+                QHBoxLayout, "dialogSection", "footer")
+            self._sections_layout.addWidget(self.footer_widget)
         
-        self.footer_widget.show()
+        replace_only_child(self.footer_layout, widget_or_text)
     
     def resizeEvent(self, event) -> None:
-        """Handle resize event to adjust backdrop."""
+        """Handle resize event to adjust backdrop and content shadow."""
         super().resizeEvent(event)
         self.backdrop.setGeometry(self.rect())
+        
+        # The layout has already placed the content for the new size
+        self.content_shadow.sync()
@@ -3,16 +3,56 @@ Input component for PySide6 Shadcn Widgets.
 """
 
 from typing import Optional
-from PySide6.QtWidgets import QLineEdit, QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, Property
-from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QLineEdit, QWidget
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._batch import BatchUpdatable
+
+# Both states are matched on the error property; its (0,1,1) specificity
+# outranks the theme's QLineEdit rules and container rules such as
+# "Card QWidget" sharing the application stylesheet
+INPUT_QSS = """
+            Input[error="false"] {
+                background-color: hsl(0, 0%, 100%);
+                color: hsl(222.2, 84%, 4.9%);
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-size: 14px;
+                min-height: 40px;
+            }
+            Input[error="false"]:focus {
+                border: 2px solid hsl(222.2, 84%, 4.9%);
+            }
+            Input[error="false"]:disabled {
+                background-color: hsl(210, 40%, 96.1%);
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            Input[error="false"]::placeholder {
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            Input[error="true"] {
+                background-color: hsl(0, 0%, 100%);
+                color: hsl(222.2, 84%, 4.9%);
+                border: 2px solid hsl(0, 84.2%, 60.2%);
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-size: 14px;
+                min-height: 40px;
+            }
+            Input[error="true"]:focus {
+                border: 2px solid hsl(0, 84.2%, 50%);
+            }
+        """
+_global_qss.register("Input", INPUT_QSS)
 
 
-class Input(QLineEdit):
+class Input(BatchUpdatable, QLineEdit):
     """
     Modern input component with shadcn/ui styling.
     
-    Features focus animations, error states, and optional icon support.
+    Features focus styling, error states, and optional icon support.
+    Inputs are styled by INPUT_QSS in the application stylesheet; each
+    input only carries its error state as a dynamic property.
     
     Example:
         >>> input_field = Input(placeholder="Enter your name")
@@ -30,42 +70,22 @@ class Input(QLineEdit):
         super().__init__(parent)
         
         self._has_error = False
-        self._border_width = 1
+        self._style_key: Optional[bool] = None
         
         # Setup input
         self.setPlaceholderText(placeholder)
-        self._setup_animations()
         self._apply_styles()
     
-    def _setup_animations(self) -> None:
-        """Setup focus animation for border."""
-        self.border_animation = QPropertyAnimation(self, b"borderWidth")
-        self.border_animation.setDuration(200)
-        self.border_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-    
     def _apply_styles(self) -> None:
-        """Apply QSS styles to input."""
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: hsl(0, 0%, 100%);
-                color: hsl(222.2, 84%, 4.9%);
-                border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                min-height: 40px;
-            }
-            QLineEdit:focus {
-                border: 2px solid hsl(222.2, 84%, 4.9%);
-            }
-            QLineEdit:disabled {
-                background-color: hsl(210, 40%, 96.1%);
-                color: hsl(215.4, 16.3%, 46.9%);
-            }
-            QLineEdit::placeholder {
-                color: hsl(215.4, 16.3%, 46.9%);
-            }
-        """)
+        """Expose the error state as the property INPUT_QSS matches on."""
+        # Re-polishing is costly, skip it when nothing changed
+        if self._has_error == self._style_key:
+            return
+        self._style_key = self._has_error
+        
+        _global_qss.ensure_installed()
+        self.setProperty("error", self._has_error)
+        self._repolish()
     
     def set_error(self, has_error: bool) -> None:
         """
@@ -74,25 +94,11 @@ class Input(QLineEdit):
         Args:
             has_error: Whether input has an error
         """
+        # Validators may call this on every keystroke
+        if has_error == self._has_error:
+            return
         self._has_error = has_error
-        
-        if has_error:
-            self.setStyleSheet("""
-                QLineEdit {
-                    background-color: hsl(0, 0%, 100%);
-                    color: hsl(222.2, 84%, 4.9%);
-                    border: 2px solid hsl(0, 84.2%, 60.2%);
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    min-height: 40px;
-                }
-                QLineEdit:focus {
-                    border: 2px solid hsl(0, 84.2%, 50%);
-                }
-            """)
-        else:
-            self._apply_styles()
+        self._apply_styles()
     
     def has_error(self) -> bool:
         """
@@ -102,41 +108,3 @@ class Input(QLineEdit):
             True if input has error, False otherwise
         """
         return self._has_error
-    
-    def focusInEvent(self, event) -> None:
-        """Handle focus in event with animation."""
-        super().focusInEvent(event)
-        
-        if not self._has_error:
-            # Animate border width
-            self.border_animation.stop()
-            self.border_animation.setStartValue(self._border_width)
-            self.border_animation.setEndValue(2)
-            self.border_animation.start()
-    
-    def focusOutEvent(self, event) -> None:
-        """Handle focus out event."""
-        super().focusOutEvent(event)
-        
-        if not self._has_error:
-            # Animate border back to normal
-            self.border_animation.stop()
-            self.border_animation.setStartValue(self._border_width)
-            self.border_animation.setEndValue(1)
-            self.border_animation.start()
-    
-    def get_border_width(self) -> int:
-        """Get current border width."""
-        return self._border_width
-    
-    def set_border_width(self, width: int) -> None:
-        """
-        Set border width.
-        
-        Args:
-            width: Border width in pixels
-        """
-        self._border_width = width
-        self.update()
-    
-    borderWidth = Property(int, get_border_width, set_border_width)
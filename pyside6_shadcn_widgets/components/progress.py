@@ -2,17 +2,69 @@
 Progress component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QProgressBar, QWidget
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QTimer
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QLinearGradient
+from typing import Dict, Optional
+from PySide6.QtWidgets import (
+    QApplication, QProgressBar, QStyle, QStyleOptionProgressBar, QStylePainter, QWidget
+)
+from PySide6.QtCore import Qt, QAbstractAnimation, QVariantAnimation, QEasingCurve, QTimer
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._batch import BatchUpdatable
 
+# Chunk color per variant
+_VARIANT_COLORS: Dict[str, str] = {
+    "default": "hsl(222.2, 47.4%, 11.2%)",
+    "success": "hsl(142, 71%, 45%)",
+    "warning": "hsl(38, 92%, 50%)",
+    "destructive": "hsl(0, 84.2%, 60.2%)",
+}
 
-class Progress(QProgressBar):
+# Per-variant rule template, filled with str.format_map; the variant
+# property lifts it above the theme's QProgressBar rules and container
+# rules such as "Card QWidget"
+_VARIANT_RULE = """
+            Progress[variant="{name}"] {{
+                border: none;
+                border-radius: 4px;
+                background-color: hsl(210, 40%, 96.1%);
+                text-align: center;
+            }}
+            Progress[variant="{name}"]::chunk {{
+                background-color: {color};
+                border-radius: 4px;
+            }}
+        """
+
+
+def _build_progress_qss() -> str:
+    """
+    Build the application-level progress stylesheet.
+    
+    Returns:
+        QSS stylesheet string
+    """
+    return "".join(_VARIANT_RULE.format_map({"name": name, "color": color})
+                   for name, color in _VARIANT_COLORS.items())
+
+
+PROGRESS_QSS = _build_progress_qss()
+_global_qss.register("Progress", PROGRESS_QSS)
+
+# Length of one indeterminate cycle, in milliseconds
+_INDETERMINATE_DURATION = 800
+
+# Application states in which nothing is on screen to animate
+_HIDDEN_STATES = frozenset({
+    Qt.ApplicationState.ApplicationHidden,
+    Qt.ApplicationState.ApplicationSuspended,
+})
+
+
+class Progress(BatchUpdatable, QProgressBar):
     """
     Modern progress bar with smooth value transitions.
     
     Features smooth value changes, indeterminate/loading animation, and color variants.
+    Progress bars are styled by PROGRESS_QSS in the application stylesheet.
     
     Example:
         >>> progress = Progress()
@@ -37,74 +89,124 @@ class Progress(QProgressBar):
         super().__init__(parent)
         
         self.variant = variant
-        self._animated_value = 0
         self._indeterminate = False
         self._indeterminate_position = 0.0
+        self._indeterminate_frame = -1
+        self._frames_per_cycle = 0
+        
+        # Value currently drawn; trails value() while the value animation runs
+        self._display_value = 0
         
         # Setup progress bar
         self.setMinimum(0)
         self.setMaximum(100)
+        super().setValue(0)
         self.setTextVisible(False)
         self.setFixedHeight(8)
         
         self._setup_animations()
+        self.set_fps(30)
         self._apply_styles()
     
     def _setup_animations(self) -> None:
         """Setup value change animation."""
-        self.value_animation = QPropertyAnimation(self, b"animatedValue")
+        # Steps the drawn value only, value() is updated by setValue itself
+        self.value_animation = QVariantAnimation(self)
         self.value_animation.setDuration(300)
         self.value_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.value_animation.valueChanged.connect(self._step_value)
+        
+        # Coalesces setValue calls into one animation restart per event loop
+        # pass
+        self._value_timer = QTimer(self)
+        self._value_timer.setSingleShot(True)
+        self._value_timer.setInterval(0)
+        self._value_timer.timeout.connect(self._animate_to_value)
+        
+        # Indeterminate animation, stepped by Qt's shared animation timer
+        # together with every other running animation
+        self.indeterminate_animation = QVariantAnimation(self)
+        self.indeterminate_animation.setStartValue(0.0)
+        self.indeterminate_animation.setEndValue(1.0)
+        self.indeterminate_animation.setDuration(_INDETERMINATE_DURATION)
+        self.indeterminate_animation.setLoopCount(-1)
+        self.indeterminate_animation.valueChanged.connect(self._update_indeterminate)
         
-        # Indeterminate animation timer
-        self.indeterminate_timer = QTimer(self)
-        self.indeterminate_timer.timeout.connect(self._update_indeterminate)
-        self.indeterminate_timer.setInterval(16)  # ~60 FPS
+        # Paused while the application is hidden or suspended
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._sync_indeterminate_animation)
     
     def _apply_styles(self) -> None:
-        """Apply QSS styles based on variant."""
-        # Get color based on variant
-        if self.variant == self.VARIANT_DEFAULT:
-            progress_color = "hsl(222.2, 47.4%, 11.2%)"
-        elif self.variant == self.VARIANT_SUCCESS:
-            progress_color = "hsl(142, 71%, 45%)"
-        elif self.variant == self.VARIANT_WARNING:
-            progress_color = "hsl(38, 92%, 50%)"
-        elif self.variant == self.VARIANT_DESTRUCTIVE:
-            progress_color = "hsl(0, 84.2%, 60.2%)"
-        else:
-            progress_color = "hsl(222.2, 47.4%, 11.2%)"
+        """Expose the variant as the property PROGRESS_QSS matches on."""
+        _global_qss.ensure_installed()
         
-        self.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                background-color: hsl(210, 40%, 96.1%);
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {progress_color};
-                border-radius: 4px;
-            }}
-        """)
+        # Unknown variants fall back to the default color
+        variant = self.variant if self.variant in _VARIANT_COLORS else self.VARIANT_DEFAULT
+        self.setProperty("variant", variant)
     
     def setValue(self, value: int) -> None:
         """
         Set progress value with smooth animation.
         
+        value() and valueChanged update immediately, as for QProgressBar; only
+        the drawn bar animates. Calls made before control returns to the
+        event loop restart the animation once, towards the last value.
+        
         Args:
             value: Progress value (0-100)
         """
         if self._indeterminate:
             return
         
+        super().setValue(value)
+        if not self._value_timer.isActive():
+            self._value_timer.start()
+    
+    def _animate_to_value(self) -> None:
+        """Animate the drawn value to value()."""
+        value = self.value()
+        if self._indeterminate:
+            return
+        
+        # Already there, or already heading there
+        animation = self.value_animation
+        if animation.state() == QAbstractAnimation.State.Running:
+            if animation.endValue() == value:
+                return
+        elif value == self._display_value:
+            return
+        
         # Animate to new value
-        self.value_animation.stop()
-        self.value_animation.setStartValue(self._animated_value)
-        self.value_animation.setEndValue(value)
-        self.value_animation.start()
+        animation.stop()
+        animation.setStartValue(self._display_value)
+        animation.setEndValue(value)
+        animation.start()
+    
+    def _step_value(self, value: int) -> None:
+        """
+        Show one frame of the value animation.
         
-        super().setValue(value)
+        Args:
+            value: Interpolated value (0-100)
+        """
+        if value != self._display_value:
+            self._display_value = value
+            self.update()
+    
+    def paintEvent(self, event) -> None:
+        """Draw the bar at the animated value rather than value()."""
+        if self._display_value == self.value() or self._indeterminate:
+            super().paintEvent(event)
+            return
+        
+        # What QProgressBar.paintEvent draws, with the progress replaced
+        option = QStyleOptionProgressBar()
+        self.initStyleOption(option)
+        option.progress = self._display_value
+        painter = QStylePainter(self)
+        painter.drawControl(QStyle.ControlElement.CE_ProgressBar, option)
+        painter.end()
     
     def set_indeterminate(self, indeterminate: bool) -> None:
         """
@@ -115,44 +217,81 @@ class Progress(QProgressBar):
         """
         self._indeterminate = indeterminate
         
+        # Changing the range resets the bar, the next value animates from 0
+        self.value_animation.stop()
+        
         if indeterminate:
             self.setMinimum(0)
             self.setMaximum(0)
-            self.indeterminate_timer.start()
         else:
             self.setMinimum(0)
             self.setMaximum(100)
-            self.indeterminate_timer.stop()
+            super().setValue(0)
+            self._display_value = 0
             self._indeterminate_position = 0.0
+        self._sync_indeterminate_animation()
     
-    def _update_indeterminate(self) -> None:
-        """Update indeterminate animation position."""
-        self._indeterminate_position += 0.02
-        if self._indeterminate_position > 1.0:
-            self._indeterminate_position = 0.0
-        self.update()
-    
-    def is_indeterminate(self) -> bool:
+    def set_fps(self, fps: int) -> None:
         """
-        Check if progress bar is in indeterminate state.
+        Set how often the indeterminate animation repaints.
         
-        Returns:
-            True if indeterminate, False otherwise
+        Args:
+            fps: Repaints per second
+        
+        Raises:
+            ValueError: If fps is not positive
         """
-        return self._indeterminate
+        if fps <= 0:
+            raise ValueError(f"fps must be positive: {fps!r}")
+        self._frames_per_cycle = max(fps * _INDETERMINATE_DURATION // 1000, 1)
+        self._indeterminate_frame = -1
     
-    def get_animated_value(self) -> int:
-        """Get current animated value."""
-        return self._animated_value
+    def _sync_indeterminate_animation(self, *args) -> None:
+        """Run the indeterminate animation only while it can be seen."""
+        animation = self.indeterminate_animation
+        running = animation.state() == QAbstractAnimation.State.Running
+        wanted = (self._indeterminate and self.isVisible()
+                  and QApplication.applicationState() not in _HIDDEN_STATES)
+        if wanted and not running:
+            animation.start()
+        elif running and not wanted:
+            animation.stop()
     
-    def set_animated_value(self, value: int) -> None:
+    def _update_indeterminate(self, position: float) -> None:
         """
-        Set animated value.
+        Update indeterminate animation position.
         
         Args:
-            value: Animated value (0-100)
+            position: Position within the current cycle (0.0 to 1.0)
         """
-        self._animated_value = value
-        super().setValue(value)
+        self._indeterminate_position = position
+        
+        # Repaint once per frame of the configured rate
+        frame = int(position * self._frames_per_cycle)
+        if frame == self._indeterminate_frame:
+            return
+        self._indeterminate_frame = frame
+        
+        # Fully clipped, e.g. scrolled out of a scroll area
+        if self.visibleRegion().isEmpty():
+            return
+        self.update()
+    
+    def showEvent(self, event) -> None:
+        """Resume the indeterminate animation when shown."""
+        super().showEvent(event)
+        self._sync_indeterminate_animation()
     
-    animatedValue = Property(int, get_animated_value, set_animated_value)
+    def hideEvent(self, event) -> None:
+        """Stop the indeterminate animation while hidden."""
+        super().hideEvent(event)
+        self._sync_indeterminate_animation()
+    
+    def is_indeterminate(self) -> bool:
+        """
+        Check if progress bar is in indeterminate state.
+        
+        Returns:
+            True if indeterminate, False otherwise
+        """
+        return self._indeterminate
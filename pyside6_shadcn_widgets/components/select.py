@@ -2,17 +2,78 @@
 Select/Dropdown component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional, List
-from PySide6.QtWidgets import QComboBox, QWidget, QListView, QStyledItemDelegate
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal
+from typing import Optional
+from PySide6.QtWidgets import QAbstractItemView, QComboBox, QWidget, QListView
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QCursor
+from pyside6_shadcn_widgets import _global_qss
+
+# The select and its dropdown list are matched on selectPart; the property
+# outranks the theme's QWidget rule and container rules such as
+# "Card QWidget" sharing the application stylesheet
+SELECT_QSS = """
+            Select[selectPart="box"] {
+                background-color: hsl(0, 0%, 100%);
+                color: hsl(222.2, 84%, 4.9%);
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 8px;
+                padding: 8px 16px;
+                padding-right: 32px;
+                font-size: 14px;
+                min-height: 40px;
+            }
+            Select[selectPart="box"]:hover {
+                border-color: hsl(222.2, 84%, 4.9%);
+            }
+            Select[selectPart="box"]:focus {
+                border: 2px solid hsl(222.2, 84%, 4.9%);
+            }
+            Select[selectPart="box"]::drop-down {
+                border: none;
+                width: 32px;
+            }
+            Select[selectPart="box"]::down-arrow {
+                image: none;
+                border-left: 5px solid transparent;
+                border-right: 5px solid transparent;
+                border-top: 5px solid hsl(222.2, 84%, 4.9%);
+                margin-right: 8px;
+            }
+            Select[selectPart="box"]:disabled {
+                background-color: hsl(210, 40%, 96.1%);
+                color: hsl(215.4, 16.3%, 46.9%);
+            }
+            
+            QListView[selectPart="list"] {
+                background-color: hsl(0, 0%, 100%);
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 8px;
+                padding: 4px;
+                outline: none;
+            }
+            QListView[selectPart="list"]::item {
+                padding: 8px 12px;
+                border-radius: 6px;
+                color: hsl(222.2, 84%, 4.9%);
+            }
+            QListView[selectPart="list"]::item:hover {
+                background-color: hsl(210, 40%, 96.1%);
+            }
+            QListView[selectPart="list"]::item:selected {
+                background-color: hsl(210, 40%, 96.1%);
+                color: hsl(222.2, 84%, 4.9%);
+            }
+        """
+_global_qss.register("Select", SELECT_QSS)
 
 
 class Select(QComboBox):
     """
     Custom styled dropdown matching shadcn/ui design.
     
-    Features smooth dropdown animation and modern styling.
+    Features smooth dropdown animation and modern styling. The select and
+    its dropdown list are styled by SELECT_QSS in the application
+    stylesheet.
     
     Example:
         >>> select = Select()
@@ -29,6 +90,12 @@ class Select(QComboBox):
         """
         super().__init__(parent)
         
+        # Popup slide animation, created on first showPopup
+        self._popup_animation: Optional[QPropertyAnimation] = None
+        
+        # Styled dropdown list, created on first showPopup or view() call
+        self._view_ready = False
+        
         # Setup select
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._setup_ui()
@@ -38,70 +105,50 @@ class Select(QComboBox):
         """Setup select UI elements."""
         # Set minimum height
         self.setMinimumHeight(40)
+    
+    def _apply_styles(self) -> None:
+        """Tag the select with the property SELECT_QSS matches on."""
+        _global_qss.ensure_installed()
+        self.setProperty("selectPart", "box")
+    
+    def _ensure_view(self) -> None:
+        """Replace the default dropdown list with one SELECT_QSS styles."""
+        if self._view_ready:
+            return
+        self._view_ready = True
         
-        # Setup list view for dropdown
         list_view = QListView(self)
-        list_view.setStyleSheet("""
-            QListView {
-                background-color: hsl(0, 0%, 100%);
-                border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 8px;
-                padding: 4px;
-                outline: none;
-            }
-            QListView::item {
-                padding: 8px 12px;
-                border-radius: 6px;
-                color: hsl(222.2, 84%, 4.9%);
-            }
-            QListView::item:hover {
-                background-color: hsl(210, 40%, 96.1%);
-            }
-            QListView::item:selected {
-                background-color: hsl(210, 40%, 96.1%);
-                color: hsl(222.2, 84%, 4.9%);
-            }
-        """)
+        list_view.setProperty("selectPart", "list")
         self.setView(list_view)
+        
+        # A new view starts without a selection; mark the current item
+        if self.currentIndex() >= 0:
+            list_view.setCurrentIndex(self.model().index(
+                self.currentIndex(), self.modelColumn(), self.rootModelIndex()))
     
-    def _apply_styles(self) -> None:
-        """Apply QSS styles to select."""
-        self.setStyleSheet("""
-            QComboBox {
-                background-color: hsl(0, 0%, 100%);
-                color: hsl(222.2, 84%, 4.9%);
-                border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 8px;
-                padding: 8px 16px;
-                padding-right: 32px;
-                font-size: 14px;
-                min-height: 40px;
-            }
-            QComboBox:hover {
-                border-color: hsl(222.2, 84%, 4.9%);
-            }
-            QComboBox:focus {
-                border: 2px solid hsl(222.2, 84%, 4.9%);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 32px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid hsl(222.2, 84%, 4.9%);
-                margin-right: 8px;
-            }
-            QComboBox:disabled {
-                background-color: hsl(210, 40%, 96.1%);
-                color: hsl(215.4, 16.3%, 46.9%);
-            }
-        """)
+    def view(self) -> QAbstractItemView:
+        """
+        Get the dropdown list view, creating the styled one if needed.
+        
+        Returns:
+            Dropdown list view
+        """
+        self._ensure_view()
+        return super().view()
+    
+    def setView(self, view: QAbstractItemView) -> None:
+        """
+        Set the dropdown list view, in place of the styled one.
+        
+        Args:
+            view: List view for the dropdown
+        """
+        self._view_ready = True
+        super().setView(view)
     
     def showPopup(self) -> None:
         """Override to add smooth popup animation."""
+        self._ensure_view()
         super().showPopup()
         
         # Get popup widget
@@ -111,10 +158,17 @@ class Select(QComboBox):
             pos = popup.pos()
             popup.move(pos.x(), pos.y() - 10)
             
-            # Animate to final position
-            animation = QPropertyAnimation(popup, b"pos")
-            animation.setDuration(200)
+            # Animate to final position; one animation is kept and re-aimed,
+            # the popup container is replaced when the view is
+            animation = self._popup_animation
+            if animation is None:
+                animation = self._popup_animation = QPropertyAnimation(self)
+                animation.setPropertyName(b"pos")
+                animation.setDuration(200)
+                animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            
+            animation.stop()
+            animation.setTargetObject(popup)
             animation.setStartValue(popup.pos())
             animation.setEndValue(pos)
-            animation.setEasingCurve(QEasingCurve.Type.OutCubic)
             animation.start()
@@ -2,10 +2,23 @@
 Switch/Toggle component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional
+from typing import List, Optional
 from PySide6.QtWidgets import QCheckBox, QWidget
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRectF, QPointF, Signal
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRectF
+from PySide6.QtGui import QPainter, QColor, QPixmap, QPixmapCache
+from pyside6_shadcn_widgets.components._palette import BORDER, PRIMARY, WHITE
+
+# Track colors from off (BORDER) to on (PRIMARY), indexed by
+# int(position * _TRACK_STEPS)
+_TRACK_STEPS = 255
+_TRACK_COLORS: List[QColor] = [
+    QColor(
+        int(BORDER.red() + (PRIMARY.red() - BORDER.red()) * i / _TRACK_STEPS),
+        int(BORDER.green() + (PRIMARY.green() - BORDER.green()) * i / _TRACK_STEPS),
+        int(BORDER.blue() + (PRIMARY.blue() - BORDER.blue()) * i / _TRACK_STEPS),
+    )
+    for i in range(_TRACK_STEPS + 1)
+]
 
 
 class Switch(QCheckBox):
@@ -30,8 +43,6 @@ class Switch(QCheckBox):
         super().__init__(parent)
         
         self._switch_position = 0.0  # 0.0 = off, 1.0 = on
-        self._track_color = QColor(214, 227, 235)  # hsl(214.3, 31.8%, 91.4%)
-        self._thumb_color = QColor(255, 255, 255)
         
         # Dimensions
         self.track_width = 44
@@ -39,6 +50,16 @@ class Switch(QCheckBox):
         self.thumb_diameter = 20
         self.thumb_margin = 2
         
+        # Paint geometry; the dimensions above do not change after this
+        self._track_rect = QRectF(0, 0, self.track_width, self.track_height)
+        self._corner_radius = self.track_height / 2
+        self._thumb_x_range = self.track_width - self.thumb_diameter - 2 * self.thumb_margin
+        self._thumb_rect = QRectF(self.thumb_margin, self.thumb_margin,
+                                  self.thumb_diameter, self.thumb_diameter)
+        
+        # Pre-rendered frames, one per pixel of thumb travel
+        self._frame_steps = max(self._thumb_x_range, 1)
+        
         # Setup switch
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._setup_animations()
@@ -55,34 +76,66 @@ class Switch(QCheckBox):
     def paintEvent(self, event) -> None:
         """Custom paint event to draw the switch."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._frame())
+        painter.end()
+    
+    def _frame(self) -> QPixmap:
+        """
+        Get the pre-rendered frame for the current switch position.
         
-        # Draw track
-        track_rect = QRectF(0, 0, self.track_width, self.track_height)
-        track_color = QColor(2, 12, 27) if self.isChecked() else QColor(214, 227, 235)
-        
-        # Animate track color
-        if self._switch_position > 0:
-            # Interpolate between off and on colors
-            off_color = QColor(214, 227, 235)
-            on_color = QColor(2, 12, 27)
+        Frames live in QPixmapCache, so switches of the same size share them
+        and each frame is rendered once.
+        
+        Returns:
+            Frame pixmap
+        """
+        index = round(self._switch_position * self._frame_steps)
+        
+        # At the off position the track follows the checked state, see _paint
+        checked = index == 0 and self.isChecked()
+        dpr = self.devicePixelRatioF()
+        key = f"shadcn-switch:{self.track_width}x{self.track_height}@{dpr}:{index}:{int(checked)}"
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(self.track_width * dpr), round(self.track_height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
             
-            r = int(off_color.red() + (on_color.red() - off_color.red()) * self._switch_position)
-            g = int(off_color.green() + (on_color.green() - off_color.green()) * self._switch_position)
-            b = int(off_color.blue() + (on_color.blue() - off_color.blue()) * self._switch_position)
+            painter = QPainter(pixmap)
+            self._paint(painter, index / self._frame_steps, checked)
+            painter.end()
             
-            track_color = QColor(r, g, b)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def _paint(self, painter: QPainter, position: float, checked: bool) -> None:
+        """
+        Draw the track and thumb.
+        
+        Args:
+            painter: Active painter
+            position: Switch position (0.0 to 1.0)
+            checked: Whether the switch is checked, used at position 0.0
+        """
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        painter.setBrush(QBrush(track_color))
+        # Draw track
+        if position > 0:
+            # Animate track color between off and on colors
+            track_color = _TRACK_COLORS[min(int(position * _TRACK_STEPS), _TRACK_STEPS)]
+        else:
+            track_color = PRIMARY if checked else BORDER
+        
+        painter.setBrush(track_color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(track_rect, self.track_height / 2, self.track_height / 2)
+        painter.drawRoundedRect(self._track_rect, self._corner_radius, self._corner_radius)
         
-        # Draw thumb
-        thumb_x = self.thumb_margin + (self.track_width - self.thumb_diameter - 2 * self.thumb_margin) * self._switch_position
-        thumb_y = self.thumb_margin
-        thumb_rect = QRectF(thumb_x, thumb_y, self.thumb_diameter, self.thumb_diameter)
+        # Draw thumb; the cached rect only moves along x
+        thumb_rect = self._thumb_rect
+        thumb_rect.moveLeft(self.thumb_margin + self._thumb_x_range * position)
         
-        painter.setBrush(QBrush(self._thumb_color))
+        painter.setBrush(WHITE)
         painter.drawEllipse(thumb_rect)
     
     def mouseReleaseEvent(self, event) -> None:
@@ -129,7 +182,15 @@ class Switch(QCheckBox):
         Args:
             position: Position value (0.0 to 1.0)
         """
+        # Exact comparison; an epsilon could swallow an animation's last step
+        if position == self._switch_position:
+            return
+        
+        # Positions within the same pre-rendered frame look the same
+        steps = self._frame_steps
+        changed = round(position * steps) != round(self._switch_position * steps)
         self._switch_position = position
-        self.update()
+        if changed:
+            self.update()
     
     switchPosition = Property(float, get_switch_position, set_switch_position)
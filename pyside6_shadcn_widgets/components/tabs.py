@@ -2,17 +2,55 @@
 Tabs component for PySide6 Shadcn Widgets.
 """
 
-from typing import Optional, List
-from PySide6.QtWidgets import QTabWidget, QWidget, QTabBar, QStylePainter, QStyleOptionTab, QStyle
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRect, Signal
-from PySide6.QtGui import QPainter, QColor, QPen
+from typing import Iterable, Optional, Tuple
+from PySide6.QtWidgets import QTabWidget, QWidget, QTabBar
+from PySide6.QtCore import Qt, QAbstractAnimation, QVariantAnimation, QEasingCurve, QRect, QRectF
+from PySide6.QtGui import QPainter
+from pyside6_shadcn_widgets import _global_qss
+from pyside6_shadcn_widgets.components._batch import BatchUpdatable
+from pyside6_shadcn_widgets.components._palette import PRIMARY
 
+# Tab rules are scoped to the tabs widget; the selected tab restates its
+# border so it outranks the theme's "Tabs QTabBar::tab:selected" underline,
+# which the painted indicator replaces
+TABS_QSS = """
+            Tabs::pane {
+                border: 1px solid hsl(214.3, 31.8%, 91.4%);
+                border-radius: 8px;
+                background-color: hsl(0, 0%, 100%);
+                padding: 16px;
+                top: -1px;
+            }
+            Tabs::tab-bar {
+                alignment: left;
+            }
+            Tabs QTabBar::tab {
+                background-color: transparent;
+                color: hsl(215.4, 16.3%, 46.9%);
+                padding: 12px 16px;
+                font-size: 14px;
+                font-weight: 500;
+                border: none;
+                border-bottom: 2px solid transparent;
+                margin-right: 8px;
+            }
+            Tabs QTabBar::tab:hover {
+                color: hsl(222.2, 84%, 4.9%);
+            }
+            Tabs QTabBar::tab:selected {
+                color: hsl(222.2, 84%, 4.9%);
+                border-bottom: 2px solid transparent;
+            }
+        """
+_global_qss.register("Tabs", TABS_QSS)
 
-class Tabs(QTabWidget):
+
+class Tabs(BatchUpdatable, QTabWidget):
     """
     Modern tabs component with animated indicator.
     
     Features smooth content transition and sliding indicator between tabs.
+    Tabs are styled by TABS_QSS in the application stylesheet.
     
     Example:
         >>> tabs = Tabs()
@@ -30,8 +68,8 @@ class Tabs(QTabWidget):
         """
         super().__init__(parent)
         
-        self._indicator_position = 0
-        self._indicator_width = 0
+        # Only x and width are used; the indicator's height is fixed
+        self._indicator_rect = QRectF()
         
         # Setup tabs
         self._setup_ui()
@@ -50,44 +88,45 @@ class Tabs(QTabWidget):
     
     def _setup_animations(self) -> None:
         """Setup tab change animation."""
-        self.indicator_animation = QPropertyAnimation(self, b"indicatorPosition")
+        # Position and width move together, one tick and one repaint per frame
+        self.indicator_animation = QVariantAnimation(self)
         self.indicator_animation.setDuration(250)
         self.indicator_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        self.width_animation = QPropertyAnimation(self, b"indicatorWidth")
-        self.width_animation.setDuration(250)
-        self.width_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.indicator_animation.valueChanged.connect(self._set_indicator_rect)
     
     def _apply_styles(self) -> None:
-        """Apply QSS styles to tabs."""
-        self.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid hsl(214.3, 31.8%, 91.4%);
-                border-radius: 8px;
-                background-color: hsl(0, 0%, 100%);
-                padding: 16px;
-                top: -1px;
-            }
-            QTabWidget::tab-bar {
-                alignment: left;
-            }
-            QTabBar::tab {
-                background-color: transparent;
-                color: hsl(215.4, 16.3%, 46.9%);
-                padding: 12px 16px;
-                font-size: 14px;
-                font-weight: 500;
-                border: none;
-                border-bottom: 2px solid transparent;
-                margin-right: 8px;
-            }
-            QTabBar::tab:hover {
-                color: hsl(222.2, 84%, 4.9%);
-            }
-            QTabBar::tab:selected {
-                color: hsl(222.2, 84%, 4.9%);
-            }
-        """)
+        """Make sure TABS_QSS is part of the application stylesheet."""
+        _global_qss.ensure_installed()
+    
+    def batch_add(self, items: Iterable[Tuple[QWidget, str]]) -> None:
+        """
+        Add several tabs at once.
+        
+        Preferred over repeated addTab calls when adding more than two tabs:
+        repaints are held back and the indicator is placed once, under the
+        current tab, instead of being animated for each insertion.
+        
+        Args:
+            items: (page widget, tab label) pairs, in tab order
+        """
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        self.currentChanged.disconnect(self._on_tab_changed)
+        try:
+            for widget, label in items:
+                self.addTab(widget, label)
+        finally:
+            self.currentChanged.connect(self._on_tab_changed)
+            self._recompute_indicator()
+            self.setUpdatesEnabled(updates_enabled)
+    
+    def _recompute_indicator(self) -> None:
+        """Move the indicator under the current tab without animating it."""
+        self.indicator_animation.stop()
+        
+        if self.count() > 0:
+            tab_rect = self.tabBar().tabRect(self.currentIndex())
+            self._set_indicator_rect(QRectF(tab_rect.x(), 0, tab_rect.width(), 0))
     
     def _on_tab_changed(self, index: int) -> None:
         """
@@ -99,24 +138,21 @@ class Tabs(QTabWidget):
         if index < 0:
             return
         
-        # Get tab bar
-        tab_bar = self.tabBar()
-        
         # Calculate new indicator position and width
-        tab_rect = tab_bar.tabRect(index)
-        new_position = tab_rect.x()
-        new_width = tab_rect.width()
+        tab_rect = self.tabBar().tabRect(index)
+        new_rect = QRectF(tab_rect.x(), 0, tab_rect.width(), 0)
+        
+        # Already under the tab, with no animation moving it away
+        animation = self.indicator_animation
+        if (new_rect == self._indicator_rect
+                and animation.state() != QAbstractAnimation.State.Running):
+            return
         
         # Animate indicator
-        self.indicator_animation.stop()
-        self.indicator_animation.setStartValue(self._indicator_position)
-        self.indicator_animation.setEndValue(new_position)
-        self.indicator_animation.start()
-        
-        self.width_animation.stop()
-        self.width_animation.setStartValue(self._indicator_width)
-        self.width_animation.setEndValue(new_width)
-        self.width_animation.start()
+        animation.stop()
+        animation.setStartValue(QRectF(self._indicator_rect))
+        animation.setEndValue(new_rect)
+        animation.start()
     
     def showEvent(self, event) -> None:
         """Handle show event to initialize indicator."""
@@ -124,10 +160,8 @@ class Tabs(QTabWidget):
         
         # Initialize indicator position
         if self.count() > 0:
-            tab_bar = self.tabBar()
-            tab_rect = tab_bar.tabRect(self.currentIndex())
-            self._indicator_position = tab_rect.x()
-            self._indicator_width = tab_rect.width()
+            tab_rect = self.tabBar().tabRect(self.currentIndex())
+            self._indicator_rect = QRectF(tab_rect.x(), 0, tab_rect.width(), 0)
     
     def paintEvent(self, event) -> None:
         """Custom paint event to draw indicator."""
@@ -142,46 +176,29 @@ class Tabs(QTabWidget):
         tab_bar_height = tab_bar.height()
         
         # Draw indicator
-        indicator_color = QColor(2, 12, 27)  # hsl(222.2, 47.4%, 11.2%)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(indicator_color)
+        painter.setBrush(PRIMARY)
         
         indicator_rect = QRect(
-            int(self._indicator_position),
+            int(self._indicator_rect.x()),
             tab_bar_height - 3,
-            int(self._indicator_width),
+            int(self._indicator_rect.width()),
             3
         )
         painter.drawRoundedRect(indicator_rect, 2, 2)
     
-    def get_indicator_position(self) -> float:
-        """Get current indicator position."""
-        return self._indicator_position
-    
-    def set_indicator_position(self, position: float) -> None:
+    def _set_indicator_rect(self, rect: QRectF) -> None:
         """
-        Set indicator position.
+        Move the indicator.
         
         Args:
-            position: X position of indicator
+            rect: Indicator rectangle; only its x and width are used
         """
-        self._indicator_position = position
-        self.update()
-    
-    indicatorPosition = Property(float, get_indicator_position, set_indicator_position)
-    
-    def get_indicator_width(self) -> float:
-        """Get current indicator width."""
-        return self._indicator_width
-    
-    def set_indicator_width(self, width: float) -> None:
-        """
-        Set indicator width.
-        
-        Args:
-            width: Width of indicator
-        """
-        self._indicator_width = width
-        self.update()
-    
-    indicatorWidth = Property(float, get_indicator_width, set_indicator_width)
+        current = self._indicator_rect
+        
+        # Only whole pixels are painted
+        changed = (int(rect.x()) != int(current.x())
+                   or int(rect.width()) != int(current.width()))
+        self._indicator_rect = rect
+        if changed:
+            self.update()
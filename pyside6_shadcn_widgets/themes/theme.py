@@ -2,110 +2,33 @@
 Base Theme class for PySide6 Shadcn Widgets.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 from pyside6_shadcn_widgets.utils.colors import hsl_to_hex
+from pyside6_shadcn_widgets import _global_qss
 
 
-class Theme:
-    """
-    Base theme class that defines the color palette and styling for widgets.
-    
-    This class provides methods to convert HSL color values (as used in shadcn/ui)
-    to Qt-compatible formats and apply themes to applications.
+# Theme stylesheet blocks, one per widget family, filled by
+# Theme.get_stylesheet_parts with str.format_map. Placeholders are color
+# names, radius_<size> and spacing_<size>
+_STYLESHEET_BLOCKS: Tuple[str, ...] = (
     """
-    
-    def __init__(self):
-        """Initialize the theme with default color values."""
-        self.colors: Dict[str, tuple] = {
-            # Format: (h, s, l) - HSL values
-            "background": (0, 0, 100),
-            "foreground": (222.2, 84, 4.9),
-            "card": (0, 0, 100),
-            "card_foreground": (222.2, 84, 4.9),
-            "popover": (0, 0, 100),
-            "popover_foreground": (222.2, 84, 4.9),
-            "primary": (222.2, 47.4, 11.2),
-            "primary_foreground": (210, 40, 98),
-            "secondary": (210, 40, 96.1),
-            "secondary_foreground": (222.2, 47.4, 11.2),
-            "muted": (210, 40, 96.1),
-            "muted_foreground": (215.4, 16.3, 46.9),
-            "accent": (210, 40, 96.1),
-            "accent_foreground": (222.2, 47.4, 11.2),
-            "destructive": (0, 84.2, 60.2),
-            "destructive_foreground": (210, 40, 98),
-            "border": (214.3, 31.8, 91.4),
-            "input": (214.3, 31.8, 91.4),
-            "ring": (222.2, 84, 4.9),
-        }
-        
-        # Border radius values (in pixels)
-        self.radius = {
-            "sm": 6,
-            "md": 8,
-            "lg": 12,
-        }
-        
-        # Spacing values (multiples of 4px base unit)
-        self.spacing = {
-            "xs": 4,
-            "sm": 8,
-            "md": 16,
-            "lg": 24,
-            "xl": 32,
-        }
-    
-    def get_color(self, name: str) -> str:
-        """
-        Get a color value as a hexadecimal string.
-        
-        Args:
-            name: Name of the color from the theme palette
-            
-        Returns:
-            Hexadecimal color string (e.g., "#ffffff")
-        """
-        if name in self.colors:
-            h, s, l = self.colors[name]
-            return hsl_to_hex(h, s, l)
-        return "#000000"  # Default fallback
-    
-    def get_qcolor(self, name: str) -> QColor:
-        """
-        Get a color value as a QColor object.
-        
-        Args:
-            name: Name of the color from the theme palette
-            
-        Returns:
-            QColor object
-        """
-        hex_color = self.get_color(name)
-        return QColor(hex_color)
-    
-    def get_stylesheet(self) -> str:
-        """
-        Generate a complete QSS stylesheet for the theme.
-        
-        Returns:
-            QSS stylesheet string
-        """
-        return f"""
             QWidget {{
-                background-color: {self.get_color('background')};
-                color: {self.get_color('foreground')};
+                background-color: {background};
+                color: {foreground};
                 font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
                 font-size: 14px;
             }}
-            
+            """,
+    """
             QPushButton {{
-                border: 1px solid {self.get_color('border')};
-                border-radius: {self.radius['md']}px;
-                padding: {self.spacing['sm']}px {self.spacing['md']}px;
-                background-color: {self.get_color('primary')};
-                color: {self.get_color('primary_foreground')};
+                border: 1px solid {border};
+                border-radius: {radius_md}px;
+                padding: {spacing_sm}px {spacing_md}px;
+                background-color: {primary};
+                color: {primary_foreground};
             }}
             
             QPushButton:hover {{
@@ -119,72 +42,339 @@ class Theme:
             QPushButton:disabled {{
                 opacity: 0.5;
             }}
-            
+            """,
+    """
             QLineEdit {{
-                border: 1px solid {self.get_color('input')};
-                border-radius: {self.radius['md']}px;
-                padding: {self.spacing['sm']}px {self.spacing['md']}px;
-                background-color: {self.get_color('background')};
-                color: {self.get_color('foreground')};
+                border: 1px solid {input};
+                border-radius: {radius_md}px;
+                padding: {spacing_sm}px {spacing_md}px;
+                background-color: {background};
+                color: {foreground};
             }}
             
             QLineEdit:focus {{
-                border: 2px solid {self.get_color('ring')};
+                border: 2px solid {ring};
             }}
-            
+            """,
+    """
             QCheckBox {{
-                spacing: {self.spacing['sm']}px;
-                color: {self.get_color('foreground')};
+                spacing: {spacing_sm}px;
+                color: {foreground};
             }}
             
             QCheckBox::indicator {{
                 width: 16px;
                 height: 16px;
-                border: 1px solid {self.get_color('border')};
+                border: 1px solid {border};
                 border-radius: 4px;
-                background-color: {self.get_color('background')};
+                background-color: {background};
             }}
             
             QCheckBox::indicator:checked {{
-                background-color: {self.get_color('primary')};
-                border-color: {self.get_color('primary')};
+                background-color: {primary};
+                border-color: {primary};
             }}
-            
+            """,
+    """
             QTabWidget::pane {{
-                border: 1px solid {self.get_color('border')};
-                border-radius: {self.radius['md']}px;
-                background-color: {self.get_color('card')};
+                border: 1px solid {border};
+                border-radius: {radius_md}px;
+                background-color: {card};
             }}
             
             QTabBar::tab {{
                 background-color: transparent;
-                color: {self.get_color('muted_foreground')};
-                padding: {self.spacing['sm']}px {self.spacing['md']}px;
+                color: {muted_foreground};
+                padding: {spacing_sm}px {spacing_md}px;
                 border-bottom: 2px solid transparent;
             }}
             
             QTabBar::tab:selected {{
-                color: {self.get_color('foreground')};
-                border-bottom: 2px solid {self.get_color('primary')};
+                color: {foreground};
+                border-bottom: 2px solid {primary};
             }}
             
             QTabBar::tab:hover {{
-                color: {self.get_color('foreground')};
+                color: {foreground};
             }}
-            
+            """,
+    """
             QProgressBar {{
                 border: none;
-                border-radius: {self.radius['lg']}px;
-                background-color: {self.get_color('secondary')};
+                border-radius: {radius_lg}px;
+                background-color: {secondary};
                 text-align: center;
                 height: 8px;
             }}
             
             QProgressBar::chunk {{
-                background-color: {self.get_color('primary')};
-                border-radius: {self.radius['lg']}px;
+                background-color: {primary};
+                border-radius: {radius_lg}px;
             }}
+        """,
+)
+
+# Application palette roles and the theme colors apply() sets them to
+_PALETTE_ROLES: Tuple[Tuple[QPalette.ColorRole, str], ...] = (
+    (QPalette.ColorRole.Window, 'background'),
+    (QPalette.ColorRole.WindowText, 'foreground'),
+    (QPalette.ColorRole.Base, 'background'),
+    (QPalette.ColorRole.AlternateBase, 'secondary'),
+    (QPalette.ColorRole.Text, 'foreground'),
+    (QPalette.ColorRole.Button, 'primary'),
+    (QPalette.ColorRole.ButtonText, 'primary_foreground'),
+    (QPalette.ColorRole.Highlight, 'primary'),
+    (QPalette.ColorRole.HighlightedText, 'primary_foreground'),
+)
+
+
+class _StylesheetParams(dict):
+    """Template values; colors missing from a palette fall back like get_color."""
+    
+    def __missing__(self, key: str) -> str:
+        """Return black for a missing color; radius and spacing must exist."""
+        if key.startswith(("radius_", "spacing_")):
+            raise KeyError(key)
+        return "#000000"
+
+
+class Theme:
+    """
+    Base theme class that defines the color palette and styling for widgets.
+    
+    This class provides methods to convert HSL color values (as used in shadcn/ui)
+    to Qt-compatible formats and apply themes to applications.
+    """
+    
+    # Format: (h, s, l) - HSL values
+    COLORS: Dict[str, tuple] = {
+        "background": (0, 0, 100),
+        "foreground": (222.2, 84, 4.9),
+        "card": (0, 0, 100),
+        "card_foreground": (222.2, 84, 4.9),
+        "popover": (0, 0, 100),
+        "popover_foreground": (222.2, 84, 4.9),
+        "primary": (222.2, 47.4, 11.2),
+        "primary_foreground": (210, 40, 98),
+        "secondary": (210, 40, 96.1),
+        "secondary_foreground": (222.2, 47.4, 11.2),
+        "muted": (210, 40, 96.1),
+        "muted_foreground": (215.4, 16.3, 46.9),
+        "accent": (210, 40, 96.1),
+        "accent_foreground": (222.2, 47.4, 11.2),
+        "destructive": (0, 84.2, 60.2),
+        "destructive_foreground": (210, 40, 98),
+        "border": (214.3, 31.8, 91.4),
+        "input": (214.3, 31.8, 91.4),
+        "ring": (222.2, 84, 4.9),
+    }
+    
+    # Border radius values (in pixels)
+    RADIUS: Dict[str, int] = {
+        "sm": 6,
+        "md": 8,
+        "lg": 12,
+    }
+    
+    # Spacing values (multiples of 4px base unit)
+    SPACING: Dict[str, int] = {
+        "xs": 4,
+        "sm": 8,
+        "md": 16,
+        "lg": 24,
+        "xl": 32,
+    }
+    
+    def __init__(self):
+        """Initialize the theme with the class's default values."""
+        # Per-instance copies so customizing one theme leaves the class intact
+        self.colors: Dict[str, tuple] = dict(self.COLORS)
+        self.radius: Dict[str, int] = dict(self.RADIUS)
+        self.spacing: Dict[str, int] = dict(self.SPACING)
+        
+        # Hex strings for self.colors, keyed by name and stored with the HSL
+        # tuple they were converted from, so direct edits of self.colors are
+        # still picked up by get_color
+        self._hex_cache: Dict[str, Tuple[tuple, str]] = dict(_default_hex_cache(type(self)))
+        
+        # QColors for get_qcolor, stored with the hex string they were made from
+        self._qcolor_cache: Dict[str, Tuple[str, QColor]] = {}
+        
+        # Stylesheet from get_stylesheet, stored with copies of the colors,
+        # radius and spacing it was built from, so edits to any of them,
+        # direct or not, rebuild it
+        self._stylesheet_cache: Optional[Tuple[dict, dict, dict, str]] = None
+    
+    def _is_default(self) -> bool:
+        """Check whether colors, radius and spacing match the class defaults."""
+        return (
+            self.colors == self.COLORS
+            and self.radius == self.RADIUS
+            and self.spacing == self.SPACING
+        )
+    
+    def interpolate(self, other: "Theme", t: float) -> "Theme":
+        """
+        Blend this theme's colors toward another theme's.
+        
+        Each HSL component is interpolated linearly, so stepping t from 0 to
+        1 morphs one palette into the other, e.g. for an animated switch
+        between light and dark themes. Grays take the hue of the color they
+        are blended with. Colors missing from the other theme,
+        radius and spacing are taken from this theme.
+        
+        Args:
+            other: Theme to blend toward
+            t: Blend factor, 0.0 for this theme and 1.0 for the other
+        
+        Returns:
+            New theme of this theme's class with the blended colors
+        """
+        theme = type(self)()
+        theme.radius = dict(self.radius)
+        theme.spacing = dict(self.spacing)
+        
+        other_colors = other.colors
+        blended = {}
+        for name, (h, s, l) in self.colors.items():
+            h2, s2, l2 = other_colors.get(name, (h, s, l))
+            
+            # A gray has no meaningful hue; keep the other color's instead
+            # of sweeping through unrelated hues on the way
+            if s == 0:
+                h = h2
+            elif s2 == 0:
+                h2 = h
+            
+            blended[name] = (h * (1 - t) + h2 * t, s * (1 - t) + s2 * t,
+                             l * (1 - t) + l2 * t)
+        theme.colors = blended
+        return theme
+    
+    def get_color(self, name: str) -> str:
+        """
+        Get a color value as a hexadecimal string.
+        
+        Args:
+            name: Name of the color from the theme palette
+        
+        Returns:
+            Hexadecimal color string (e.g., "#ffffff")
+        """
+        hsl = self.colors.get(name)
+        if hsl is None:
+            return "#000000"  # Default fallback
+        
+        cached = self._hex_cache.get(name)
+        if cached is None or cached[0] is not hsl:
+            cached = self._hex_cache[name] = (hsl, hsl_to_hex(*hsl))
+        return cached[1]
+    
+    def set_color(self, name: str, hsl: tuple) -> None:
+        """
+        Set a palette color.
+        
+        Args:
+            name: Name of the color in the theme palette
+            hsl: (h, s, l) values, with s and l in percent
+        """
+        hsl = tuple(hsl)
+        self.colors[name] = hsl
+        self._hex_cache[name] = (hsl, hsl_to_hex(*hsl))
+    
+    def invalidate(self) -> None:
+        """
+        Drop the cached stylesheet.
+        
+        Edits to colors, radius and spacing are picked up without it; call
+        it when a subclass's get_stylesheet_parts output changes for another
+        reason.
+        """
+        self._stylesheet_cache = None
+    
+    def get_qcolor(self, name: str) -> QColor:
+        """
+        Get a color value as a QColor object.
+        
+        The QColor is cached and shared between calls, so treat it as
+        read-only and copy it before modifying.
+        
+        Args:
+            name: Name of the color from the theme palette
+        
+        Returns:
+            QColor object
         """
+        hex_color = self.get_color(name)
+        cached = self._qcolor_cache.get(name)
+        if cached is None or cached[0] != hex_color:
+            cached = self._qcolor_cache[name] = (hex_color, QColor(hex_color))
+        return cached[1]
+    
+    def get_stylesheet(self) -> str:
+        """
+        Generate a complete QSS stylesheet for the theme.
+        
+        The result is cached until colors, radius or spacing change. Themes
+        using their class defaults share a single stylesheet per theme
+        class, so constructing another instance costs nothing.
+        
+        Returns:
+            QSS stylesheet string
+        """
+        cached = self._stylesheet_cache
+        if (cached is not None and cached[0] == self.colors
+                and cached[1] == self.radius and cached[2] == self.spacing):
+            return cached[3]
+        
+        if self._is_default():
+            stylesheet = _default_stylesheet(type(self))
+        else:
+            stylesheet = self._build_stylesheet()
+        self._stylesheet_cache = (dict(self.colors), dict(self.radius),
+                                  dict(self.spacing), stylesheet)
+        return stylesheet
+    
+    def _build_stylesheet(self) -> str:
+        """
+        Build the theme stylesheet from colors, radius and spacing.
+        
+        Returns:
+            QSS stylesheet string
+        """
+        return "".join(self.get_stylesheet_parts())
+    
+    def get_stylesheet_parts(self) -> List[str]:
+        """
+        Generate the theme stylesheet as a list of QSS blocks.
+        
+        Subclasses adding rules should extend the returned list rather than
+        concatenate onto get_stylesheet(); the blocks are joined once.
+        
+        Example:
+            >>> class BrandTheme(LightTheme):
+            ...     def get_stylesheet_parts(self):
+            ...         parts = super().get_stylesheet_parts()
+            ...         parts.append("QToolTip { border: none; }")
+            ...         return parts
+        
+        Returns:
+            List of QSS blocks, in stylesheet order
+        """
+        params = _StylesheetParams((name, self.get_color(name)) for name in self.colors)
+        params.update((f"radius_{name}", value) for name, value in self.radius.items())
+        params.update((f"spacing_{name}", value) for name, value in self.spacing.items())
+        return [block.format_map(params) for block in _STYLESHEET_BLOCKS]
+    
+    @property
+    def qss(self) -> str:
+        """
+        The theme stylesheet, as returned by get_stylesheet().
+        
+        Returns:
+            QSS stylesheet string
+        """
+        return self.get_stylesheet()
     
     def apply(self, app: Optional[QApplication] = None) -> None:
         """
@@ -197,18 +387,26 @@ class Theme:
             app = QApplication.instance()
         
         if app:
-            app.setStyleSheet(self.get_stylesheet())
+            # Theme and component rules are set together, so the application
+            # is re-polished once
+            _global_qss.install(app, self.qss)
             
             # Set palette colors
             palette = QPalette()
-            palette.setColor(QPalette.ColorRole.Window, self.get_qcolor('background'))
-            palette.setColor(QPalette.ColorRole.WindowText, self.get_qcolor('foreground'))
-            palette.setColor(QPalette.ColorRole.Base, self.get_qcolor('background'))
-            palette.setColor(QPalette.ColorRole.AlternateBase, self.get_qcolor('secondary'))
-            palette.setColor(QPalette.ColorRole.Text, self.get_qcolor('foreground'))
-            palette.setColor(QPalette.ColorRole.Button, self.get_qcolor('primary'))
-            palette.setColor(QPalette.ColorRole.ButtonText, self.get_qcolor('primary_foreground'))
-            palette.setColor(QPalette.ColorRole.Highlight, self.get_qcolor('primary'))
-            palette.setColor(QPalette.ColorRole.HighlightedText, self.get_qcolor('primary_foreground'))
+            qcolor = self.get_qcolor
+            for role, name in _PALETTE_ROLES:
+                palette.setColor(role, qcolor(name))
             
             app.setPalette(palette)
+
+
+@lru_cache(maxsize=None)
+def _default_stylesheet(theme_cls: type) -> str:
+    """Build the stylesheet for a theme class's default values once."""
+    return theme_cls()._build_stylesheet()
+
+
+@lru_cache(maxsize=None)
+def _default_hex_cache(theme_cls: type) -> Dict[str, Tuple[tuple, str]]:
+    """Convert a theme class's default palette to hex strings once."""
+    return {name: (hsl, hsl_to_hex(*hsl)) for name, hsl in theme_cls.COLORS.items()}
@@ -11,6 +11,7 @@ from pyside6_shadcn_widgets.utils.colors import (
     hex_to_rgb,
     adjust_lightness,
     adjust_alpha,
+    adjust_alpha_rgb,
     hsl_to_hex,
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     "hex_to_rgb",
     "adjust_lightness",
     "adjust_alpha",
+    "adjust_alpha_rgb",
     "hsl_to_hex",
 ]
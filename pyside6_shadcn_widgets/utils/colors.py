@@ -2,9 +2,12 @@
 Color utilities for converting between HSL, RGB, and HEX color formats.
 """
 
-import colorsys
+from functools import lru_cache
 from typing import Tuple
 
+# Two-digit hex for every channel value, indexed by value (0-255)
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
 
 def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
     """
@@ -20,18 +23,23 @@ def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
         
     Example:
         >>> hsl_to_rgb(222.2, 84, 4.9)
-        (2, 7, 23)
+        (1, 8, 22)
     """
     # Normalize values
-    h_normalized = h / 360.0
-    s_normalized = s / 100.0
-    l_normalized = l / 100.0
+    s = s / 100.0
+    l = l / 100.0
+    
+    # Chroma, the second largest component and the lightness offset
+    c = (1 - abs(2 * l - 1)) * s
+    sector = (h / 60.0) % 6
+    x = c * (1 - abs(sector % 2 - 1))
+    m = l - c / 2
     
-    # Convert using colorsys
-    r, g, b = colorsys.hls_to_rgb(h_normalized, l_normalized, s_normalized)
+    # Component order for each 60 degree sector of the hue circle
+    r, g, b = ((c, x, 0), (x, c, 0), (0, c, x), (0, x, c), (x, 0, c), (c, 0, x))[int(sector) % 6]
     
     # Convert to 0-255 range
-    return (int(r * 255), int(g * 255), int(b * 255))
+    return (int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -50,9 +58,10 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
         >>> rgb_to_hex(255, 87, 51)
         "#ff5733"
     """
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX[r] + _HEX[g] + _HEX[b]
 
 
+@lru_cache(maxsize=128)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     Convert hexadecimal color string to RGB values.
@@ -70,10 +79,11 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     # Remove '#' if present
     hex_color = hex_color.lstrip('#')
     
-    # Convert to RGB
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # Convert to RGB in one C-level parse
+    return tuple(bytes.fromhex(hex_color[:6]))
 
 
+@lru_cache(maxsize=128)
 def hsl_to_hex(h: float, s: float, l: float) -> str:
     """
     Convert HSL color values directly to hexadecimal color string.
@@ -115,6 +125,7 @@ def adjust_lightness(h: float, s: float, l: float, amount: float) -> Tuple[float
     return (h, s, new_l)
 
 
+@lru_cache(maxsize=256)
 def adjust_alpha(hex_color: str, alpha: float) -> str:
     """
     Convert a hex color to RGBA format with specified alpha.
@@ -130,5 +141,27 @@ def adjust_alpha(hex_color: str, alpha: float) -> str:
         >>> adjust_alpha("#ff5733", 0.5)
         "rgba(255, 87, 51, 0.5)"
     """
-    r, g, b = hex_to_rgb(hex_color)
+    return adjust_alpha_rgb(*hex_to_rgb(hex_color), alpha)
+
+
+def adjust_alpha_rgb(r: int, g: int, b: int, alpha: float) -> str:
+    """
+    Format RGB components as an RGBA color with specified alpha.
+    
+    Like adjust_alpha, for callers that already have the components and
+    need no hex parsing.
+    
+    Args:
+        r: Red component (0-255)
+        g: Green component (0-255)
+        b: Blue component (0-255)
+        alpha: Alpha value (0.0 to 1.0)
+        
+    Returns:
+        RGBA color string (e.g., "rgba(255, 87, 51, 0.5)")
+        
+    Example:
+        >>> adjust_alpha_rgb(255, 87, 51, 0.5)
+        "rgba(255, 87, 51, 0.5)"
+    """
     return f"rgba({r}, {g}, {b}, {alpha})"
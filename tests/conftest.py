@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import os
+
+# Run without a display; must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """Get the QApplication shared by all tests, creating it if needed."""
+    return QApplication.instance() or QApplication([])
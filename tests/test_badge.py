@@ -0,0 +1,31 @@
+"""
+Tests for the Badge component.
+"""
+
+import pytest
+
+from pyside6_shadcn_widgets.components import Badge
+
+
+def test_set_variant_updates_style_property(qapp):
+    badge = Badge("New")
+    
+    badge.set_variant(Badge.VARIANT_DESTRUCTIVE)
+    
+    assert badge.variant == Badge.VARIANT_DESTRUCTIVE
+    assert badge.property("variant") == Badge.VARIANT_DESTRUCTIVE
+
+
+def test_unknown_variant_rejected(qapp):
+    with pytest.raises(ValueError):
+        Badge("New", variant="loud")
+    
+    badge = Badge("New")
+    with pytest.raises(ValueError):
+        badge.set_variant("loud")
+    assert badge.variant == Badge.VARIANT_DEFAULT
+
+
+def test_unknown_size_rejected(qapp):
+    with pytest.raises(ValueError):
+        Badge("New", size="xl")
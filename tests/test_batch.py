@@ -0,0 +1,68 @@
+"""
+Tests for batched property updates.
+"""
+
+from PySide6.QtWidgets import QProxyStyle, QWidget
+
+from pyside6_shadcn_widgets.components import Input
+
+
+class _PolishCounter(QProxyStyle):
+    """Style counting widget polish calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+    
+    def polish(self, arg):
+        if isinstance(arg, QWidget):
+            self.count += 1
+        return super().polish(arg)
+
+
+def _shown_input(qapp):
+    input_field = Input()
+    style = _PolishCounter()
+    input_field.setStyle(style)
+    input_field.show()
+    qapp.processEvents()
+    style.count = 0
+    return input_field, style
+
+
+def test_batch_update_repolishes_once(qapp):
+    input_field, style = _shown_input(qapp)
+    
+    with input_field.batch_update():
+        input_field.set_error(True)
+        input_field.set_error(False)
+        input_field.set_error(True)
+        assert style.count == 0
+        assert not input_field.updatesEnabled()
+    
+    assert style.count == 1
+    assert input_field.updatesEnabled()
+    assert input_field.property("error") is True
+
+
+def test_nested_batch_update_applies_at_outermost_exit(qapp):
+    input_field, style = _shown_input(qapp)
+    
+    with input_field.batch_update():
+        with input_field.batch_update():
+            input_field.set_error(True)
+        assert style.count == 0
+        assert not input_field.updatesEnabled()
+    
+    assert style.count == 1
+    assert input_field.updatesEnabled()
+
+
+def test_batch_update_restores_disabled_updates(qapp):
+    input_field, _ = _shown_input(qapp)
+    input_field.setUpdatesEnabled(False)
+    
+    with input_field.batch_update():
+        input_field.set_error(True)
+    
+    assert not input_field.updatesEnabled()
@@ -0,0 +1,55 @@
+"""
+Tests for the Card component and CardContainer.
+"""
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+from pyside6_shadcn_widgets.components import Card, CardContainer
+
+
+def test_card_keeps_its_size_and_draws_shadow_beside_it(qapp):
+    window = QWidget()
+    card = Card()
+    card.setFixedSize(400, 200)
+    QVBoxLayout(window).addWidget(card)
+    window.show()
+    QTest.qWait(0)
+    
+    assert card.size().width() == 400
+    assert card.shadow is not None
+    assert card.shadow.parentWidget() is window
+    assert card.shadow.geometry().contains(card.geometry())
+
+
+def test_container_paints_shadows_for_its_cards(qapp):
+    container = CardContainer()
+    cards = [Card() for _ in range(3)]
+    for card in cards:
+        container.add_card(card)
+    container.show()
+    QTest.qWait(0)
+    
+    assert container.cards_layout.count() == 3
+    for card in cards:
+        assert card.parentWidget() is container
+        assert card.shadow is None
+    
+    # Paints every card's shadow from the container
+    assert not container.grab().isNull()
+
+
+def test_container_removes_existing_card_shadow(qapp):
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    card = Card()
+    layout.addWidget(card)
+    window.show()
+    QTest.qWait(0)
+    assert card.shadow is not None
+    
+    container = CardContainer()
+    layout.addWidget(container)
+    container.add_card(card)
+    
+    assert card.shadow is None
@@ -0,0 +1,74 @@
+"""
+Tests for the color utilities.
+"""
+
+import colorsys
+import itertools
+
+import pytest
+
+from pyside6_shadcn_widgets.themes import DarkTheme, LightTheme, Theme
+from pyside6_shadcn_widgets.utils import (
+    adjust_alpha,
+    adjust_alpha_rgb,
+    hex_to_rgb,
+    hsl_to_hex,
+    hsl_to_rgb,
+    rgb_to_hex,
+)
+
+
+def _colorsys_rgb(h, s, l):
+    """Reference conversion, as hsl_to_rgb did it through colorsys."""
+    r, g, b = colorsys.hls_to_rgb(h / 360.0, l / 100.0, s / 100.0)
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+@pytest.mark.parametrize("theme_cls", [Theme, LightTheme, DarkTheme])
+def test_theme_palettes_match_colorsys(theme_cls):
+    for name, hsl in theme_cls.COLORS.items():
+        assert hsl_to_hex(*hsl) == rgb_to_hex(*_colorsys_rgb(*hsl)), name
+
+
+def test_hsl_to_rgb_within_one_of_colorsys():
+    for h, s, l in itertools.product(range(0, 361, 15), range(0, 101, 10),
+                                     range(0, 101, 5)):
+        expected = _colorsys_rgb(h, s, l)
+        actual = hsl_to_rgb(h, s, l)
+        assert all(abs(a - e) <= 1 for a, e in zip(actual, expected)), (h, s, l)
+
+
+def test_hsl_to_rgb_negative_hue():
+    # (h / 60) % 6 rounds to exactly 6.0 for tiny negative hues
+    assert hsl_to_rgb(-1e-17, 50, 50) == hsl_to_rgb(0, 50, 50)
+    for h in (-30, -90.5, -359.9, -720):
+        assert hsl_to_rgb(h, 60, 40) == hsl_to_rgb(h % 360, 60, 40), h
+        expected = _colorsys_rgb(h, 60, 40)
+        assert all(abs(a - e) <= 1 for a, e in
+                   zip(hsl_to_rgb(h, 60, 40), expected)), h
+
+
+def test_hsl_to_rgb_hue_wraps_around():
+    for h in (360, 390, 540.5, 720):
+        assert hsl_to_rgb(h, 60, 40) == hsl_to_rgb(h % 360, 60, 40), h
+        expected = _colorsys_rgb(h, 60, 40)
+        assert all(abs(a - e) <= 1 for a, e in
+                   zip(hsl_to_rgb(h, 60, 40), expected)), h
+
+
+def test_hsl_to_rgb_known_values():
+    assert hsl_to_rgb(0, 0, 100) == (255, 255, 255)
+    assert hsl_to_rgb(0, 0, 0) == (0, 0, 0)
+    assert hsl_to_rgb(222.2, 84, 4.9) == (1, 8, 22)
+
+
+def test_hex_round_trip():
+    assert rgb_to_hex(255, 87, 51) == "#ff5733"
+    assert hex_to_rgb("#ff5733") == (255, 87, 51)
+    assert hex_to_rgb("ff5733") == (255, 87, 51)
+
+
+def test_adjust_alpha():
+    assert adjust_alpha("#ff5733", 0.5) == "rgba(255, 87, 51, 0.5)"
+    assert adjust_alpha_rgb(255, 87, 51, 0.5) == "rgba(255, 87, 51, 0.5)"
+    assert adjust_alpha_rgb(*hex_to_rgb("#000000"), 0) == "rgba(0, 0, 0, 0)"
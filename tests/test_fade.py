@@ -0,0 +1,55 @@
+"""
+Tests for the fade animations.
+"""
+
+import shiboken6
+from PySide6.QtCore import QAbstractAnimation, QParallelAnimationGroup
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QWidget
+
+from pyside6_shadcn_widgets.animations import FadeIn, FadeOut
+
+
+def test_fades_reuse_installed_opacity_effect(qapp):
+    widget = QWidget()
+    fade_in = FadeIn(widget)
+    fade_out = FadeOut(widget)
+    
+    assert fade_out.opacity_effect is fade_in.opacity_effect
+    assert widget.graphicsEffect() is fade_in.opacity_effect
+
+
+def test_each_fade_owns_its_animation(qapp):
+    widget = QWidget()
+    
+    assert FadeIn(widget).get_animation() is not FadeIn(widget).get_animation()
+
+
+def test_fade_after_animation_deleted_when_stopped(qapp):
+    widget = QWidget()
+    widget.show()
+    
+    first = FadeIn(widget, duration=20).get_animation()
+    first.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+    QTest.qWait(100)
+    assert not shiboken6.isValid(first)
+    
+    fade = FadeIn(widget, duration=20)
+    fade.start()
+    QTest.qWait(100)
+    assert fade.get_animation().state() == QAbstractAnimation.State.Stopped
+    assert fade.opacity_effect.opacity() == 1.0
+
+
+def test_fade_after_owning_group_deleted(qapp):
+    widget = QWidget()
+    widget.show()
+    
+    group = QParallelAnimationGroup()
+    group.addAnimation(FadeOut(widget, duration=20).get_animation())
+    shiboken6.delete(group)
+    
+    fade = FadeOut(widget, duration=20)
+    fade.start()
+    QTest.qWait(100)
+    assert fade.opacity_effect.opacity() == 0.0
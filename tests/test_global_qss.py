@@ -0,0 +1,39 @@
+"""
+Tests for the application-wide component stylesheets.
+"""
+
+from pyside6_shadcn_widgets import Button, install_component_styles
+from pyside6_shadcn_widgets.components.button import BUTTON_QSS
+from pyside6_shadcn_widgets.themes import DarkTheme, LightTheme
+
+
+def test_install_component_styles_restores_rules(qapp):
+    LightTheme().apply(qapp)
+    Button("Save")
+    
+    qapp.setStyleSheet("QToolTip { border: none; }")
+    assert BUTTON_QSS not in qapp.styleSheet()
+    
+    install_component_styles(qapp)
+    sheet = qapp.styleSheet()
+    assert sheet.startswith("QToolTip { border: none; }")
+    assert BUTTON_QSS in sheet
+    
+    # Installing again leaves the stylesheet as it is
+    install_component_styles(qapp)
+    assert qapp.styleSheet() == sheet
+
+
+def test_theme_apply_sets_stylesheet_once(qapp, monkeypatch):
+    Button("Save")
+    calls = []
+    set_style_sheet = qapp.setStyleSheet
+    monkeypatch.setattr(qapp, "setStyleSheet",
+                        lambda sheet: (calls.append(sheet), set_style_sheet(sheet)))
+    
+    theme = DarkTheme()
+    theme.apply(qapp)
+    
+    assert len(calls) == 1
+    assert calls[0].startswith(theme.qss)
+    assert BUTTON_QSS in calls[0]
@@ -0,0 +1,51 @@
+"""
+Tests for the Progress component.
+"""
+
+from PySide6.QtCore import QAbstractAnimation
+from PySide6.QtTest import QTest
+
+from pyside6_shadcn_widgets.components import Progress
+
+
+def test_set_value_updates_value_immediately(qapp):
+    progress = Progress()
+    emitted = []
+    progress.valueChanged.connect(emitted.append)
+    
+    progress.setValue(40)
+    
+    assert progress.value() == 40
+    assert emitted == [40]
+
+
+def test_set_value_animates_drawn_value_only(qapp):
+    progress = Progress()
+    progress.show()
+    emitted = []
+    progress.valueChanged.connect(emitted.append)
+    
+    progress.setValue(30)
+    progress.setValue(60)
+    QTest.qWait(0)
+    
+    animation = progress.value_animation
+    assert animation.state() == QAbstractAnimation.State.Running
+    assert animation.endValue() == 60
+    
+    QTest.qWait(animation.duration() + 100)
+    assert progress._display_value == 60
+    assert emitted == [30, 60]
+
+
+def test_indeterminate_ignores_set_value(qapp):
+    progress = Progress()
+    progress.set_indeterminate(True)
+    
+    progress.setValue(50)
+    
+    assert progress.is_indeterminate()
+    assert progress.maximum() == 0
+    
+    progress.set_indeterminate(False)
+    assert progress.value() == 0
@@ -0,0 +1,31 @@
+"""
+Tests for the Select component.
+"""
+
+from PySide6.QtWidgets import QListView, QTreeView
+
+from pyside6_shadcn_widgets.components import Select
+
+
+def test_view_is_styled_list(qapp):
+    select = Select()
+    select.addItems(["One", "Two"])
+    select.setCurrentIndex(1)
+    
+    view = select.view()
+    
+    assert isinstance(view, QListView)
+    assert view.property("selectPart") == "list"
+    assert view.currentIndex().row() == 1
+
+
+def test_custom_view_is_kept(qapp):
+    select = Select()
+    select.addItems(["One", "Two"])
+    custom = QTreeView()
+    
+    select.setView(custom)
+    select.showPopup()
+    select.hidePopup()
+    
+    assert select.view() is custom
@@ -0,0 +1,47 @@
+"""
+Tests for the Tabs component.
+"""
+
+from PySide6.QtCore import QAbstractAnimation
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QWidget
+
+from pyside6_shadcn_widgets.components import Tabs
+
+
+def test_batch_add_adds_tabs_in_order(qapp):
+    tabs = Tabs()
+    pages = [QWidget() for _ in range(3)]
+    
+    tabs.batch_add(zip(pages, ["General", "Advanced", "Billing"]))
+    
+    assert tabs.count() == 3
+    assert [tabs.tabText(i) for i in range(3)] == ["General", "Advanced", "Billing"]
+    assert [tabs.widget(i) for i in range(3)] == pages
+    assert tabs.updatesEnabled()
+
+
+def test_batch_add_places_indicator_without_animating(qapp):
+    tabs = Tabs()
+    tabs.show()
+    
+    tabs.batch_add((QWidget(), label) for label in ("One", "Two", "Three"))
+    
+    assert tabs.indicator_animation.state() == QAbstractAnimation.State.Stopped
+    rect = tabs.tabBar().tabRect(tabs.currentIndex())
+    assert tabs._indicator_rect.x() == rect.x()
+    assert tabs._indicator_rect.width() == rect.width()
+
+
+def test_indicator_follows_current_tab(qapp):
+    tabs = Tabs()
+    tabs.batch_add((QWidget(), f"Tab {i}") for i in range(4))
+    tabs.show()
+    QTest.qWait(0)
+    
+    tabs.setCurrentIndex(2)
+    QTest.qWait(tabs.indicator_animation.duration() + 100)
+    
+    rect = tabs.tabBar().tabRect(2)
+    assert tabs._indicator_rect.x() == rect.x()
+    assert tabs._indicator_rect.width() == rect.width()
@@ -0,0 +1,85 @@
+"""
+Tests for the Theme classes.
+"""
+
+import pytest
+
+from pyside6_shadcn_widgets.themes import DarkTheme, LightTheme
+
+
+def test_stylesheet_follows_direct_edits():
+    theme = LightTheme()
+    before = theme.qss
+    
+    theme.colors["primary"] = (0, 100, 50)
+    assert "#ff0000" in theme.qss
+    
+    theme.radius["md"] = 3
+    assert "border-radius: 3px" in theme.get_stylesheet()
+    
+    theme.colors = dict(LightTheme.COLORS)
+    theme.radius = dict(LightTheme.RADIUS)
+    assert theme.qss == before
+
+
+def test_stylesheet_follows_set_color():
+    theme = DarkTheme()
+    theme.get_stylesheet()
+    
+    theme.set_color("primary", (0, 100, 50))
+    
+    assert theme.get_color("primary") == "#ff0000"
+    assert "#ff0000" in theme.qss
+
+
+def test_default_themes_share_stylesheet():
+    assert LightTheme().qss is LightTheme().qss
+    assert LightTheme().qss != DarkTheme().qss
+
+
+def test_interpolate_end_points():
+    light = LightTheme()
+    dark = DarkTheme()
+    
+    # Compared as hex, grays may take the other theme's hue
+    start = light.interpolate(dark, 0.0)
+    end = light.interpolate(dark, 1.0)
+    for name in light.colors:
+        assert start.get_color(name) == light.get_color(name), name
+        assert end.get_color(name) == dark.get_color(name), name
+
+
+def test_interpolate_midpoint():
+    light = LightTheme()
+    dark = DarkTheme()
+    light.set_color("primary", (200, 40, 20))
+    dark.set_color("primary", (220, 60, 60))
+    
+    h, s, l = light.interpolate(dark, 0.5).colors["primary"]
+    
+    assert (h, s, l) == pytest.approx((210, 50, 40))
+
+
+def test_interpolate_gray_keeps_other_hue():
+    light = LightTheme()
+    dark = DarkTheme()
+    light.set_color("background", (0, 0, 100))
+    dark.set_color("background", (222, 80, 5))
+    
+    h, _, _ = light.interpolate(dark, 0.25).colors["background"]
+    
+    assert h == pytest.approx(222)
+
+
+def test_interpolate_keeps_own_settings():
+    light = LightTheme()
+    light.radius["md"] = 3
+    dark = DarkTheme()
+    del dark.colors["ring"]
+    
+    blended = light.interpolate(dark, 0.5)
+    
+    assert type(blended) is LightTheme
+    assert blended.colors["ring"] == light.colors["ring"]
+    assert blended.radius == light.radius
+    assert blended.radius is not light.radius